@@ -0,0 +1,84 @@
+"""
+compare_benchmarks.py
+두 벤치마크 결과(JSON)를 비교해 느려진 항목을 찾는다.
+- 항목마다 중앙값 비율(현재 / 기준선)을 구하고, threshold(기본 20 %)보다 느려졌으면서
+  차이가 noise_ms(기본 0.05 ms) 이상이면 회귀로 본다.
+- 기준선에만 있는 항목(missing)과 현재에만 있는 항목(new)은 따로 보고하며 회귀로 치지 않는다.
+- 회귀가 있으면 종료 코드 1을 반환한다 (CI에서 그대로 쓸 수 있다).
+
+사용: python benchmarks/compare_benchmarks.py baseline.json current.json [--threshold 0.2] [--noise-ms 0.05]
+"""
+import argparse
+import json
+import sys
+
+from run_benchmarks import BENCHMARK_VERSION
+
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_NOISE_MS = 0.05
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != BENCHMARK_VERSION:
+        raise ValueError(f"Unsupported benchmark result version {data.get('version')} in {path}")
+    return data
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, noise_ms=DEFAULT_NOISE_MS):
+    """
+    반환: {"rows": [{"name", "baseline_ms", "current_ms", "ratio", "status"}], "regressions": [이름], "missing", "new"}
+    status: regression / improved / ok
+    """
+    base, cur = baseline["results"], current["results"]
+    rows, regressions = [], []
+    for name in base:
+        if name not in cur:
+            continue
+        before, after = base[name]["median_ms"], cur[name]["median_ms"]
+        ratio = after / before if before > 0 else float("inf")
+        status = "ok"
+        if ratio > 1 + threshold and after - before >= noise_ms:
+            status = "regression"
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold) and before - after >= noise_ms:
+            status = "improved"
+        rows.append({"name": name, "baseline_ms": before, "current_ms": after, "ratio": round(ratio, 3),
+                     "status": status})
+    return {"rows": rows, "regressions": regressions,
+            "missing": [name for name in base if name not in cur], "new": [name for name in cur if name not in base]}
+
+
+def format_report(diff):
+    lines = [f"{'benchmark':<34} {'baseline':>12} {'current':>12} {'ratio':>7}  status"]
+    for row in diff["rows"]:
+        lines.append(f"{row['name']:<34} {row['baseline_ms']:>10.3f}ms {row['current_ms']:>10.3f}ms "
+                     f"{row['ratio']:>7.2f}  {row['status']}")
+    for key in ("missing", "new"):
+        if diff[key]:
+            lines.append(f"{key}: {', '.join(diff[key])}")
+    lines.append(f"{len(diff['regressions'])} regression(s)")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline median (default 0.2)")
+    parser.add_argument("--noise-ms", type=float, default=DEFAULT_NOISE_MS,
+                        help="ignore differences smaller than this many milliseconds")
+    args = parser.parse_args(argv)
+
+    baseline, current = load(args.baseline), load(args.current)
+    if baseline.get("machine") != current.get("machine"):
+        print("warning: results come from different machines/environments", file=sys.stderr)
+    diff = compare(baseline, current, args.threshold, args.noise_ms)
+    print(format_report(diff))
+    return 1 if diff["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
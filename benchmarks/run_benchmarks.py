@@ -0,0 +1,201 @@
+"""
+run_benchmarks.py
+해석기 / 보고서 빌더 / CLI 성능 벤치마크. 결과를 JSON으로 저장해 compare_benchmarks.py로 기준선과 비교한다.
+- analyzer.analyze[기준]        : RCSectionAnalyzer 생성 + analyze() (행당, 매번 강도 캐시를 비운 상태)
+- analyzer.analyze_cached[기준] : 같은 행을 다시 해석 (행당, 강도 캐시 적중)
+- text.generate[기준]           : 설계법별 TextBuilder.generate() (행당, 해석 제외)
+- excel.add_to_workbook[기준]   : 설계법별 ExcelBuilder.add_to_workbook() (행당, 해석 제외)
+- export[N]                     : export 모드 전체 (N = 10 / 100 / 1000 행, xlsx 바이트 생성까지)
+- cli.cold                      : rc_beam_calc.py 프로세스 1회 실행 (calc 1행, 인터프리터 시작 포함)
+- cli.warm                      : --worker 프로세스에 보내는 calc 요청 1건의 왕복 시간
+각 항목은 repeat번 재서 중앙값/최소/평균(ms)을 기록한다. 행당 항목은 합성 행 rows개를 한 번에 돌린 시간을 행 수로 나눈다.
+
+사용: python benchmarks/run_benchmarks.py [--out results.json] [--quick] [--only 이름 접두어] [--repeat N]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = os.path.join(ROOT, "scripts")
+SCRIPT = os.path.join(SCRIPTS, "rc_beam_calc.py")
+sys.path.append(SCRIPTS)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_rows import MATERIAL, STANDARDS, STANDARD_KEYS, synthetic_rows  # noqa: E402
+
+# 결과 형식이 바뀌면 올린다 (compare_benchmarks.py가 확인한다)
+BENCHMARK_VERSION = 2
+
+DEFAULT_REPEAT = 5
+PER_ROW_ROWS = 50
+EXPORT_SIZES = (10, 100, 1000)
+EXPORT_STANDARD = STANDARDS[1]
+# --quick: 스모크 확인용 축소 설정
+QUICK = {"repeat": 2, "rows": 5, "export_sizes": (10,)}
+
+
+def measure(func, repeat, per=1):
+    """func()를 repeat번 실행한 시간(ms, per로 나눔)의 통계."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e3 / per)
+    return {"median_ms": round(statistics.median(times), 4), "min_ms": round(min(times), 4),
+            "mean_ms": round(statistics.fmean(times), 4), "repeat": repeat, "per": per}
+
+
+def _material():
+    return {"f_ck": MATERIAL["fck"], "f_y": MATERIAL["fy"], "phi_f": 0.85, "phi_v": 0.8}
+
+
+def _analyze(std, row):
+    from core.rc_section_analyzer import RCSectionAnalyzer
+    mat = _material()
+    analyzer = RCSectionAnalyzer(mat["f_ck"], mat["f_y"], std, row["H"], row["B"], row, row,
+                                 phi_f=mat["phi_f"], phi_v=mat["phi_v"])
+    return analyzer.analyze()
+
+
+def bench_analyzer(repeat, rows):
+    from core.rc_section_analyzer import clear_capacity_cache
+
+    def analyze_all(std, cold):
+        if cold:
+            clear_capacity_cache()
+        return [_analyze(std, row) for row in rows]
+
+    for std, key in zip(STANDARDS, STANDARD_KEYS):
+        _analyze(std, rows[0])  # 설계기준 모듈 로딩 제외
+        yield f"analyzer.analyze[{key}]", measure(lambda: analyze_all(std, True), repeat, len(rows))
+        analyze_all(std, False)  # 캐시 채우기
+        yield f"analyzer.analyze_cached[{key}]", measure(lambda: analyze_all(std, False), repeat, len(rows))
+
+
+def bench_text(repeat, rows):
+    from reports.text import get_text_builder
+    for std, key in zip(STANDARDS, STANDARD_KEYS):
+        builders = [get_text_builder(_analyze(std, row)) for row in rows]
+        yield f"text.generate[{key}]", measure(lambda: [b.generate() for b in builders], repeat, len(rows))
+
+
+def bench_excel(repeat, rows):
+    import openpyxl
+    from reports.excel import get_excel_builder
+    for std, key in zip(STANDARDS, STANDARD_KEYS):
+        builders = [get_excel_builder(_analyze(std, row)) for row in rows]
+
+        def add_all():
+            wb = openpyxl.Workbook()
+            for i, builder in enumerate(builders):
+                builder.add_to_workbook(wb, f"S{i + 1}")
+
+        add_all()  # 템플릿 캐시 준비
+        yield f"excel.add_to_workbook[{key}]", measure(add_all, repeat, len(builders))
+
+
+def bench_export(repeat, sizes):
+    from rc_beam_calc import build_export_workbook
+    for n in sizes:
+        request = {"mode": "export", "design_standard": EXPORT_STANDARD, "material": MATERIAL,
+                   "rows": synthetic_rows(n, seed=n), "export_workers": 1}
+        yield f"export[{n}]", measure(lambda: build_export_workbook(request), max(1, repeat if n < 1000 else 1))
+
+
+def _calc_request(i=0):
+    return {"id": i, "mode": "calc", "design_standard": STANDARDS[0], "material": MATERIAL, "cache": False,
+            "rows": synthetic_rows(1, seed=i)}
+
+
+def bench_cli(repeat):
+    payload = json.dumps(_calc_request(), ensure_ascii=False)
+
+    def cold():
+        process = subprocess.run([sys.executable, SCRIPT], input=payload, capture_output=True, text=True,
+                                 encoding="utf-8", check=True)
+        assert "error" not in json.loads(process.stdout)[0]
+
+    cold()  # 파일 시스템 캐시 준비
+    yield "cli.cold", measure(cold, repeat)
+
+    worker = subprocess.Popen([sys.executable, SCRIPT, "--worker"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                              text=True, encoding="utf-8")
+    try:
+        counter = iter(range(1, 1 << 30))
+
+        def warm():
+            worker.stdin.write(json.dumps(_calc_request(next(counter)), ensure_ascii=False) + "\n")
+            worker.stdin.flush()
+            assert json.loads(worker.stdout.readline())["ok"]
+
+        warm()
+        yield "cli.warm", measure(warm, repeat * 4)
+    finally:
+        worker.stdin.close()
+        worker.wait()
+
+
+def run(repeat=DEFAULT_REPEAT, rows=PER_ROW_ROWS, export_sizes=EXPORT_SIZES, only=None, seed=0):
+    """벤치마크를 실행해 결과 dict(JSON으로 저장할 형식)를 반환한다. only: 이름 접두어 목록."""
+    sample = synthetic_rows(rows, seed=seed)
+    groups = [
+        ("analyzer", lambda: bench_analyzer(repeat, sample)),
+        ("text", lambda: bench_text(repeat, sample)),
+        ("excel", lambda: bench_excel(repeat, sample)),
+        ("export", lambda: bench_export(repeat, export_sizes)),
+        ("cli", lambda: bench_cli(repeat)),
+    ]
+    results = {}
+    for prefix, bench in groups:
+        if only and not any(p.startswith(prefix) or prefix.startswith(p) for p in only):
+            continue
+        for name, stats in bench():
+            if only and not any(name.startswith(p) for p in only):
+                continue
+            results[name] = stats
+            print(f"{name:<34} {stats['median_ms']:>10.3f} ms", file=sys.stderr)
+
+    import numpy
+    return {
+        "version": BENCHMARK_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "processor": platform.processor(), "cpu_count": os.cpu_count(), "numpy": numpy.__version__},
+        "config": {"repeat": repeat, "rows": rows, "export_sizes": list(export_sizes), "seed": seed},
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the rc_beam_calc benchmark suite")
+    parser.add_argument("--out", help="write results to this JSON file (default: stdout)")
+    parser.add_argument("--repeat", type=int, default=None)
+    parser.add_argument("--rows", type=int, default=None, help="synthetic rows for per-row benchmarks")
+    parser.add_argument("--quick", action="store_true", help="small smoke-test configuration")
+    parser.add_argument("--only", action="append", help="benchmark name prefix (repeatable), e.g. 'text.'")
+    args = parser.parse_args(argv)
+
+    config = dict(QUICK) if args.quick else {"repeat": DEFAULT_REPEAT, "rows": PER_ROW_ROWS,
+                                             "export_sizes": EXPORT_SIZES}
+    if args.repeat:
+        config["repeat"] = args.repeat
+    if args.rows:
+        config["rows"] = args.rows
+    data = run(only=args.only, **config)
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+data_paths.py
+요청(JSON)으로 받은 파일 위치를 서버가 정한 디렉터리 안으로 제한한다.
+- 요청 본문은 HTTP 라우트에서 그대로 worker로 오므로, 요청의 경로를 파일 시스템 경로로 바로 열지 않는다.
+- 업로드 루트(RC_BEAM_UPLOAD_ROOT, 기본 <프로젝트>/data/uploads): import_forces의 원본 부재력 파일 "path"
+  상대 경로는 이 루트 기준이며, 심볼릭 링크를 풀어 루트 밖을 가리키면 ValueError.
+- 저장소 루트(RC_BEAM_STORE_ROOT, 기본 <프로젝트>/data/stores): 부재력 저장소("store")는 경로가 아니라
+  프로젝트 id(영문/숫자/-/_)로 받고, 루트 아래 같은 이름의 디렉터리에 둔다.
+- 출력 루트(RC_BEAM_OUTPUT_ROOT, 기본 <프로젝트>/data/outputs): sweep 결과 파일 "out_path"는 이 루트 기준
+  상대 경로로만 쓴다 (루트 밖이면 ValueError). 없는 하위 디렉터리는 만든다.
+"""
+import os
+import re
+
+UPLOAD_ROOT_ENV = "RC_BEAM_UPLOAD_ROOT"
+STORE_ROOT_ENV = "RC_BEAM_STORE_ROOT"
+OUTPUT_ROOT_ENV = "RC_BEAM_OUTPUT_ROOT"
+
+PROJECT_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,63}")
+
+# 환경변수가 없을 때의 기본 위치: <프로젝트>/data/<이름>
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data")
+
+
+def _root(env, name):
+    return os.path.realpath(os.environ.get(env) or os.path.join(DEFAULT_DATA_DIR, name))
+
+
+def _confine(root, path, what):
+    full = os.path.realpath(os.path.join(root, os.fspath(path)))
+    if os.path.commonpath([root, full]) != root:
+        raise ValueError(f"{what} must be inside the configured {what} directory")
+    return full
+
+
+def upload_root():
+    return _root(UPLOAD_ROOT_ENV, "uploads")
+
+
+def resolve_upload(path):
+    """요청의 입력 파일 경로 → 업로드 루트 안의 실제 경로."""
+    return _confine(upload_root(), path, "upload")
+
+
+def store_root():
+    return _root(STORE_ROOT_ENV, "stores")
+
+
+def store_dir(project):
+    """프로젝트 id → 저장소 루트 아래의 부재력 저장소 디렉터리."""
+    if not isinstance(project, str) or not PROJECT_ID.fullmatch(project):
+        raise ValueError("store must be a project id (letters, digits, '-' and '_', up to 64 characters)")
+    return os.path.join(store_root(), project)
+
+
+def output_root():
+    return _root(OUTPUT_ROOT_ENV, "outputs")
+
+
+def resolve_output(path):
+    """요청의 출력 파일 경로 → 출력 루트 안의 실제 경로 (상위 디렉터리는 만들어 둔다)."""
+    full = _confine(output_root(), path, "output")
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    return full
@@ -0,0 +1,225 @@
+"""
+fiber_section.py
+섬유(fiber) 단면 변형률 적합 해석 — 등가 직사각형 응력블록 대신 포물선-직사각형 콘크리트 응력-변형률 관계와
+이선형(bilinear) 철근 모델을 적분하여 극한 휨강도를 구한다.
+- 직사각형 단면 B×H, 철근은 임의 개수의 층(압축연단에서의 깊이, 단면적)으로 받는다 — 압축철근 포함.
+- 축력 N(압축 +)과의 힘의 평형으로 중립축 깊이 c를 구한다. 여러 단면을 (단면 수, 섬유/철근층 수) 배열로
+  한꺼번에 풀며, 구간(bracket)을 유지하는 Newton 반복(구간을 벗어나면 이분법)을 쓴다.
+- 변형률 분포: c ≤ H 이면 압축연단 εcu 고정, c > H (전단면 압축)이면 깊이 (1 - εco/εcu)·H 에서 εco 고정
+  (KDS 14 20 20 / EC2 6.1 변형률 한계). c에 대해 연속이므로 평형 잔차가 c에 대해 단조 증가한다.
+- 콘크리트 섬유는 압축 구간 [0, min(c, H)]를 FIBER_COUNT개로 나눈 중점이다 — 섬유가 중립축 위치를
+  따라가므로 적은 섬유 수로도 응력 분포를 정확히 적분하고, c < H 에서는 섬유 변형률이 c와 무관해
+  반복마다 다시 적분하지 않는다. 인장 콘크리트는 무시한다.
+- 압축 구간 안의 철근은 밀어낸 콘크리트 응력만큼 뺀다.
+- 모멘트는 단면 중심(H/2)에 대한 값이다 (축력이 있을 때 Mu와 같은 기준). 단위: N, mm, N·mm.
+"""
+import numpy as np
+
+# 압축 구간을 나누는 콘크리트 섬유 수 (중점 적분)
+FIBER_COUNT = 64
+# 평형 잔차 허용치 (단면 강도 f_c·B·H + ΣAs·f_yd 대비 비율)
+FORCE_TOLERANCE = 1e-9
+MAX_ITERATIONS = 100
+# 중립축 탐색 구간 (H 배수) — 상한에서는 전단면이 거의 εco로 균일하게 압축된다
+C_MIN_RATIO = 1e-6
+C_MAX_RATIO = 1e4
+
+_MIDPOINTS = (np.arange(FIBER_COUNT) + 0.5) / FIBER_COUNT
+
+
+def concrete_stress(eps, f_c, n_eps, eps_co):
+    """포물선-직사각형: (응력, 접선강성). 압축 +, 인장 구간은 0."""
+    ratio = np.clip(1.0 - eps / eps_co, 0.0, 1.0)
+    stress = np.where(eps > 0, f_c * (1.0 - ratio ** n_eps), 0.0)
+    tangent = np.where((eps > 0) & (eps < eps_co), f_c * n_eps / eps_co * ratio ** (n_eps - 1), 0.0)
+    return stress, tangent
+
+
+def steel_stress(eps, f_yd, E_s):
+    """이선형 (탄성-완전소성): (응력, 접선강성). 압축 +."""
+    eps_yd = f_yd / E_s
+    return np.clip(E_s * eps, -f_yd, f_yd), np.where(np.abs(eps) < eps_yd, E_s, 0.0)
+
+
+class FiberSection:
+    """
+    여러 직사각형 단면의 섬유 모델. 스칼라 입력은 단면 수 n에 맞춰 펼친다.
+    layer_depth, layer_area: (n, 층 수) — 압축연단에서의 깊이(mm), 단면적(mm²). 면적 0인 층은 무시된다.
+    f_c: 콘크리트 응력-변형률 곡선의 최대 응력 (설계값), f_yd: 철근 설계 항복강도.
+    """
+
+    def __init__(self, H, B, f_c, n_eps, eps_co, eps_cu, f_yd, E_s, layer_depth, layer_area):
+        layer_depth = np.atleast_2d(np.asarray(layer_depth, dtype=float))
+        layer_area = np.atleast_2d(np.asarray(layer_area, dtype=float))
+        n = max(np.size(H), np.size(B), np.size(f_c), np.size(f_yd), layer_depth.shape[0])
+        self.n = n
+
+        def full(value):
+            return np.array(np.broadcast_to(np.asarray(value, dtype=float), (n,)))
+
+        self.H, self.B = full(H), full(B)
+        self.f_c, self.n_eps, self.eps_co, self.eps_cu = full(f_c), full(n_eps), full(eps_co), full(eps_cu)
+        self.f_yd, self.E_s = full(f_yd), full(E_s)
+        self.layer_depth = np.array(np.broadcast_to(layer_depth, (n, layer_depth.shape[1])))
+        self.layer_area = np.array(np.broadcast_to(layer_area, (n, layer_area.shape[1])))
+        # c > H 에서 변형률 εco가 고정되는 깊이
+        self.y_pivot = (1.0 - self.eps_co / self.eps_cu) * self.H
+        # c < H 일 때의 단위 섬유 분포: 압축력 = B·c·_unit_force, 압축연단에서 합력 위치 = c·_unit_arm
+        sigma, _ = concrete_stress(self.eps_cu[:, None] * (1.0 - _MIDPOINTS[None, :]), self.f_c[:, None],
+                                   self.n_eps[:, None], self.eps_co[:, None])
+        self._unit_force = sigma.mean(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            arm = (sigma * _MIDPOINTS).mean(axis=1) / self._unit_force
+        self._unit_arm = np.where(self._unit_force > 0, arm, 0.0)
+
+    def _strain(self, c, y, index=slice(None)):
+        """깊이 y(단면, k)의 변형률(압축 +)과 dε/dc. index: c, y가 일부 단면만일 때 그 단면 번호."""
+        c = c[:, None]
+        H, y_p = self.H[index, None], self.y_pivot[index, None]
+        eps_cu, eps_co = self.eps_cu[index, None], self.eps_co[index, None]
+        pivot = c > H
+        with np.errstate(divide='ignore', invalid='ignore'):
+            arm = np.where(pivot, c - y_p, c)
+            top = np.where(pivot, eps_co, eps_cu)
+            eps = top * (c - y) / arm
+            deps = np.where(pivot, eps_co * (y - y_p), eps_cu * y) / arm ** 2
+        return eps, deps
+
+    def _concrete(self, c):
+        """
+        콘크리트 압축력, 압축연단에 대한 모멘트, d(압축력)/dc.
+        c < H 이면 섬유 깊이가 c에 비례하므로 섬유 변형률 εcu·(1 - t)는 c와 무관하다 — __init__에서 한 번 적분한
+        단위 섬유 분포(_unit_force, _unit_arm)에 c를 곱하기만 한다. 전단면 압축(c ≥ H)인 단면만 섬유를 다시 적분한다.
+        """
+        force = self.B * c * self._unit_force
+        moment = force * c * self._unit_arm
+        slope = self.B * self._unit_force
+        pivot = np.flatnonzero(c >= self.H)
+        if pivot.size:
+            sub = c[pivot]
+            H = self.H[pivot]
+            y = H[:, None] * _MIDPOINTS[None, :]
+            eps, deps = self._strain(sub, y, pivot)
+            sigma, tangent = concrete_stress(eps, self.f_c[pivot, None], self.n_eps[pivot, None],
+                                             self.eps_co[pivot, None])
+            area = (self.B[pivot] * H / FIBER_COUNT)[:, None]
+            force[pivot] = np.sum(sigma * area, axis=1)
+            moment[pivot] = np.sum(sigma * area * y, axis=1)
+            slope[pivot] = np.sum(tangent * deps * area, axis=1)
+        return force, moment, slope
+
+    def forces(self, c):
+        """
+        중립축 깊이 c(n,)에서의 단면력.
+        반환: (축력 N, dN/dc, 콘크리트 압축력, 콘크리트 압축력의 압축연단 모멘트, 철근층 힘 (n, 층 수), 철근층 변형률)
+        """
+        concrete, concrete_moment, dN = self._concrete(c)
+
+        eps_s, deps_s = self._strain(c, self.layer_depth)
+        sigma_s, tangent_s = steel_stress(eps_s, self.f_yd[:, None], self.E_s[:, None])
+        # 압축 구간 안의 철근이 밀어낸 콘크리트
+        displaced, tangent_d = concrete_stress(eps_s, self.f_c[:, None], self.n_eps[:, None], self.eps_co[:, None])
+        inside = self.layer_depth < np.minimum(c, self.H)[:, None]
+        layer_force = (sigma_s - np.where(inside, displaced, 0.0)) * self.layer_area
+        dN = dN + np.sum((tangent_s - np.where(inside, tangent_d, 0.0)) * deps_s * self.layer_area, axis=1)
+
+        N = concrete + layer_force.sum(axis=1)
+        return N, dN, concrete, concrete_moment, layer_force, eps_s
+
+    def solve(self, N=0.0):
+        """
+        축력 N(압축 +, N)과 평형을 이루는 중립축 깊이. 반환: (c, 수렴 여부)
+        N이 순인장 강도(-ΣAs·f_yd)보다 작거나 압축 강도를 넘으면 해가 없으므로 수렴하지 않은 것으로 표시한다.
+        """
+        N = np.array(np.broadcast_to(np.asarray(N, dtype=float), (self.n,)))
+        valid = (self.H > 0) & (self.B > 0) & (self.f_c > 0)
+        H = np.where(valid, self.H, 1.0)
+        lo, hi = C_MIN_RATIO * H, C_MAX_RATIO * H
+        scale = np.where(valid, self.f_c * self.B * self.H, 0.0) + np.sum(self.layer_area, axis=1) * self.f_yd
+        tolerance = FORCE_TOLERANCE * np.maximum(scale, 1.0)
+
+        r_lo = self.forces(lo)[0] - N
+        r_hi = self.forces(hi)[0] - N
+        bracketed = valid & (r_lo <= 0) & (r_hi >= 0)
+
+        # 초기값: 철근 항복 + 등가 응력블록(0.8c)으로 본 중립축
+        tension = np.sum(self.layer_area, axis=1) * self.f_yd
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = (tension + N) / (0.8 * self.f_c * self.B)
+        c = np.where(np.isfinite(c) & (c > lo) & (c < hi), c, np.sqrt(lo * hi))
+
+        converged = ~bracketed
+        for _ in range(MAX_ITERATIONS):
+            residual, slope = self.forces(c)[:2]
+            residual = residual - N
+            converged = converged | (np.abs(residual) <= tolerance)
+            if converged.all():
+                break
+            lo = np.where(residual < 0, c, lo)
+            hi = np.where(residual > 0, c, hi)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = c - residual / slope
+            newton = (slope > 0) & (step > lo) & (step < hi)
+            c = np.where(converged, c, np.where(newton, step, 0.5 * (lo + hi)))
+        return np.where(bracketed, c, np.nan), bracketed & converged
+
+    def capacity(self, N=0.0):
+        """
+        축력 N에서의 극한 휨강도 (설계값, 단면 중심 기준).
+        반환 dict (배열): c, M, converged, concrete_force(콘크리트 압축력), tension_force(인장 철근 합력),
+        compression_force(콘크리트 + 압축 철근), layer_force(n, 층 수), layer_strain(압축 +), eps_top
+        해가 없는 단면(축력 초과/입력 오류)은 c, M 등이 0, converged = False.
+        """
+        c, converged = self.solve(N)
+        ok = np.isfinite(c)
+        c = np.where(ok, c, self.H)
+        _, _, concrete, concrete_moment, layer_force, eps_s = self.forces(c)
+        center = self.H / 2
+        M = concrete * center - concrete_moment + np.sum(layer_force * (center[:, None] - self.layer_depth), axis=1)
+        eps_top = self._strain(c, np.zeros((self.n, 1)))[0][:, 0]
+
+        def zero(value):
+            return np.where(ok, value, 0.0)
+
+        return {
+            "c": zero(c), "M": zero(M), "converged": converged,
+            "concrete_force": zero(concrete),
+            "tension_force": zero(-np.sum(np.minimum(layer_force, 0.0), axis=1)),
+            "compression_force": zero(concrete + np.sum(np.maximum(layer_force, 0.0), axis=1)),
+            "layer_force": np.where(ok[:, None], layer_force, 0.0),
+            "layer_strain": np.where(ok[:, None], eps_s, 0.0),
+            "eps_top": zero(eps_top),
+        }
+
+
+def pad_layers(layers, n):
+    """행별 [(깊이, 면적), ...] 리스트(길이 n)를 (n, 최대 층 수) 깊이/면적 배열로 채운다 (빈 칸은 면적 0)."""
+    width = max([len(row) for row in layers] + [0])
+    depth = np.zeros((n, width))
+    area = np.zeros((n, width))
+    for i, row in enumerate(layers):
+        for j, (d, a) in enumerate(row):
+            depth[i, j] = d
+            area[i, j] = a
+    return depth, area
+
+
+def section_capacity(section, n_eps, eps_co, eps_cu, extra_depth=None, extra_area=None):
+    """
+    RCSectionAnalyzer / RCSectionBatch의 단면·설계강도·철근 1~3단(인장연단 기준 dc)과 추가 철근층(압축연단 기준 깊이)으로
+    섬유 단면을 만들어 축력 Nu(kN, 압축 +)에서의 capacity()를 반환한다. 스칼라 해석기는 단면 1개짜리 배열이 된다.
+    콘크리트 최대 응력: LSD는 f_cd (= αcc·φc·f_ck), USD는 0.85·f_ck (KDS 14 20 20 포물선-직사각형 관계).
+    """
+    H = np.atleast_1d(np.asarray(section.beam_h, dtype=float))
+    depth = [H - np.asarray(section.dc_1), H - np.asarray(section.dc_2), H - np.asarray(section.dc_3)]
+    area = [section.as_use1, section.as_use2, section.as_use3]
+    depth = np.column_stack([np.broadcast_to(v, H.shape) for v in depth])
+    area = np.column_stack([np.broadcast_to(np.asarray(v, dtype=float), H.shape) for v in area])
+    if extra_depth is not None and np.size(extra_depth):
+        shape = (len(H), np.shape(extra_depth)[-1])
+        depth = np.hstack([depth, np.broadcast_to(np.asarray(extra_depth, dtype=float), shape)])
+        area = np.hstack([area, np.broadcast_to(np.asarray(extra_area, dtype=float), shape)])
+
+    f_c = section.f_cd if section.method == "LSD" else 0.85 * np.asarray(section.f_cd)
+    fiber = FiberSection(H, section.beam_b, f_c, n_eps, eps_co, eps_cu, section.f_yd, section.E_s, depth, area)
+    return fiber.capacity(np.asarray(section.Nu, dtype=float) * 1e3)
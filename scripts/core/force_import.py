@@ -0,0 +1,268 @@
+"""
+force_import.py
+골조해석 프로그램이 내보낸 부재력 표(CSV / XLSX)를 청크 단위로 읽어 단면별 하중 포락으로 줄인다.
+- 입력 열: 부재(member), 위치(station), 하중조합(case), M, V, N — 머리글 이름으로 찾는다 (별칭/직접 지정 가능)
+  단위는 UI 그리드와 같다 (kN·m, kN).
+- 파일은 FORCE_CHUNK_ROWS 행씩 읽고 (csv / openpyxl read_only), 청크마다 NumPy로 (단면, 하중조합)별
+  최대값만 남긴다. 메모리 사용량은 파일 크기가 아니라 (단면 수 × 하중조합 수)에 비례한다.
+- 부재 → 단면 대응은 단면 정의의 "members" 목록으로 준다. 대응이 없는 부재는 건너뛰고 개수만 센다.
+- 결과는 load_envelope의 "load_cases" 형식을 가진 단면 행이므로 그대로 포락 해석에 넘길 수 있다.
+"""
+import csv
+import os
+import re
+from itertools import islice
+
+import numpy as np
+
+# 한 번에 읽어 줄이는 행 수
+FORCE_CHUNK_ROWS = 65536
+
+# 머리글 별칭 (소문자, 공백/밑줄/괄호 단위 제거 후 비교)
+COLUMN_ALIASES = {
+    "member": ("member", "memb", "elem", "element", "부재", "부재번호", "요소"),
+    "station": ("station", "sta", "pos", "position", "x", "위치"),
+    "case": ("case", "loadcase", "lc", "combo", "combination", "loadcomb", "하중조합", "하중케이스", "조합"),
+    "M": ("m", "moment", "my", "mz", "휨모멘트", "모멘트"),
+    "V": ("v", "shear", "vy", "vz", "fz", "전단력"),
+    "N": ("n", "axial", "fx", "축력"),
+}
+REQUIRED_COLUMNS = ("member", "M")
+
+# 모멘트 부호 처리: abs(절대값), positive(정모멘트), negative(부모멘트를 양수로)
+MOMENT_SIGNS = ("abs", "positive", "negative")
+
+
+def _header_key(name):
+    name = re.sub(r"[\(\[].*?[\)\]]", "", str(name or ""))
+    return re.sub(r"[\s_\-]", "", name).lower()
+
+
+def resolve_columns(header, columns=None):
+    """머리글 행 → {열 이름: 열 번호}. columns({"M": "My(kN·m)", ...})로 직접 지정할 수 있다."""
+    keys = [_header_key(h) for h in header]
+    found = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        names = [columns[field]] if columns and field in columns else aliases
+        for name in names:
+            if _header_key(name) in keys:
+                found[field] = keys.index(_header_key(name))
+                break
+    missing = [field for field in REQUIRED_COLUMNS if field not in found]
+    if missing:
+        # 머리글 값은 돌려주지 않는다 (오류 메시지가 요청자에게 그대로 전달된다)
+        raise ValueError(f"Force table has no column for {', '.join(missing)} (set 'columns' to map the headers)")
+    return found
+
+
+def member_key(value):
+    """부재 이름 정규화 (엑셀의 12.0 → "12", 앞뒤 공백 제거)."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip() if value is not None else ""
+
+
+def _iter_csv(path, encoding):
+    with open(path, newline="", encoding=encoding) as f:
+        yield from csv.reader(f)
+
+
+def _iter_xlsx(path, sheet):
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _column(block, col):
+    try:
+        return [r[col] for r in block]
+    except IndexError:  # 끝 칸이 비어 짧게 읽힌 행
+        return [r[col] if col < len(r) else None for r in block]
+
+
+def _floats(block, col, what):
+    if col is None:
+        return np.zeros(len(block))
+    values = _column(block, col)
+    try:
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return np.array([0.0 if v is None or v == "" else v for v in values], dtype=float)
+    except ValueError as e:
+        raise ValueError(f"Non-numeric {what} value in force table: {e}") from None
+
+
+def normalized_codes(values):
+    """이름 배열의 (정규화된 고유 이름 리스트, 행별 번호). 정규화(member_key)는 고유값마다 한 번만 한다."""
+    from core.rc_section_batch import factorize
+    uniq, codes = factorize(values)
+    names, remap = factorize(np.array([member_key(v) for v in uniq], dtype=object))
+    return names, np.asarray(remap, dtype=np.intp)[codes]
+
+
+def iter_force_chunks(path, columns=None, sheet=None, chunk_rows=None, encoding="utf-8-sig"):
+    """
+    부재력 파일을 chunk_rows 행씩 읽어 {"member", "case"(원래 값의 object 배열), "station", "M", "V", "N"(float 배열)}로
+    내보낸다. 이름 정규화와 빈 부재 칸 제거는 ForceEnvelope.add에서 고유값 단위로 한다. 빈 숫자 칸은 0으로 본다.
+    """
+    chunk_rows = chunk_rows or FORCE_CHUNK_ROWS
+    ext = os.path.splitext(path)[1].lower()
+    rows = _iter_xlsx(path, sheet) if ext in (".xlsx", ".xlsm") else _iter_csv(path, encoding)
+    header = next(rows, None)
+    if header is None:
+        return
+    idx = resolve_columns(header, columns)
+    while True:
+        block = [r for r in islice(rows, chunk_rows) if r]
+        if not block:
+            break
+        c_col = idx.get("case")
+        yield {
+            "member": np.array(_column(block, idx["member"]), dtype=object),
+            "case": np.array(_column(block, c_col) if c_col is not None else [""] * len(block), dtype=object),
+            "station": _floats(block, idx.get("station"), "station"),
+            "M": _floats(block, idx["M"], "M"),
+            "V": _floats(block, idx.get("V"), "V"),
+            "N": _floats(block, idx.get("N"), "N"),
+        }
+
+
+class ForceEnvelope:
+    """
+    (단면, 하중조합)별 포락 누적기.
+    - Mu: 최대 모멘트 (moment 부호 처리 후), Nu / station: 그 위치의 동시 축력 / 위치
+      (같은 Mu가 여러 행이면 station, N이 큰 행 — 읽는 순서와 무관하게 같은 결과)
+    - Vu: 최대 |V|
+    - service_cases에 속한 하중조합은 사용하중으로 보고, 그 최대 모멘트를 단면의 모든 케이스 Ms로 쓴다.
+    """
+    def __init__(self, sections, service_cases=(), moment="abs"):
+        if moment not in MOMENT_SIGNS:
+            raise ValueError(f"moment must be one of {MOMENT_SIGNS}")
+        self.sections = list(sections)
+        self.moment = moment
+        self.service_cases = {member_key(c) for c in service_cases}
+        self.member_sections = {}
+        for s, section in enumerate(self.sections):
+            for member in section.get("members", []):
+                self.member_sections[member_key(member)] = s
+        self._groups = {}   # (단면 번호, 하중조합) → 누적 배열 번호
+        self._case_rank = {}  # 하중조합 → 처음 나온 순서 (결과의 케이스 순서)
+        self._size = 0
+        self._M = np.empty(0)
+        self._V = np.empty(0)
+        self._N = np.empty(0)
+        self._station = np.empty(0)
+        self.rows_read = 0
+        self.unmapped = {}
+
+    def _signed(self, M):
+        if self.moment == "abs":
+            return np.abs(M)
+        return M if self.moment == "positive" else -M
+
+    def _grow(self, size):
+        if size <= len(self._M):
+            return
+        cap = max(size, 2 * len(self._M), 64)
+        for name, fill in (("_M", -np.inf), ("_V", -np.inf), ("_N", 0.0), ("_station", 0.0)):
+            old = getattr(self, name)
+            new = np.full(cap, fill)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, chunk):
+        """청크 하나(iter_force_chunks 형식)를 누적한다. 부재 칸이 빈 행은 건너뛴다."""
+        members, member_codes = normalized_codes(chunk["member"])
+        cases, case_codes = normalized_codes(chunk["case"])
+        blank = np.array([m == "" for m in members], dtype=bool)
+        if blank.any():
+            keep = ~blank[member_codes]
+            chunk = {k: v[keep] for k, v in chunk.items()}
+            member_codes, case_codes = member_codes[keep], case_codes[keep]
+        return self.add_codes(members, member_codes, cases, case_codes,
+                              chunk["M"], chunk["V"], chunk["N"], chunk["station"])
+
+    def add_codes(self, members, member_codes, cases, case_codes, M, V, N, station):
+        """
+        이름 목록 + 행별 번호로 주어진 부재력을 누적한다 (ForceStore는 저장된 번호를 그대로 넘긴다).
+        청크 안에서 먼저 그룹별 최대값으로 줄인 뒤 전체 누적값과 비교한다.
+        """
+        sections = np.array([self.member_sections.get(m, -1) for m in members], dtype=np.intp)
+        self.rows_read += len(member_codes)
+        section_of = sections[member_codes]
+        mapped = section_of >= 0
+        if not mapped.all():
+            counts = np.bincount(member_codes[~mapped], minlength=len(members))
+            for code in np.flatnonzero(counts).tolist():
+                self.unmapped[members[code]] = self.unmapped.get(members[code], 0) + int(counts[code])
+        if not mapped.any():
+            return self
+
+        for name in cases:
+            self._case_rank.setdefault(name, len(self._case_rank))
+        keys = section_of[mapped].astype(np.int64) * len(cases) + case_codes[mapped]
+        uniq, inv = np.unique(keys, return_inverse=True)
+        M = self._signed(np.asarray(M)[mapped])
+        V = np.abs(np.asarray(V)[mapped])
+        N = np.asarray(N)[mapped]
+        station = np.asarray(station)[mapped]
+
+        # 그룹별 M 최대 행 (동시 N, station): 그룹 → M → station → N 순으로 정렬한 뒤 그룹의 마지막 행
+        order = np.lexsort((N, station, M, inv))
+        last = order[np.r_[np.flatnonzero(np.diff(inv[order])), len(order) - 1]]
+        V_max = np.full(len(uniq), -np.inf)
+        np.maximum.at(V_max, inv, V)
+
+        targets = np.empty(len(uniq), dtype=np.intp)
+        for g, key in enumerate(uniq.tolist()):
+            group = (key // len(cases), cases[key % len(cases)])
+            t = self._groups.get(group)
+            if t is None:
+                t = self._groups[group] = self._size
+                self._size += 1
+            targets[g] = t
+        self._grow(self._size)
+
+        M, N, station = M[last], N[last], station[last]
+        old_M, old_N, old_station = self._M[targets], self._N[targets], self._station[targets]
+        better = (M > old_M) | ((M == old_M) & ((station > old_station) | ((station == old_station) & (N > old_N))))
+        self._M[targets[better]] = M[better]
+        self._N[targets[better]] = N[better]
+        self._station[targets[better]] = station[better]
+        self._V[targets] = np.maximum(self._V[targets], V_max)
+        return self
+
+    def to_rows(self):
+        """단면 정의 + "load_cases"(하중조합별 Mu/Vu/Nu/Ms/station) 행 리스트. 하중이 없는 단면은 제외한다."""
+        ultimate = [[] for _ in self.sections]
+        service_ms = [0.0] * len(self.sections)
+        for (s, case), t in self._groups.items():
+            M = float(max(self._M[t], 0.0))
+            if case in self.service_cases:
+                service_ms[s] = max(service_ms[s], M)
+            else:
+                ultimate[s].append((self._case_rank[case], {"name": case or "LC", "Mu": M, "Vu": float(self._V[t]),
+                                                            "Nu": float(self._N[t]), "station": float(self._station[t])}))
+        rows = []
+        for s, section in enumerate(self.sections):
+            if not ultimate[s]:
+                continue
+            row = {k: v for k, v in section.items() if k != "members"}
+            row["load_cases"] = [dict(case, Ms=service_ms[s]) for _, case in sorted(ultimate[s], key=lambda c: c[0])]
+            rows.append(row)
+        return rows
+
+
+def import_forces(path, sections, columns=None, sheet=None, service_cases=(), moment="abs",
+                  chunk_rows=None, encoding="utf-8-sig"):
+    """부재력 파일을 읽어 누적한 ForceEnvelope를 반환한다."""
+    envelope = ForceEnvelope(sections, service_cases=service_cases, moment=moment)
+    for chunk in iter_force_chunks(path, columns=columns, sheet=sheet, chunk_rows=chunk_rows, encoding=encoding):
+        envelope.add(chunk)
+    return envelope
@@ -0,0 +1,178 @@
+"""
+force_store.py
+가져온 부재력을 프로젝트별 로컬 열(column) 저장소에 보관하고 memmap으로 다시 읽는다.
+- 디렉터리 구성: meta.json(부재/하중조합 이름, 단면 정의, 행 수) + 열마다 .npy 한 개
+  (member, case: int32 번호 / M, V, N, station: float64)
+- 행은 부재 번호 순으로 정렬해 저장하고, offsets.npy(부재 수 + 1)로 부재 → 행 구간을 찾는다.
+  한 부재의 재검토는 그 부재의 행만 읽는다 (파일 전체가 아니라 O(부재 행 수)).
+- 생성은 원본(CSV/XLSX)을 청크로 읽어 임시 열 파일에 쌓은 뒤, 계수 정렬(counting sort)로 부재별 구간에
+  흩어 쓴다. 메모리 사용량은 청크 크기에 비례한다.
+- 재검토는 np.load(mmap_mode="r")로 열을 열고 ForceEnvelope에 청크 단위로 넘긴다 (CSV 재파싱 없음).
+- meta.json은 마지막에 쓰므로, 이것이 있으면 저장소가 완성된 것이다.
+"""
+import json
+import os
+
+import numpy as np
+from core.force_import import FORCE_CHUNK_ROWS, ForceEnvelope, iter_force_chunks, member_key, normalized_codes
+
+# 저장 형식이 바뀌면 올린다
+STORE_VERSION = 1
+
+META_FILE = "meta.json"
+FLOAT_COLUMNS = ("M", "V", "N", "station")
+CODE_COLUMNS = ("member", "case")
+
+
+def _column_path(path, name):
+    return os.path.join(path, f"{name}.npy")
+
+
+class _Codes:
+    """청크마다 바뀌는 이름 번호를 저장소 전체 번호로 바꾼다."""
+    def __init__(self):
+        self.names = []
+        self._index = {}
+
+    def encode(self, values):
+        names, codes = normalized_codes(values)
+        remap = np.array([self._index.setdefault(name, len(self._index)) for name in names], dtype=np.int32)
+        self.names = list(self._index)
+        return remap[codes]
+
+
+class ForceStore:
+    """부재력 열 저장소 (읽기는 memmap)."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported force store version {meta.get('version')} in {path}")
+        self.meta = meta
+        self.rows = meta["rows"]
+        self.members = meta["members"]
+        self.cases = meta["cases"]
+        self.sections = meta.get("sections", [])
+        self._member_index = {name: i for i, name in enumerate(self.members)}
+        self.offsets = np.load(_column_path(path, "offsets"))
+        self.columns = {name: np.load(_column_path(path, name), mmap_mode="r")
+                        for name in CODE_COLUMNS + FLOAT_COLUMNS}
+
+    @staticmethod
+    def exists(path):
+        return os.path.exists(os.path.join(path, META_FILE))
+
+    # ── 생성 ─────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def build(cls, path, source, sections=None, columns=None, sheet=None, chunk_rows=None, encoding="utf-8-sig"):
+        """원본 부재력 파일(source)을 읽어 path에 저장소를 만들고 연다. 기존 저장소는 덮어쓴다."""
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        # 1) 원본 순서 그대로 임시 열 파일에 추가
+        members, cases = _Codes(), _Codes()
+        raw = {name: open(os.path.join(path, f"{name}.raw"), "wb") for name in CODE_COLUMNS + FLOAT_COLUMNS}
+        n = 0
+        try:
+            for chunk in iter_force_chunks(source, columns=columns, sheet=sheet, chunk_rows=chunk_rows,
+                                           encoding=encoding):
+                member_codes = members.encode(chunk["member"])
+                keep = np.array([name != "" for name in members.names], dtype=bool)[member_codes]
+                member_codes[keep].tofile(raw["member"])
+                cases.encode(chunk["case"])[keep].tofile(raw["case"])
+                for name in FLOAT_COLUMNS:
+                    np.ascontiguousarray(chunk[name][keep], dtype=np.float64).tofile(raw[name])
+                n += int(np.count_nonzero(keep))
+        finally:
+            for f in raw.values():
+                f.close()
+
+        # 2) 부재별 구간으로 흩어 쓰기 (계수 정렬, 부재 안에서는 원본 순서 유지)
+        try:
+            dtypes = dict({name: np.int32 for name in CODE_COLUMNS}, **{name: np.float64 for name in FLOAT_COLUMNS})
+            sources = {name: np.memmap(os.path.join(path, f"{name}.raw"), dtype=dtype, mode="r", shape=(n,))
+                       if n else np.empty(0, dtype=dtype) for name, dtype in dtypes.items()}
+            n_members = len(members.names)
+            counts = np.zeros(n_members, dtype=np.int64)
+            step = chunk_rows or FORCE_CHUNK_ROWS
+            for start in range(0, n, step):
+                counts += np.bincount(sources["member"][start:start + step], minlength=n_members)
+            offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+            outputs = {name: np.lib.format.open_memmap(_column_path(path, name), mode="w+", dtype=dtype, shape=(n,))
+                       for name, dtype in dtypes.items()}
+            cursor = offsets[:-1].copy()
+            for start in range(0, n, step):
+                codes = np.asarray(sources["member"][start:start + step])
+                order = np.argsort(codes, kind="stable")
+                sorted_codes = codes[order]
+                rank = np.arange(len(codes)) - np.searchsorted(sorted_codes, sorted_codes, side="left")
+                positions = cursor[sorted_codes] + rank
+                for name, out in outputs.items():
+                    out[positions] = np.asarray(sources[name][start:start + step])[order]
+                cursor += np.bincount(codes, minlength=n_members)
+            for out in outputs.values():
+                out.flush()
+            del outputs, sources
+            np.save(_column_path(path, "offsets"), offsets)
+        finally:
+            for name in CODE_COLUMNS + FLOAT_COLUMNS:
+                raw_path = os.path.join(path, f"{name}.raw")
+                if os.path.exists(raw_path):
+                    os.remove(raw_path)
+
+        meta = {"version": STORE_VERSION, "rows": n, "members": members.names, "cases": cases.names,
+                "sections": list(sections or []), "source": os.path.abspath(source)}
+        cls._write_meta(path, meta)
+        return cls(path)
+
+    @staticmethod
+    def _write_meta(path, meta):
+        tmp = os.path.join(path, META_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, os.path.join(path, META_FILE))
+
+    def set_sections(self, sections):
+        """단면 정의(부재 대응 포함)를 바꿔 저장한다. 부재력 열은 그대로 둔다."""
+        self.sections = list(sections)
+        self.meta = dict(self.meta, sections=self.sections)
+        self._write_meta(self.path, self.meta)
+
+    # ── 조회 ─────────────────────────────────────────────────────────────────
+
+    def member_rows(self, member):
+        """부재의 행 구간 slice (없는 부재는 빈 slice)."""
+        k = self._member_index.get(member_key(member))
+        if k is None:
+            return slice(0, 0)
+        return slice(int(self.offsets[k]), int(self.offsets[k + 1]))
+
+    def _ranges(self, members, step):
+        """members(None이면 전체)의 행을 step 행 이하의 연속 구간으로 나눈다."""
+        if members is None:
+            spans = [(0, self.rows)]
+        else:
+            spans = sorted({(r.start, r.stop) for r in map(self.member_rows, members) if r.stop > r.start})
+        for lo, hi in spans:
+            for start in range(lo, hi, step):
+                yield slice(start, min(start + step, hi))
+
+    def envelope(self, sections=None, members=None, service_cases=(), moment="abs", chunk_rows=None):
+        """
+        저장된 부재력으로 ForceEnvelope를 만든다.
+        sections를 주지 않으면 저장된 단면 정의를 쓴다. members를 주면 그 부재의 행만 읽는다.
+        """
+        envelope = ForceEnvelope(self.sections if sections is None else sections,
+                                 service_cases=service_cases, moment=moment)
+        columns = self.columns
+        for rows in self._ranges(members, chunk_rows or FORCE_CHUNK_ROWS):
+            envelope.add_codes(self.members, np.asarray(columns["member"][rows], dtype=np.intp),
+                               self.cases, np.asarray(columns["case"][rows], dtype=np.int64),
+                               columns["M"][rows], columns["V"][rows], columns["N"][rows], columns["station"][rows])
+        return envelope
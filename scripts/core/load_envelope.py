@@ -0,0 +1,129 @@
+"""
+load_envelope.py
+단면별 하중조합 포락(envelope) 해석.
+- 한 단면(행)에 여러 하중 케이스를 붙여 한 번에 검토한다 (케이스마다 행을 복제하지 않는다).
+- 하중 입력 형식 (행의 키):
+  - "load_cases": [{"name", "Mu", "Vu", "Nu", "Ms"}, ...]
+                  또는 열 배열 {"names": [...], "Mu": [...], "Vu": [...], "Nu": [...], "Ms": [...]}
+  - "basic_loads": {"D": {"Mu", "Vu", "Nu", "Ms"}, "L": {...}} + "combinations": [{"name", "factors": {"D": 1.2, "L": 1.6}}]
+    (조합 하중 = Σ 계수 × 기본 하중, 네 성분 모두에 같은 계수를 적용한다)
+  - 둘 다 없으면 행의 Mu/Vu/Nu/Ms 한 케이스로 본다.
+- 모든 (단면, 케이스)를 하나의 RCSectionBatch로 펼쳐 계산한다. 단면 저항은 단면마다 한 번만 계산된다.
+- 검토 항목별 지배 케이스: 휨(Mr_rate 최소), 전단(Vn_rate 최소), 균열(NG 케이스 우선, 그중 철근 응력 f_s 최대)
+"""
+import numpy as np
+from core.rc_section_batch import RCSectionBatch, parse_rows
+
+LOAD_KEYS = ("Mu", "Vu", "Nu", "Ms")
+
+
+def _case_names(names, n, prefix):
+    if names is None:
+        return [f"{prefix}{i + 1}" for i in range(n)]
+    names = [str(name) for name in names]
+    if len(names) != n:
+        raise ValueError(f"names has {len(names)} entries for {n} load cases")
+    return names
+
+
+def _combine(basic_loads, combinations):
+    """기본 하중 × 조합 계수 → (조합 이름, (조합 수, 4) 하중 배열)."""
+    basic_names = list(basic_loads)
+    basic = np.array([[float(basic_loads[b].get(k, 0)) for k in LOAD_KEYS] for b in basic_names],
+                     dtype=float).reshape(len(basic_names), len(LOAD_KEYS))
+    factors = np.zeros((len(combinations), len(basic_names)))
+    for i, combo in enumerate(combinations):
+        for b, factor in combo.get("factors", {}).items():
+            if b not in basic_loads:
+                raise ValueError(f"Unknown basic load '{b}' in combination {combo.get('name', i + 1)}")
+            factors[i, basic_names.index(b)] = float(factor)
+    names = [str(combo.get("name", f"C{i + 1}")) for i, combo in enumerate(combinations)]
+    return names, factors @ basic
+
+
+def parse_load_cases(row):
+    """
+    행의 하중 케이스를 (이름 리스트, (케이스 수, 4) 배열 [Mu, Vu, Nu, Ms])로 변환한다.
+    케이스가 하나도 없으면 ValueError.
+    """
+    if "combinations" in row:
+        names, loads = _combine(row.get("basic_loads", {}), row["combinations"])
+    elif "load_cases" in row:
+        cases = row["load_cases"]
+        if isinstance(cases, dict):
+            columns = [np.atleast_1d(np.asarray(cases.get(k, 0), dtype=float)) for k in LOAD_KEYS]
+            n = max(len(c) for c in columns)
+            loads = np.stack([np.broadcast_to(c, (n,)) for c in columns], axis=1)
+            names = _case_names(cases.get("names"), n, "LC")
+        else:
+            loads = np.array([[float(case.get(k, 0)) for k in LOAD_KEYS] for case in cases],
+                             dtype=float).reshape(len(cases), len(LOAD_KEYS))
+            names = [str(case.get("name", f"LC{i + 1}")) for i, case in enumerate(cases)]
+    else:
+        names = [str(row.get("name", "LC1"))]
+        loads = np.array([[float(row.get(k, 0)) for k in LOAD_KEYS]])
+    if len(names) == 0:
+        raise ValueError("Section has no load cases")
+    return names, loads
+
+
+def _governing(values, mode):
+    return int(np.argmin(values) if mode == "min" else np.argmax(values))
+
+
+def evaluate_envelopes(f_ck, f_y, standard_name, rows, phi_f=0.85, phi_v=None, include_cases=False,
+                       flexure_method="block"):
+    """
+    rows(단면)마다 모든 하중 케이스를 검토하고 검토 항목별 지배 케이스를 반환한다.
+    반환: [{"cases", "ok", "flexure", "shear", "crack", ("results")}]
+    - 각 검토 항목: {"index", "case", "Mu", "Vu", "Nu", "Ms", "ok", "result"} — result는 calc 요약 결과와 같은 형식
+    - include_cases=True 이면 "results"에 케이스별 요약 결과를 모두 담는다.
+    - flexure_method="fiber" 이면 케이스의 Nu가 휨강도에 반영된다 (RCSectionBatch 참고).
+    """
+    if len(rows) == 0:
+        return []
+    parsed = [parse_load_cases(row) for row in rows]
+    counts = np.array([len(names) for names, _ in parsed], dtype=np.intp)
+
+    columns = {key: np.repeat(values, counts) for key, values in parse_rows(rows).items()}
+    loads = np.concatenate([case_loads for _, case_loads in parsed])
+    for j, key in enumerate(LOAD_KEYS):
+        columns[key] = loads[:, j]
+    batch = RCSectionBatch(f_ck, f_y, standard_name, columns, phi_f=phi_f, phi_v=phi_v, flexure_method=flexure_method)
+    batch.analyze(group_sections=True)
+
+    # 균열: NG 케이스를 먼저, 그중 철근 응력이 큰 케이스를 지배로 본다
+    crack_ng = batch.has_rebar & ~batch.crack_ok
+    crack_score = np.where(crack_ng, batch.f_s + 1e12, batch.f_s)
+    checks = (
+        ("flexure", batch.Mr_rate, "min", batch.Mr_rate >= 1.0),
+        ("shear", batch.Vn_rate, "min", batch.Vn_rate >= 1.0),
+        ("crack", crack_score, "max", ~crack_ng),
+    )
+
+    offsets = np.concatenate([[0], np.cumsum(counts)]).tolist()
+    governing = []
+    for s in range(len(rows)):
+        lo, hi = offsets[s], offsets[s + 1]
+        governing.append([lo + _governing(values[lo:hi], mode) for _, values, mode, _ in checks])
+    picked = np.unique(np.array(governing, dtype=np.intp).ravel())
+    summaries = dict(zip(picked.tolist(), batch.get_summary_results(picked)))
+
+    results = []
+    for s, (names, case_loads) in enumerate(parsed):
+        lo, hi = offsets[s], offsets[s + 1]
+        envelope = {"cases": int(counts[s])}
+        for (check, _, _, ok), k in zip(checks, governing[s]):
+            i = k - lo
+            envelope[check] = {
+                "index": int(i),
+                "case": names[i],
+                **{key: float(value) for key, value in zip(LOAD_KEYS, case_loads[i])},
+                "ok": bool(ok[lo:hi].all()),
+                "result": dict(summaries[k]),
+            }
+        envelope["ok"] = all(envelope[check]["ok"] for check, *_ in checks)
+        if include_cases:
+            envelope["results"] = batch.get_summary_results(np.arange(lo, hi))
+        results.append(envelope)
+    return results
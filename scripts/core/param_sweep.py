@@ -0,0 +1,206 @@
+"""
+param_sweep.py
+설계도표용 매개변수 스윕 — 입력 축(fck, fy, H, B, cover, 철근, 하중, 설계기준 ...)의 모든 조합(카테시안 곱)을
+배치 엔진으로 계산해 열(column) 파일로 쓴다.
+- 축: {"이름": 값 목록 또는 {"min", "max", "step"}} — 이름은 calc 행 키(H, B, dc1, dia1, num1, Mu, ...)와
+  fck, fy, standard, cover. 축에 없는 값은 base(행 dict)에서 가져온다.
+- cover(스터럽 바깥 피복)를 주면 dc1 = cover + av_dia + dia1/2 로 정한다 (rebar_design과 같은 배치).
+- 조합 번호는 C 순서(마지막 축이 가장 빠르게 변함)이며, 설계기준 축은 항상 가장 바깥이다
+  (RCSectionBatch는 설계기준 하나만 받는다).
+- SWEEP_CHUNK_ROWS 조합씩 계산해 바로 파일에 쓰므로 메모리는 청크 크기에 비례한다.
+  · csv: 한 줄에 한 조합
+  · npz: 열마다 임시 .npy(memmap)에 채운 뒤 압축 없이 묶는다
+  · parquet: 청크마다 row group 하나 (pyarrow 필요)
+"""
+import csv
+import math
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+from core.rc_section_batch import COLUMN_DEFAULTS, DEFAULT_CRACK_CASE, INT_COLUMNS, RCSectionBatch
+
+# 한 번에 계산/기록하는 조합 수
+SWEEP_CHUNK_ROWS = 65536
+SWEEP_FORMATS = ("csv", "npz", "parquet")
+
+# 출력 결과 열 → (RCSectionBatch 속성, 배율)
+SWEEP_OUTPUTS = {
+    "as_req": ("as_req", 1.0),
+    "as_used": ("as_use", 1.0),
+    "Mr": ("M_r", 1e-6),
+    "Mr_rate": ("Mr_rate", 1.0),
+    "Vn": ("pi_V_n", 1e-3),
+    "Vn_rate": ("Vn_rate", 1.0),
+    "fs": ("f_s", 1.0),
+    "crack_ok": ("crack_ok", None),
+    "min_rebar_ok": ("min_rebar_ok", None),
+    "max_rebar_ok": ("max_rebar_ok", None),
+}
+
+_MATERIAL_AXES = ("standard", "fck", "fy")
+_TEXT_AXES = ("standard", "crack_case")
+
+
+def sweep_values(spec, name):
+    """축 정의({"min", "max", "step"} 범위 또는 값 목록) → 값 리스트."""
+    if isinstance(spec, dict):
+        lo, hi, step = float(spec["min"]), float(spec["max"]), float(spec["step"])
+        if step <= 0 or hi < lo:
+            raise ValueError(f"Invalid sweep range for {name}: {spec}")
+        return (lo + step * np.arange(int(math.floor((hi - lo) / step + 1e-9)) + 1)).tolist()
+    values = [spec] if isinstance(spec, (str, int, float)) else list(spec)
+    if not values:
+        raise ValueError(f"Sweep axis {name} is empty")
+    return values
+
+
+class ParamSweep:
+    """
+    축 정의와 기준 행으로 정해지는 스윕 (조합은 필요할 때 청크 단위로 만든다).
+    standard, fck, fy는 축이 없으면 인자로 받은 기본값을 쓴다.
+    """
+
+    def __init__(self, axes, base=None, standard_name=None, f_ck=35, f_y=400, phi_f=0.85, phi_v=None,
+                 outputs=None, flexure_method="block"):
+        base = dict(base or {})
+        axes = {name: sweep_values(spec, name) for name, spec in (axes or {}).items()}
+        unknown = set(axes) - set(COLUMN_DEFAULTS) - set(_MATERIAL_AXES) - {"cover", "crack_case"}
+        if unknown:
+            raise ValueError(f"Unknown sweep axes: {sorted(unknown)}")
+        self.standards = axes.pop("standard", [standard_name])
+        if self.standards[0] is None:
+            raise ValueError("A design standard is required")
+        self.axes = axes
+        self.names = list(axes)
+        self.shape = tuple(len(axes[name]) for name in self.names)
+        self.base = dict(base, fck=base.get("fck", f_ck), fy=base.get("fy", f_y))
+        self.phi_f, self.phi_v = phi_f, phi_v
+        self.flexure_method = flexure_method
+        self.outputs = list(outputs or SWEEP_OUTPUTS)
+        missing = set(self.outputs) - set(SWEEP_OUTPUTS)
+        if missing:
+            raise ValueError(f"Unknown sweep outputs: {sorted(missing)}")
+        self._values = {name: np.array(values, dtype=object if name in _TEXT_AXES else float)
+                        for name, values in axes.items()}
+
+    @property
+    def points(self):
+        return len(self.standards) * int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def columns(self):
+        """출력 열 이름 (입력 축 → 결과)."""
+        return (["standard"] if len(self.standards) > 1 else []) + self.names + self.outputs
+
+    def _inputs(self, start, stop):
+        """조합 번호 [start, stop)의 입력 열 (한 설계기준 안)."""
+        codes = np.unravel_index(np.arange(start, stop), self.shape) if self.names else ()
+        return {name: self._values[name][code] for name, code in zip(self.names, codes)}
+
+    def _batch_columns(self, inputs, n):
+        columns = {}
+        for key, default in COLUMN_DEFAULTS.items():
+            value = inputs[key] if key in inputs else self.base.get(key, default)
+            columns[key] = np.broadcast_to(np.asarray(value, dtype=int if key in INT_COLUMNS else float), (n,))
+        crack_case = inputs.get("crack_case", self.base.get("crack_case", DEFAULT_CRACK_CASE))
+        columns["crack_case"] = np.broadcast_to(np.asarray(crack_case, dtype=object), (n,))
+        cover = inputs.get("cover", self.base.get("cover"))
+        if cover is not None and "dc1" not in inputs:
+            columns["dc1"] = cover + columns["av_dia"] + columns["dia1"] / 2
+        return columns
+
+    def iter_chunks(self, chunk_rows=None):
+        """{열 이름: 배열} 청크를 조합 순서대로 내보낸다."""
+        chunk_rows = chunk_rows or SWEEP_CHUNK_ROWS
+        per_standard = self.points // len(self.standards)
+        for standard in self.standards:
+            for start in range(0, per_standard, chunk_rows):
+                stop = min(start + chunk_rows, per_standard)
+                n = stop - start
+                inputs = self._inputs(start, stop)
+                f_ck = inputs.get("fck", self.base["fck"])
+                f_y = inputs.get("fy", self.base["fy"])
+                batch = RCSectionBatch(f_ck, f_y, standard, self._batch_columns(inputs, n),
+                                       phi_f=self.phi_f, phi_v=self.phi_v,
+                                       flexure_method=self.flexure_method).analyze()
+                chunk = {"standard": np.full(n, standard, dtype=object)} if len(self.standards) > 1 else {}
+                chunk.update(inputs)
+                for name in self.outputs:
+                    attr, scale = SWEEP_OUTPUTS[name]
+                    values = np.broadcast_to(getattr(batch, attr), (n,))
+                    chunk[name] = values.astype(bool) if scale is None else values * scale
+                yield chunk
+
+    # ── 기록 ─────────────────────────────────────────────────────────────────
+
+    def write(self, path, fmt=None, chunk_rows=None):
+        """스윕 결과를 path에 쓴다. fmt를 주지 않으면 확장자로 정한다. 반환: 조합 수."""
+        fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+        if fmt not in SWEEP_FORMATS:
+            raise ValueError(f"Unsupported sweep format: {fmt!r} (use one of {', '.join(SWEEP_FORMATS)})")
+        writer = {"csv": self._write_csv, "npz": self._write_npz, "parquet": self._write_parquet}[fmt]
+        writer(path, chunk_rows)
+        return self.points
+
+    def _write_csv(self, path, chunk_rows):
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            out = csv.writer(f)
+            out.writerow(self.columns)
+            for chunk in self.iter_chunks(chunk_rows):
+                out.writerows(zip(*(chunk[name].tolist() for name in self.columns)))
+
+    def _write_npz(self, path, chunk_rows):
+        n = self.points
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as tmp:
+            arrays, cursor = {}, 0
+            for chunk in self.iter_chunks(chunk_rows):
+                for name in self.columns:
+                    values = chunk[name]
+                    if values.dtype == object:
+                        values = values.astype(str)
+                    if name not in arrays:
+                        dtype = values.dtype if values.dtype.kind != "U" else self._text_dtype(name)
+                        arrays[name] = np.lib.format.open_memmap(os.path.join(tmp, f"{len(arrays)}.npy"),
+                                                                 mode="w+", dtype=dtype, shape=(n,))
+                    arrays[name][cursor:cursor + len(values)] = values
+                cursor += len(chunk[self.columns[-1]])
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+                for name, values in arrays.items():
+                    values.flush()
+                    with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                        np.lib.format.write_array(member, values, allow_pickle=False)
+            del arrays
+
+    def _text_dtype(self, name):
+        values = self.standards if name == "standard" else self.axes[name]
+        return f"<U{max(len(str(v)) for v in values)}"
+
+    def _write_parquet(self, path, chunk_rows):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ValueError("Parquet sweep output requires pyarrow") from e
+        writer = None
+        try:
+            for chunk in self.iter_chunks(chunk_rows):
+                table = pa.table({name: chunk[name].tolist() if chunk[name].dtype == object else chunk[name]
+                                  for name in self.columns})
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+def run_sweep(axes, path, base=None, fmt=None, standard_name=None, f_ck=35, f_y=400, phi_f=0.85, phi_v=None,
+              outputs=None, chunk_rows=None, flexure_method="block"):
+    """스윕을 계산해 path에 쓰고 {"file", "format", "points", "columns"}를 반환한다."""
+    sweep = ParamSweep(axes, base=base, standard_name=standard_name, f_ck=f_ck, f_y=f_y, phi_f=phi_f,
+                       phi_v=phi_v, outputs=outputs, flexure_method=flexure_method)
+    fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+    points = sweep.write(path, fmt, chunk_rows=chunk_rows)
+    return {"file": path, "format": fmt, "points": points, "columns": sweep.columns}
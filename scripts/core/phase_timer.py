@@ -0,0 +1,155 @@
+"""
+phase_timer.py
+선택적 구간 계측 — 해석/보고서/CLI 단계별 경과 시간(wall), CPU 시간, 실행 횟수를 모은다.
+- 요청의 "timings": true 또는 환경변수 RC_BEAM_TIMINGS=1 일 때만 켠다. 꺼져 있으면 phase()는
+  미리 만든 빈 context manager를 돌려준다. 행마다 여러 번 지나는 곳(해석 단계)은 with 문 비용도 아끼도록
+  timed() / run_steps()를 쓴다 — 꺼져 있으면 전역 변수 확인 한 번 뒤 그대로 호출한다.
+- 구간은 중첩될 수 있다 (상위 구간 시간은 하위 구간을 포함한다). 프로세스 풀 워커 안의 구간은 모으지 않는다.
+- 환경변수 RC_BEAM_PROFILE=경로 이면 호출 전체를 cProfile로 감싸 pstats 파일을 남긴다
+  (python -m pstats 경로 로 읽는다). 파일을 쓰는 설정이라 요청 본문의 "profile" 필드는 무시한다.
+"""
+import os
+import time
+
+TIMINGS_ENV = "RC_BEAM_TIMINGS"
+PROFILE_ENV = "RC_BEAM_PROFILE"
+
+_perf = time.perf_counter
+_cpu = time.process_time
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullPhase()
+_current = None
+
+
+class _Phase:
+    __slots__ = ("timer", "name", "wall", "cpu")
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.wall = _perf()
+        self.cpu = _cpu()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.record(self.name, _perf() - self.wall, _cpu() - self.cpu)
+        return False
+
+
+class PhaseTimer:
+    """구간 이름별 [실행 횟수, wall 초, CPU 초] 누적."""
+
+    def __init__(self):
+        self.phases = {}
+        self.started = _perf()
+        self.started_cpu = _cpu()
+
+    def record(self, name, wall, cpu):
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [1, wall, cpu]
+        else:
+            entry[0] += 1
+            entry[1] += wall
+            entry[2] += cpu
+
+    def summary(self):
+        """{"wall_ms", "cpu_ms", "phases": {이름: {"count", "wall_ms", "cpu_ms"}}} (wall 시간 내림차순)."""
+        phases = sorted(self.phases.items(), key=lambda item: -item[1][1])
+        return {
+            "wall_ms": round((_perf() - self.started) * 1e3, 3),
+            "cpu_ms": round((_cpu() - self.started_cpu) * 1e3, 3),
+            "phases": {name: {"count": count, "wall_ms": round(wall * 1e3, 3), "cpu_ms": round(cpu * 1e3, 3)}
+                       for name, (count, wall, cpu) in phases},
+        }
+
+
+def phase(name):
+    """계측이 켜져 있으면 name 구간을 재는 context manager, 아니면 아무것도 하지 않는 것."""
+    timer = _current
+    if timer is None:
+        return _NULL
+    return _Phase(timer, name)
+
+
+def timed(name, func, *args):
+    """func(*args)를 name 구간으로 재서 호출한다 (꺼져 있으면 그냥 호출)."""
+    timer = _current
+    if timer is None:
+        return func(*args)
+    with _Phase(timer, name):
+        return func(*args)
+
+
+def run_steps(obj, steps):
+    """steps: ((구간 이름, 메서드 이름), ...) — obj의 인자 없는 메서드를 순서대로 호출한다."""
+    timer = _current
+    if timer is None:
+        for _, method in steps:
+            getattr(obj, method)()
+        return
+    for name, method in steps:
+        with _Phase(timer, name):
+            getattr(obj, method)()
+
+
+def active():
+    return _current
+
+
+def enabled(input_data=None):
+    """요청 필드("timings") 또는 환경변수로 계측을 켤지 정한다."""
+    if input_data and "timings" in input_data:
+        return bool(input_data["timings"])
+    return os.environ.get(TIMINGS_ENV, "").strip().lower() not in ("", "0", "false", "no")
+
+
+def profile_path():
+    """cProfile 결과 경로 — 환경변수로만 정한다."""
+    return os.environ.get(PROFILE_ENV) or None
+
+
+class session:
+    """
+    with session(timings, profile) as timer: ...
+    timings가 참이면 새 PhaseTimer를 켜고(끝나면 이전 상태로 되돌림), profile 경로가 있으면 cProfile 결과를 남긴다.
+    timer는 계측이 꺼져 있으면 None이다.
+    """
+
+    def __init__(self, timings=False, profile=None):
+        self.timer = PhaseTimer() if timings else None
+        self.profile = profile
+        self._profiler = None
+        self._previous = None
+
+    def __enter__(self):
+        global _current
+        self._previous = _current
+        if self.timer is not None:
+            _current = self.timer
+        if self.profile:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self.timer
+
+    def __exit__(self, *exc):
+        global _current
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.profile)
+        _current = self._previous
+        return False
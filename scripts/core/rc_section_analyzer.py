@@ -1,14 +1,42 @@
 import math
-from core.materials import ConcMaterial, RebarMaterial # Updated to new unified module
-from rebar_area_ks import KoreanRebar
+from core.materials import get_conc_material, get_rebar_material # Cached, shared material instances
+from core.phase_timer import run_steps, timed
+from rebar_area_ks import get_korean_rebar
 from standards import get_standard
+from collections import OrderedDict
+
+# 단면 저항 단계(calc_capacity) 결과를 보관할 단면 수 (설계기준/재료/단면/철근 배치별)
+CAPACITY_CACHE_SIZE = 4096
+_CAPACITY_CACHE = OrderedDict()
+
+# 휨강도 산정 방법: 등가 직사각형 응력블록 / 섬유 단면 변형률 적합 해석 (core.fiber_section)
+FLEXURE_METHODS = ("block", "fiber")
+
+
+def capacity_cache_info():
+    return {"size": len(_CAPACITY_CACHE), "maxsize": CAPACITY_CACHE_SIZE}
+
+
+def clear_capacity_cache():
+    _CAPACITY_CACHE.clear()
+
+
+def parse_layers(layers, rebar):
+    """추가 철근층 [{"d": 압축연단에서의 깊이, "dia", "num"}] → ((깊이, 단면적), ...) (섬유 해석 전용)."""
+    return tuple((float(layer["d"]), rebar.get_area(int(layer.get("dia", 13))) * float(layer.get("num", 0)))
+                 for layer in layers or ())
+
 
 class RCSectionAnalyzer:
     """
     핵심 연산 모듈 (단면력 및 철근량, 사용성 검토)
     구조물의 형태(보, 기둥, 옹벽)에 상관없이 단면정보와 하중정보만으로 해석 수행
     """
-    def __init__(self, f_ck, f_y, standard_name, beam_h, beam_b, loads, rebar_data, phi_f=0.85, phi_v=None):
+    def __init__(self, f_ck, f_y, standard_name, beam_h, beam_b, loads, rebar_data, phi_f=0.85, phi_v=None,
+                 flexure_method="block"):
+        if flexure_method not in FLEXURE_METHODS:
+            raise ValueError(f"Unknown flexure_method: {flexure_method} (expected one of {', '.join(FLEXURE_METHODS)})")
+        self.flexure_method = flexure_method
         self.f_ck = float(f_ck)
         self.f_y = float(f_y)
         self.standard_name = standard_name
@@ -40,9 +68,9 @@ class RCSectionAnalyzer:
         self.f_cd = self.f_ck * self.phi_c * self.alpha_cc
         self.f_yd = self.f_y * self.phi_s
         
-        self.rebar = KoreanRebar()
-        self.con_material = ConcMaterial(f_ck=self.f_ck, method=self.method)
-        self.rebar_material = RebarMaterial(f_y=self.f_y)
+        self.rebar = get_korean_rebar()
+        self.con_material = get_conc_material(self.f_ck, method=self.method)
+        self.rebar_material = get_rebar_material(self.f_y)
         self.E_s = self.rebar_material.E_s
         self.E_c = self.con_material.E_c
 
@@ -85,6 +113,7 @@ class RCSectionAnalyzer:
         self.delta_redist = 1.0
         self.eps_s = 0
         self.eps_yd = 0
+        self.fiber_converged = None
 
         # Rebar Data
         self.rebar_data = rebar_data
@@ -136,6 +165,9 @@ class RCSectionAnalyzer:
         self.rho_l_tensile = min(self.rho_l_tensile, 0.02)
         self.rebar_id = 'D'
 
+        # Additional bar layers measured from the compression face (compression steel etc.) — fiber method only
+        self.extra_layers = parse_layers(row.get("layers"), self.rebar)
+
         # Stirrup
         self.av_dia = int(row.get("av_dia", 16))
         self.av_leg = float(row.get("av_leg", 0))
@@ -144,19 +176,79 @@ class RCSectionAnalyzer:
         # Crack control environment
         self.crack_case = row.get("crack_case", "일반환경").strip()
 
+    # ── 단면 저항 (하중과 무관) / 하중 요구 단계 ─────────────────────────────────
+
+    # (계측 구간 이름, 메서드) — core.phase_timer.run_steps
+    _CAPACITY_STEPS = (("calc_moment.capacity", "_moment_capacity"), ("calc_shear.capacity", "_shear_capacity"),
+                       ("calc_service.capacity", "_service_geometry"))
+    _DEMAND_STEPS = (("calc_moment.demand", "_moment_demand"), ("calc_shear.demand", "_shear_demand"),
+                     ("calc_service.demand", "_service_stress"))
+
+    def _capacity_key(self):
+        """단면 저항 단계의 결과를 결정하는 입력 (설계기준, 재료, 계수, 단면/철근 배치)."""
+        return (self.standard.name, self.f_ck, self.f_y, self.phi_c, self.phi_s, self.pi_f, self.pi_v,
+                self.beam_h, self.beam_b,
+                self.dc_1, self.as_dia1, self.as_num1, self.dc_2, self.as_dia2, self.as_num2,
+                self.dc_3, self.as_dia3, self.as_num3,
+                self.av_dia, self.av_leg, self.av_space, self.crack_case,
+                # 섬유 해석은 축력과 추가 철근층도 단면 저항에 반영한다
+                self.flexure_method, self.extra_layers, self.Nu if self.flexure_method == "fiber" else None)
+
+    def calc_capacity(self):
+        """
+        하중과 무관한 단면 저항 단계 (M_r, c, εt, Vc/Vs, 균열단면 형상 등).
+        같은 단면이면 처음 계산한 결과(속성 스냅샷)를 재사용한다.
+        """
+        key = self._capacity_key()
+        snapshot = _CAPACITY_CACHE.get(key)
+        if snapshot is None:
+            before = dict(self.__dict__)
+            run_steps(self, self._CAPACITY_STEPS)
+            snapshot = {k: v for k, v in self.__dict__.items() if k not in before or before[k] is not v}
+            _CAPACITY_CACHE[key] = snapshot
+            if len(_CAPACITY_CACHE) > CAPACITY_CACHE_SIZE:
+                _CAPACITY_CACHE.popitem(last=False)
+        else:
+            _CAPACITY_CACHE.move_to_end(key)
+            self.__dict__.update(snapshot)
+        return self
+
+    def calc_demand(self):
+        """하중에 따라 달라지는 단계 (As_req, 안전율, 전단보강량, LSD θ 선정, 철근 응력)."""
+        run_steps(self, self._DEMAND_STEPS)
+        return self
+
     def calc_moment(self):
-        if self.beam_h <= 0 or self.beam_b <= 0 or self.d_eff <= 0:
-            self.as_req = 0; self.M_r = 0; self.M_sf = 0; return
+        self._moment_capacity()
+        self._moment_demand()
+
+    def calc_shear(self):
+        self._shear_capacity()
+        self._shear_demand()
+
+    def calc_service(self):
+        self._service_geometry()
+        self._service_stress()
+
+    def _flexure_valid(self):
+        return self.beam_h > 0 and self.beam_b > 0 and self.d_eff > 0
+
+    def _moment_capacity(self):
+        if not self._flexure_valid():
+            return
 
         # Calculation based on DESIGN strengths (f_cd, f_yd)
-        self.tension_force = self.as_use * self.f_yd
-        # Force = alpha_fac * f_cd * b * c
-        self.c = self.tension_force / (self.alpha_fac * self.f_cd * self.beam_b) if self.f_cd * self.beam_b > 0 else 0
-        self.a = self.c * 2 * self.beta_fac # Approximation for 'a' to keep report consistent
         self.compression_force = self.alpha_fac * self.f_cd * self.beam_b # Force per unit depth c
-        
         self.epsilon_y = self.f_y / self.E_s
-        self.epsilon_t = 0.003 * (self.dt - self.c) / self.c if self.c > 0 else 0
+        if self.flexure_method == "fiber":
+            M_n = self._fiber_capacity()
+        else:
+            self.tension_force = self.as_use * self.f_yd
+            # Force = alpha_fac * f_cd * b * c
+            self.c = self.tension_force / (self.alpha_fac * self.f_cd * self.beam_b) if self.f_cd * self.beam_b > 0 else 0
+            self.epsilon_t = 0.003 * (self.dt - self.c) / self.c if self.c > 0 else 0
+            M_n = self.as_use * self.f_yd * (self.d_eff - self.beta_fac * self.c)
+        self.a = self.c * 2 * self.beta_fac # Approximation for 'a' to keep report consistent
 
         # Strength reduction factor for flexure (phi_f)
         std_phi_f, self.epsilon_t_result = self.standard.get_phi_f(self.epsilon_t, self.epsilon_y)
@@ -168,22 +260,6 @@ class RCSectionAnalyzer:
             # For LSD, strength reduction is handled by material factors (phi_c, phi_s)
             self.pi_f_r = std_phi_f
 
-        # Required Rebar
-        # Mu = phi * As * f_yd * (d - beta_fac * c)
-        # Force Equilibrium: As * f_yd = alpha_fac * f_cd * b * c  => c = (As * f_yd) / (alpha_fac * f_cd * b)
-        # Mu = phi * As * f_yd * (d - beta_fac * (As * f_yd) / (alpha_fac * f_cd * b))
-        # Mu = phi * As * f_yd * d - phi * As^2 * f_yd^2 * beta_fac / (alpha_fac * f_cd * b)
-        # term * As^2 - (phi * f_yd * d) * As + Mu = 0
-        K_val = (self.pi_f_r * self.f_yd**2 * self.beta_fac) / (self.alpha_fac * self.f_cd * self.beam_b) if self.alpha_fac * self.f_cd * self.beam_b > 0 else 0
-        if K_val > 0:
-            A = K_val
-            B = -(self.pi_f_r * self.f_yd * self.d_eff)
-            C = self.Mu_nm
-            det = B**2 - 4 * A * C
-            self.as_req = (-B - math.sqrt(det)) / (2 * A) if det >= 0 else 9999
-        else:
-            self.as_req = 0
-
         # Reinforcement ratio
         self.lo_min_1 = 1.4 / self.f_y
         self.lo_min_2 = 0.25 * math.sqrt(self.f_ck) / self.f_y
@@ -193,20 +269,16 @@ class RCSectionAnalyzer:
         self.lo_bal = (0.85 * beta_1_usd * self.f_ck / self.f_y) * (600 / (600 + self.f_y))
         self.lo_max = 0.75 * self.lo_bal
         self.lo_use = self.as_use / (self.beam_b * self.d_eff) if self.beam_b * self.d_eff > 0 else 0
-        self.lo_min_3 = (4/3) * (self.as_req / (self.beam_b * self.d_eff)) if self.beam_b * self.d_eff > 0 else 0
         
         # Area based values for detailed reporting
         self.as_min_1 = self.lo_min_1 * self.beam_b * self.d_eff
         self.as_min_2 = self.lo_min_2 * self.beam_b * self.d_eff
-        self.as_min_3 = (4/3) * self.as_req if hasattr(self, 'as_req') else 0
-        self.as_min_val = min(max(self.as_min_1, self.as_min_2), self.as_min_3)
         
         self.as_shrink = 0.0018 * self.beam_b * self.beam_h
         self.as_max_val = 0.04 * self.beam_b * self.d_eff
 
         # Resistant Moment
-        self.M_r = self.pi_f_r * self.as_use * self.f_yd * (self.d_eff - self.beta_fac * self.c) # N.mm
-        self.M_sf = self.M_r / self.Mu_nm if self.Mu_nm > 0 else 0
+        self.M_r = self.pi_f_r * M_n # N.mm
         
         # LSD Specific details for report
         if self.method == "LSD":
@@ -216,30 +288,51 @@ class RCSectionAnalyzer:
             self.eps_s = self.eps_cu * (self.d_eff - self.c) / self.c if self.c > 0 else 0
             self.eps_yd = self.f_yd / self.E_s
 
-    def calc_shear(self):
+    def _fiber_capacity(self):
+        """섬유 단면 해석 (Nu 포함). c, 인장력, εt(최외단 인장철근)를 정하고 공칭 휨강도 M_n(N.mm)을 반환한다."""
+        from core.fiber_section import section_capacity  # NumPy: 섬유 해석을 고른 경우에만 불러온다
+        con = self.con_material
+        extra = [[d for d, _ in self.extra_layers]], [[a for _, a in self.extra_layers]]
+        fiber = section_capacity(self, con.n_eps, con.eps_co, con.eps_cu, *extra)
+        self.fiber_converged = bool(fiber["converged"][0])
+        self.c = float(fiber["c"][0])
+        self.tension_force = float(fiber["tension_force"][0])
+        self.epsilon_t = -float(fiber["layer_strain"][0, 0])
+        return float(fiber["M"][0])
+
+    def _moment_demand(self):
+        if not self._flexure_valid():
+            self.as_req = 0; self.M_r = 0; self.M_sf = 0; return
+
+        # Required Rebar
+        # Mu = phi * As * f_yd * (d - beta_fac * c)
+        # Force Equilibrium: As * f_yd = alpha_fac * f_cd * b * c  => c = (As * f_yd) / (alpha_fac * f_cd * b)
+        # Mu = phi * As * f_yd * (d - beta_fac * (As * f_yd) / (alpha_fac * f_cd * b))
+        # Mu = phi * As * f_yd * d - phi * As^2 * f_yd^2 * beta_fac / (alpha_fac * f_cd * b)
+        # term * As^2 - (phi * f_yd * d) * As + Mu = 0
+        K_val = (self.pi_f_r * self.f_yd**2 * self.beta_fac) / (self.alpha_fac * self.f_cd * self.beam_b) if self.alpha_fac * self.f_cd * self.beam_b > 0 else 0
+        if K_val > 0:
+            A = K_val
+            B = -(self.pi_f_r * self.f_yd * self.d_eff)
+            C = self.Mu_nm
+            det = B**2 - 4 * A * C
+            self.as_req = (-B - math.sqrt(det)) / (2 * A) if det >= 0 else 9999
+        else:
+            self.as_req = 0
+
+        self.lo_min_3 = (4/3) * (self.as_req / (self.beam_b * self.d_eff)) if self.beam_b * self.d_eff > 0 else 0
+        self.as_min_3 = (4/3) * self.as_req
+        self.as_min_val = min(max(self.as_min_1, self.as_min_2), self.as_min_3)
+        self.M_sf = self.M_r / self.Mu_nm if self.Mu_nm > 0 else 0
+
+    def _shear_capacity(self):
         # Initialize attributes used in reports
         self.V_c = 0; self.pi_V_c = 0; self.V_s = 0; self.pi_V_n = 0; self.av_req = 0
         self.av_use = self.rebar.get_area(self.av_dia) * self.av_leg
         self.av_space_min = 0; self.V_s_max = 0; self.d_eff_v = self.d_eff 
         
-        if self.beam_b <= 0 or self.d_eff <= 0:
-            return
-        
-        # Check for standard-specific shear logic (e.g. Truss model for LSD 2012)
-        res = self.standard.calc_shear_capacity(self)
-        if res is not None:
-            self.V_c = res["V_c"]
-            self.V_s = res["V_s"]
-            self.pi_V_n = res["V_n"]
-            self.pi_V_c = self.V_c # In LSD, material factors are often already in Vc
-            self.v_theta = res.get("theta", 45)
-            self.v_cot_theta = 1.0 / math.tan(math.radians(self.v_theta)) if self.v_theta > 0 else 0
-            self.z = 0.9 * self.d_eff
-            self.pi_v_s = self.V_s # In LSD stirrup phi is usually already in Vs
-            self.v_details = res.get("details", {})
-            # Delta T check (image p2)
-            self.delta_t = self.v_details.get("delta_t", 0.5 * self.Vu_n * self.v_cot_theta)
-            self.delta_tb = self.v_details.get("delta_tb", (self.M_r - self.Mu_nm) / self.z if self.z > 0 else 0)
+        # Standard-specific shear logic (e.g. Truss model for LSD 2012) selects theta from Vu: demand stage
+        if self.beam_b <= 0 or self.d_eff <= 0 or self.standard.has_shear_model():
             return
 
         self.z = 0.9 * self.d_eff_v
@@ -247,7 +340,6 @@ class RCSectionAnalyzer:
         self.v_cot_theta = 1.0 # cot(45) = 1.0
         self.delta_t = 0
         self.delta_tb = 0
-        self.v_details = {}
         # For LSD, Vc often uses design strengths.
         # But here we stick to standard provided pi_v which may encapsulate material factors.
         self.V_c = (math.sqrt(self.f_ck) / 6) * self.beam_b * self.d_eff_v 
@@ -257,15 +349,42 @@ class RCSectionAnalyzer:
             
         self.pi_V_c = self.pi_v * self.V_c
         
-        # Use f_yd for stirrups in LSD
-        f_y_shear = self.f_yd if self.method == "LSD" else self.f_y
         self.V_s_max = self.standard.get_vs_max(self.f_ck, self.beam_b, self.d_eff_v)
         
-        # Populate v_details for reporting even in fallback
+        # Section values for v_details (reported even in fallback)
         k_val = 1 + math.sqrt(200 / self.d_eff_v) if self.d_eff_v > 0 else 2.0
         k_val = min(k_val, 2.0)
         f_ctk = getattr(self.con_material, 'f_ctk', 0.6 * math.sqrt(self.f_ck))
-        Ac_val = self.beam_b * self.beam_h
+        self._shear_section = (k_val, f_ctk, self.beam_b * self.beam_h)
+
+        # Use f_yd for stirrups in LSD
+        f_y_shear = self.f_yd if self.method == "LSD" else self.f_y
+        self.av_space_min = min(600, 0.5 * self.d_eff_v)
+        self.V_s = self.av_use * f_y_shear * self.d_eff_v / self.av_space if self.av_space > 0 else 0
+        self.pi_V_n = self.pi_v * (self.V_c + self.V_s)
+
+    def _shear_demand(self):
+        if self.beam_b <= 0 or self.d_eff <= 0:
+            return
+        
+        # Check for standard-specific shear logic (e.g. Truss model for LSD 2012)
+        res = self.standard.calc_shear_capacity(self)
+        if res is not None:
+            self.V_c = res["V_c"]
+            self.V_s = res["V_s"]
+            self.pi_V_n = res["V_n"]
+            self.pi_V_c = self.V_c # In LSD, material factors are often already in Vc
+            self.v_theta = res.get("theta", 45)
+            self.v_cot_theta = 1.0 / math.tan(math.radians(self.v_theta)) if self.v_theta > 0 else 0
+            self.z = 0.9 * self.d_eff
+            self.pi_v_s = self.V_s # In LSD stirrup phi is usually already in Vs
+            self.v_details = res.get("details", {})
+            # Delta T check (image p2)
+            self.delta_t = self.v_details.get("delta_t", 0.5 * self.Vu_n * self.v_cot_theta)
+            self.delta_tb = self.v_details.get("delta_tb", (self.M_r - self.Mu_nm) / self.z if self.z > 0 else 0)
+            return
+
+        k_val, f_ctk, Ac_val = self._shear_section
         self.v_details = {
             "k": k_val,
             "rho_l": self.rho_l_tensile,
@@ -282,22 +401,19 @@ class RCSectionAnalyzer:
             "av_use": self.av_use
         }
         
+        f_y_shear = self.f_yd if self.method == "LSD" else self.f_y
         self.av_req = (self.Vu_n - self.pi_V_c) * self.av_space / (f_y_shear * self.d_eff_v * self.pi_v) if f_y_shear * self.d_eff_v * self.pi_v > 0 else 0
         self.av_req = max(0, self.av_req)
-        
-        self.av_space_min = min(600, 0.5 * self.d_eff_v)
-        self.V_s = self.av_use * f_y_shear * self.d_eff_v / self.av_space if self.av_space > 0 else 0
-        self.pi_V_n = self.pi_v * (self.V_c + self.V_s)
 
-    def calc_service(self):
+    def _service_valid(self):
+        return self.as_use > 0 and self.E_c > 0 and self.beam_b > 0
+
+    def _service_geometry(self):
         # Initialize all service attributes to avoid AttributeErrors
-        self.f_s = 0
         self.chi_o = 0
         self.s_use = 0
-        self.s_min = 0
-        self.service_details = {}
         
-        if self.as_use <= 0 or self.E_c <= 0 or self.beam_b <= 0:
+        if not self._service_valid():
             return
         
         self.nr = self.E_s / self.E_c
@@ -308,14 +424,32 @@ class RCSectionAnalyzer:
         k_neutral = math.sqrt((n * rho)**2 + 2 * n * rho) - n * rho
         self.chi_o = k_neutral * self.d_eff
         
-        # Reinforcement stress sigma_s (f_s)
         # z = d - c/3
         z_arm = self.d_eff - self.chi_o / 3
-        self.f_s = self.Ms_nm / (self.as_use * z_arm) if (self.as_use * z_arm) > 0 else 0
+        self._cracked_section = (rho, k_neutral, z_arm)
         
         # Spacing sa = sa,min
         self.s_use = (self.beam_b) / (self.as_num1) if self.as_num1 > 0 else 0
         
+        if self.method != "LSD":
+            # Existing USD bits
+            self.cr_index = self.crack_case
+            self.c_c = self.dc_1 - self.as_dia1 / 2
+            self.k_cr = self.standard.get_k_cr(self.crack_case)
+
+    def _service_stress(self):
+        self.f_s = 0
+        self.s_min = 0
+        self.service_details = {}
+
+        if not self._service_valid():
+            return
+
+        # Reinforcement stress sigma_s (f_s)
+        n = self.nr
+        rho, k_neutral, z_arm = self._cracked_section
+        self.f_s = self.Ms_nm / (self.as_use * z_arm) if (self.as_use * z_arm) > 0 else 0
+        
         # LSD Specific serviceability details
         if self.method == "LSD":
             f_ctm = self.con_material.f_ctm
@@ -410,26 +544,21 @@ class RCSectionAnalyzer:
                 "Ms_knm": self.Ms
             }
         else:
-            # Existing USD bits
-            self.cr_index = self.crack_case
-            self.c_c = self.dc_1 - self.as_dia1 / 2
-            self.k_cr = self.standard.get_k_cr(self.crack_case)
             self.s_min_1 = 375 * (self.k_cr / self.f_s) - 2.5 * self.c_c if self.f_s > 0 else 999
             self.s_min_2 = 300 * (self.k_cr / self.f_s) if self.f_s > 0 else 999
             self.s_min = min(self.s_min_1, self.s_min_2)
 
     def analyze(self):
-        self.calc_moment()
-        self.calc_shear()
-        self.calc_service()
+        self.calc_capacity()
+        self.calc_demand()
         
         calc_data = {
             "f_ck": self.f_ck, "f_y": self.f_y, "b": self.beam_b, "h": self.beam_h,
             "d": self.d_eff, "as_use": self.as_use, "as_req": self.as_req,
             "phi_mn": self.M_r, "mu_nm": self.Mu_nm
         }
-        self.min_rebar_res = self.standard.check_min_rebar(calc_data)
-        self.max_rebar_res = self.standard.check_max_rebar(calc_data)
+        self.min_rebar_res = timed("check_min_rebar", self.standard.check_min_rebar, calc_data)
+        self.max_rebar_res = timed("check_max_rebar", self.standard.check_max_rebar, calc_data)
 
         self.Mr_rate = self.M_r / self.Mu_nm if self.Mu_nm > 0 else 9.99
         self.Vn_rate = self.pi_V_n / self.Vu_n if self.Vu_n > 0 else 9.99
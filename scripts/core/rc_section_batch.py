@@ -0,0 +1,623 @@
+"""
+rc_section_batch.py
+RCSectionAnalyzer의 NumPy 벡터화 버전 — 여러 단면을 한 번에 해석한다.
+- 입력은 열(column) 배열: H, B, dc1~3, dia1~3, num1~3, Mu, Vu, Nu, Ms, av_dia, av_leg, av_space, crack_case
+- 행별 if 분기 대신 mask(np.where)로 계산하며, 결과는 RCSectionAnalyzer.get_summary_result()와 동일하다.
+- 설계기준/재료 의존 계수는 고유한 f_ck, f_y 값마다 한 번씩만 산정한다.
+- 단면 저항(M_r, c, εt, Vc/Vs, 균열단면 형상)은 하중과 무관하므로 같은 단면끼리 묶어 한 번만 계산하고,
+  하중 단계(As_req, 안전율, LSD θ 선정, 철근 응력)만 행별로 계산한다.
+- with_standard()는 입력 단계(파싱된 열, 철근 배치/유효깊이, 단면 묶음)를 공유한 채 설계기준만 바꾼다.
+- flexure_method="fiber"이면 휨강도를 섬유 단면 해석(core.fiber_section)으로 전체 행을 한 번에 구한다.
+  이때는 축력(Nu)과 추가 철근층("layers" 열)도 단면 저항에 들어가므로 단면 묶음 키에 포함된다.
+"""
+import numpy as np
+from core.materials import get_conc_material, get_rebar_material
+from core.phase_timer import phase
+from core.rc_section_analyzer import FLEXURE_METHODS, parse_layers
+from rebar_area_ks import get_korean_rebar
+from standards import get_standard
+
+# _parse_rebar_data()와 동일한 기본값
+COLUMN_DEFAULTS = {
+    "H": 0.0, "B": 0.0,
+    "dc1": 0.0, "dia1": 25, "num1": 0.0,
+    "dc2": 0.0, "dia2": 13, "num2": 0.0,
+    "dc3": 0.0, "dia3": 13, "num3": 0.0,
+    "Mu": 0.0, "Vu": 0.0, "Nu": 0.0, "Ms": 0.0,
+    "av_dia": 16, "av_leg": 0.0, "av_space": 200.0,
+}
+INT_COLUMNS = ("dia1", "dia2", "dia3", "av_dia")
+# 단면 저항 단계(하중 무관)를 결정하는 열 — 이 값과 f_ck, f_y, (USD) crack_case가 같은 행은 같은 단면이다
+SECTION_COLUMNS = ("H", "B", "dc1", "dia1", "num1", "dc2", "dia2", "num2", "dc3", "dia3", "num3",
+                   "av_dia", "av_leg", "av_space")
+# 고유 단면 수가 행 수의 이 비율 이하일 때 단면별로 묶어 계산한다 (묶음/펼침 비용 대비 이득이 있는 구간)
+SECTION_GROUP_RATIO = 0.5
+DEFAULT_CRACK_CASE = "일반환경"
+
+# 균열 검토 표 (KDS 24 14 21 Table 4.2-4 / 4.2-5) : (fs, limit)
+MAX_DIA_TABLE = [(160, 32), (200, 25), (240, 16), (280, 14), (320, 10), (360, 8)]
+MAX_SPACING_TABLE = [(160, 300), (200, 250), (240, 200), (280, 150), (320, 100), (360, 50)]
+
+
+def parse_rows(rows):
+    """
+    UI 행(dict) 리스트를 RCSectionBatch 입력용 열 배열 dict로 변환한다.
+    키 별칭(Dc, as_dia, as_num)과 기본값은 RCSectionAnalyzer._parse_rebar_data와 같다.
+    """
+    def col(getter, cast):
+        return [cast(getter(row)) for row in rows]
+
+    columns = {
+        "H": col(lambda r: r.get("H", 0), float),
+        "B": col(lambda r: r.get("B", 0), float),
+        "dc1": col(lambda r: r.get("dc1", r.get("Dc", 0)), float),
+        "dia1": col(lambda r: r.get("dia1", r.get("as_dia", 25)), int),
+        "num1": col(lambda r: r.get("num1", r.get("as_num", 0)), float),
+    }
+    for key in ("dc2", "dia2", "num2", "dc3", "dia3", "num3", "Mu", "Vu", "Nu", "Ms", "av_dia", "av_leg", "av_space"):
+        cast = int if key in INT_COLUMNS else float
+        default = COLUMN_DEFAULTS[key]
+        columns[key] = col(lambda r, k=key, d=default: r.get(k, d), cast)
+
+    columns = {k: np.array(v, dtype=int if k in INT_COLUMNS else float) for k, v in columns.items()}
+    columns["crack_case"] = np.array([r.get("crack_case", DEFAULT_CRACK_CASE).strip() for r in rows], dtype=object)
+    if any("layers" in r for r in rows):
+        rebar = get_korean_rebar()
+        columns["layers"] = np.empty(len(rows), dtype=object)
+        columns["layers"][:] = [parse_layers(r.get("layers"), rebar) for r in rows]
+    return columns
+
+
+def factorize(values):
+    """values의 (고유값 리스트, 행별 번호). object 배열(문자열)은 정렬 대신 dict로 번호를 매긴다."""
+    values = np.asarray(values)
+    if values.dtype == object:
+        index = {}
+        codes = np.fromiter((index.setdefault(v, len(index)) for v in values.ravel().tolist()),
+                            dtype=np.intp, count=values.size)
+        return list(index), codes
+    uniq, inv = np.unique(values, return_inverse=True)
+    return uniq.tolist(), inv.reshape(-1)
+
+
+def map_unique(values, func):
+    """values의 고유값마다 func를 한 번씩만 호출하여 행별 결과 배열을 만든다. (tuple 반환 시 (n, k))"""
+    uniq, codes = factorize(values)
+    mapped = np.array([func(v) for v in uniq], dtype=float)
+    return mapped[codes]
+
+
+def _table_limit(fs, table):
+    """균열 검토 표의 구간별 선형보간 (calc_service의 get_max_*_limit과 동일한 식/순서)."""
+    lo_val = float(table[0][1])
+    hi_val = float(table[-1][1])
+    result = np.full(fs.shape, hi_val)
+    done = np.zeros(fs.shape, dtype=bool)
+    for (s1, l1), (s2, l2) in zip(table[:-1], table[1:]):
+        in_seg = ~done & (s1 <= fs) & (fs <= s2)
+        result = np.where(in_seg, l1 + (fs - s1)*(l2 - l1)/(s2 - s1), result)
+        done |= in_seg
+    result = np.where(fs <= table[0][0], lo_val, result)
+    return np.where(fs >= table[-1][0], hi_val, result)
+
+
+class RCSectionBatch:
+    """
+    RCSectionAnalyzer와 같은 해석을 열 배열 단위로 수행하는 배치 엔진.
+    f_ck, f_y는 스칼라 또는 행 수와 같은 길이의 배열을 받는다.
+    columns["layers"] (선택): 행별 추가 철근층 ((압축연단에서의 깊이, 단면적), ...) — parse_rows가 만든다.
+    """
+    def __init__(self, f_ck, f_y, standard_name, columns, phi_f=0.85, phi_v=None, flexure_method="block"):
+        if flexure_method not in FLEXURE_METHODS:
+            raise ValueError(f"Unknown flexure_method: {flexure_method} (expected one of {', '.join(FLEXURE_METHODS)})")
+        self.flexure_method = flexure_method
+        n = max([np.size(v) for v in columns.values()] + [np.size(f_ck), np.size(f_y), 1])
+        self.n = n
+
+        def full(value, dtype=float):
+            return np.array(np.broadcast_to(np.asarray(value, dtype=dtype), (n,)))
+
+        self.f_ck = full(f_ck)
+        self.f_y = full(f_y)
+        self.rebar = get_korean_rebar()
+        self.E_s = float(get_rebar_material(float(self.f_y[0])).E_s)
+
+        # Dimensions / Loads
+        for key, default in COLUMN_DEFAULTS.items():
+            dtype = int if key in INT_COLUMNS else float
+            setattr(self, f"_{key}", full(columns.get(key, default), dtype))
+        self.beam_h = self._H
+        self.beam_b = self._B
+        self.Mu, self.Vu, self.Nu, self.Ms = self._Mu, self._Vu, self._Nu, self._Ms
+        self.Mu_nm = self.Mu * 1e6
+        self.Vu_n = self.Vu * 1e3
+        self.Ms_nm = self.Ms * 1e6
+
+        crack_case = columns.get("crack_case", DEFAULT_CRACK_CASE)
+        self.crack_case = np.array(np.broadcast_to(np.asarray(crack_case, dtype=object), (n,)))
+        layers = columns.get("layers")
+        self.extra_layers = None if layers is None else np.array(np.broadcast_to(layers, (n,)))
+
+        self._parse_rebar_data()
+        # 설계기준과 무관한 입력 단계 — with_standard()가 공유한다
+        self._group_cache = {}
+        self._input_keys = tuple(self.__dict__)
+        self._set_standard(standard_name, phi_f, phi_v)
+
+    def _set_standard(self, standard_name, phi_f, phi_v):
+        """설계기준/강도감소계수에 따라 달라지는 계수."""
+        self.standard_name = standard_name
+        self.standard = get_standard(standard_name)
+        self.method = self.standard.get_concrete_method()  # "USD" or "LSD"
+
+        std_phi_c, std_phi_s = self.standard.get_material_factors()
+        if self.method == "LSD":
+            self.phi_c = float(phi_f) if phi_f is not None else std_phi_c
+            self.phi_s = float(phi_v) if phi_v is not None else std_phi_s
+            self.pi_f = 1.0
+            self.pi_v = 1.0
+        else:
+            self.phi_c, self.phi_s = std_phi_c, std_phi_s
+            self.pi_f = float(phi_f)
+            self.pi_v = float(phi_v) if phi_v is not None else self.standard.get_phi_v()
+
+        self.alpha_fac, self.beta_fac = map_unique(self.f_ck, self.standard.get_flexure_factors).T
+        self.alpha_cc = self.standard.get_alpha_cc()
+        self.beta_1 = map_unique(self.f_ck, self.standard.get_beta_1)
+
+        # Design Strengths
+        self.f_cd = self.f_ck * self.phi_c * self.alpha_cc
+        self.f_yd = self.f_y * self.phi_s
+
+        method = self.method
+        con_props = map_unique(self.f_ck, lambda f: self._con_properties(get_conc_material(f, method=method)))
+        self.E_c, self.f_ctm, self.f_ctk, self.con_eps_cu, self.con_n_eps, self.con_eps_co = con_props.T
+
+    def with_standard(self, standard_name, phi_f=0.85, phi_v=None):
+        """
+        입력 단계(열 배열, 철근 배치/유효깊이, 단면 묶음 해시)를 공유하고 설계기준만 바꾼 새 배치 (해석 전 상태).
+        같은 단면을 여러 설계기준으로 검토할 때 파싱과 형상 계산을 한 번만 한다.
+        """
+        other = object.__new__(type(self))
+        other.__dict__.update((key, self.__dict__[key]) for key in self._input_keys)
+        other._set_standard(standard_name, phi_f, phi_v)
+        return other
+
+    @staticmethod
+    def _con_properties(con):
+        return (con.E_c, getattr(con, 'f_ctm', 0.0), getattr(con, 'f_ctk', 0.0), con.eps_cu,
+                con.n_eps, con.eps_co)
+
+    @classmethod
+    def from_rows(cls, f_ck, f_y, standard_name, rows, phi_f=0.85, phi_v=None, flexure_method="block"):
+        return cls(f_ck, f_y, standard_name, parse_rows(rows), phi_f=phi_f, phi_v=phi_v,
+                   flexure_method=flexure_method)
+
+    def _parse_rebar_data(self):
+        area = self.rebar.get_area_array
+        self.dc_1, self.as_dia1, self.as_num1 = self._dc1, self._dia1, self._num1
+        self.dc_2, self.as_dia2, self.as_num2 = self._dc2, self._dia2, self._num2
+        self.dc_3, self.as_dia3, self.as_num3 = self._dc3, self._dia3, self._num3
+        self.as_use1 = area(self.as_dia1) * self.as_num1
+        self.as_use2 = area(self.as_dia2) * self.as_num2
+        self.as_use3 = area(self.as_dia3) * self.as_num3
+
+        # Total Area and Centroid Calculation
+        self.as_use = self.as_use1 + self.as_use2 + self.as_use3
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centroid = (self.as_use1 * self.dc_1 + self.as_use2 * self.dc_2 + self.as_use3 * self.dc_3) / self.as_use
+        self.d_c = np.where(self.as_use > 0, centroid, np.where(self.dc_1 > 0, self.dc_1, 0.0))
+
+        self.d_eff = self.beam_h - self.d_c
+        self.as_tensile = self.as_use
+        self.d_tensile = self.d_eff
+        self.dt = self.beam_h - self.dc_1
+
+        bd = self.beam_b * self.d_tensile
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.rho_l_tensile = np.where(bd > 0, self.as_tensile / bd, 0.0)
+        self.rho_l_tensile = np.minimum(self.rho_l_tensile, 0.02)
+
+        # Stirrup
+        self.av_dia = self._av_dia
+        self.av_leg = self._av_leg
+        self.av_space = self._av_space
+        self.av_use = area(self.av_dia) * self.av_leg
+
+    # ── 단면 그룹 ─────────────────────────────────────────────────────────────
+
+    def _section_groups(self):
+        """
+        단면 저항 단계의 입력이 같은 행끼리 묶는다. (대표 행 번호, 행별 그룹 번호)
+        열들을 64비트 해시 하나로 합쳐 1차원 np.unique만 수행하고, 해시 충돌이 있으면 묶지 않는다 (None, None).
+        """
+        # 환경조건(crack_case)은 USD 계열의 Kcr에만 쓰인다
+        use_crack_case = self.method != "LSD"
+        if use_crack_case not in self._group_cache:
+            self._group_cache[use_crack_case] = self._group_key(use_crack_case)
+        return self._group_cache[use_crack_case]
+
+    def _group_key(self, use_crack_case):
+        columns = [self.f_ck, self.f_y] + [getattr(self, f"_{key}") for key in SECTION_COLUMNS]
+        if use_crack_case:
+            columns.append(factorize(self.crack_case)[1].astype(float))
+        if self.flexure_method == "fiber":
+            columns.append(self._Nu)
+            if self.extra_layers is not None:
+                columns.append(factorize(self.extra_layers)[1].astype(float))
+        columns = [np.ascontiguousarray(col, dtype=float) for col in columns]
+        varying = [col for col in columns if col.size and col.min() != col.max()]
+        if not varying:
+            return np.zeros(1, dtype=np.intp), np.zeros(self.n, dtype=np.intp)
+
+        key = np.zeros(self.n, dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            for col in varying:
+                key = key * np.uint64(0x100000001B3) ^ col.view(np.uint64)
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        representative = first[inverse]
+        if any(not np.array_equal(col, col[representative]) for col in varying):
+            return None, None
+        return first, inverse
+
+    def _take(self, index):
+        """index 행만 가진 배치 (행 길이 배열은 잘라내고, 나머지 속성은 공유)."""
+        sub = object.__new__(type(self))
+        for key, value in self.__dict__.items():
+            if isinstance(value, np.ndarray) and value.shape[:1] == (self.n,):
+                value = value[index]
+            sub.__dict__[key] = value
+        sub.n = len(index)
+        sub._group_cache = {}
+        return sub
+
+    def calc_capacity(self, group_sections=None):
+        """
+        하중과 무관한 단면 저항 단계. 고유 단면 수가 행 수의 SECTION_GROUP_RATIO 이하이면
+        (또는 group_sections=True) 고유 단면에서만 계산하여 각 행으로 펼친다.
+        """
+        first, inverse = self._section_groups() if group_sections is not False else (None, None)
+        if first is None or (group_sections is None and len(first) > SECTION_GROUP_RATIO * self.n):
+            self._capacity_steps()
+            self.section_count = self.n if first is None else len(first)
+            return self
+
+        sections = self._take(first)
+        before = dict(sections.__dict__)
+        sections._capacity_steps()
+        for key, value in sections.__dict__.items():
+            if key in before and before[key] is value:
+                continue
+            if isinstance(value, np.ndarray) and value.shape[:1] == (sections.n,):
+                value = value[inverse]
+            self.__dict__[key] = value
+        self.section_count = len(first)
+        return self
+
+    def _capacity_steps(self):
+        with phase("batch.calc_moment.capacity"):
+            self._moment_capacity()
+        with phase("batch.calc_shear.capacity"):
+            self._shear_capacity()
+        with phase("batch.calc_service.capacity"):
+            self._service_geometry()
+
+    def calc_demand(self):
+        with phase("batch.calc_moment.demand"):
+            self._moment_demand()
+        with phase("batch.calc_shear.demand"):
+            self._shear_demand()
+        with phase("batch.calc_service.demand"):
+            self._service_stress()
+        return self
+
+    def calc_moment(self):
+        self._moment_capacity()
+        self._moment_demand()
+
+    def calc_shear(self):
+        self._shear_capacity()
+        self._shear_demand()
+
+    def calc_service(self):
+        self._service_geometry()
+        self._service_stress()
+
+    # ── 휨 ───────────────────────────────────────────────────────────────────
+
+    def _moment_capacity(self):
+        B, d = self.beam_b, self.d_eff
+        valid = (self.beam_h > 0) & (B > 0) & (d > 0)
+        self.flexure_valid = valid
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.epsilon_y = self.f_y / self.E_s
+            if self.flexure_method == "fiber":
+                tension_force, c, epsilon_t, M_n = self._fiber_capacity()
+            else:
+                tension_force = self.as_use * self.f_yd
+                c = np.where(self.f_cd * B > 0, tension_force / (self.alpha_fac * self.f_cd * B), 0.0)
+                epsilon_t = np.where(c > 0, 0.003 * (self.dt - c) / c, 0.0)
+                M_n = self.as_use * self.f_yd * (d - self.beta_fac * c)
+
+            # Strength reduction factor for flexure (UI override has priority in USD)
+            if self.method == "USD" and self.pi_f > 0:
+                pi_f_r = np.full(self.n, self.pi_f)
+            else:
+                pi_f_r = self.standard.get_phi_f_array(epsilon_t, self.epsilon_y)
+
+            # Reinforcement ratio
+            bd = B * d
+            self.lo_min_1 = 1.4 / self.f_y
+            self.lo_min_2 = 0.25 * np.sqrt(self.f_ck) / self.f_y
+            self.lo_min = np.maximum(self.lo_min_1, self.lo_min_2)
+            self.lo_bal = (0.85 * self.beta_1 * self.f_ck / self.f_y) * (600 / (600 + self.f_y))
+            self.lo_max = 0.75 * self.lo_bal
+            self.lo_use = np.where(bd > 0, self.as_use / bd, 0.0)
+
+            self.as_min_1 = self.lo_min_1 * bd
+            self.as_min_2 = self.lo_min_2 * bd
+            self.as_shrink = np.where(valid, 0.0018 * B * self.beam_h, 0.0)
+            self.as_max_val = np.where(valid, 0.04 * bd, 999999.0)
+
+            # Resistant Moment
+            M_r = pi_f_r * M_n
+
+        # Rows rejected by the scalar early return keep the analyzer defaults
+        self.tension_force = np.where(valid, tension_force, 0.0)
+        self.c = np.where(valid, c, 0.0)
+        self.a = self.c * 2 * self.beta_fac
+        self.compression_force = np.where(valid, self.alpha_fac * self.f_cd * B, 0.0)
+        self.epsilon_t = np.where(valid, epsilon_t, 0.0)
+        self.pi_f_r = np.where(valid, pi_f_r, 0.85)
+        self.M_r = np.where(valid, M_r, 0.0)
+
+        if self.method == "LSD":
+            self.eps_cu = np.where(valid, self.con_eps_cu, 0.0033)
+            self.delta_redist = 1.0
+            self.c_max = np.where(valid, (self.delta_redist - 0.6) * d, 0.0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.eps_s = np.where(valid & (self.c > 0), self.eps_cu * (d - self.c) / self.c, 0.0)
+            self.eps_yd = np.where(valid, self.f_yd / self.E_s, 0.0)
+
+    def _fiber_capacity(self):
+        """섬유 단면 해석 (Nu, 추가 철근층 포함): (인장력, c, εt, 공칭 휨강도 M_n)."""
+        from core.fiber_section import pad_layers, section_capacity
+        extra = (None, None) if self.extra_layers is None else pad_layers(self.extra_layers, self.n)
+        fiber = section_capacity(self, self.con_n_eps, self.con_eps_co, self.con_eps_cu, *extra)
+        self.fiber_converged = fiber["converged"]
+        return fiber["tension_force"], fiber["c"], -fiber["layer_strain"][:, 0], fiber["M"]
+
+    def _moment_demand(self):
+        B, d = self.beam_b, self.d_eff
+        valid = self.flexure_valid
+        pi_f_r = self.pi_f_r
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Required Rebar: K * As^2 - (phi * f_yd * d) * As + Mu = 0
+            k_div = self.alpha_fac * self.f_cd * B
+            K_val = np.where(k_div > 0, (pi_f_r * self.f_yd**2 * self.beta_fac) / k_div, 0.0)
+            B_q = -(pi_f_r * self.f_yd * d)
+            det = B_q**2 - 4 * K_val * self.Mu_nm
+            root = (-B_q - np.sqrt(det)) / (2 * K_val)
+            as_req = np.where(K_val > 0, np.where(det >= 0, root, 9999.0), 0.0)
+
+            bd = B * d
+            self.lo_min_3 = np.where(bd > 0, (4/3) * (as_req / bd), 0.0)
+            self.as_min_3 = (4/3) * as_req
+            self.as_min_val = np.where(valid, np.minimum(np.maximum(self.as_min_1, self.as_min_2), self.as_min_3), 0.0)
+            M_sf = np.where(self.Mu_nm > 0, self.M_r / self.Mu_nm, 0.0)
+
+        self.as_req = np.where(valid, as_req, 0.0)
+        self.M_sf = np.where(valid, M_sf, 0.0)
+
+    # ── 전단 ─────────────────────────────────────────────────────────────────
+
+    def _shear_capacity(self):
+        B, d = self.beam_b, self.d_eff
+        valid = (B > 0) & (d > 0)
+        self.shear_valid = valid
+        self.d_eff_v = d
+
+        # 트러스 모델(LSD)은 Vu에 따라 θ를 정하므로 전체가 하중 단계에서 계산된다
+        if self.standard.has_shear_model():
+            return
+
+        zeros = np.zeros(self.n)
+        self.z = 0.9 * d
+        self.v_theta = np.full(self.n, 45.0)
+        self.v_cot_theta = np.ones(self.n)
+        self.delta_t = zeros
+        self.delta_tb = zeros
+        self.v_details = {}
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_c_shear = self.f_cd if self.method == "LSD" else self.f_ck
+            V_c = (np.sqrt(f_c_shear) / 6) * B * d
+            pi_V_c = self.pi_v * V_c
+
+            f_y_shear = self.f_yd if self.method == "LSD" else self.f_y
+            # get_vs_max is linear in b*d for every standard: evaluate once per f_ck
+            V_s_max = map_unique(self.f_ck, lambda f: self.standard.get_vs_max(f, 1.0, 1.0)) * B * d
+
+            av_space_min = np.minimum(600, 0.5 * d)
+            V_s = np.where(self.av_space > 0, self.av_use * f_y_shear * d / self.av_space, 0.0)
+
+        self.V_c = np.where(valid, V_c, 0.0)
+        self.pi_V_c = np.where(valid, pi_V_c, 0.0)
+        self.V_s_max = np.where(valid, V_s_max, 0.0)
+        self.av_space_min = np.where(valid, av_space_min, 0.0)
+        self.V_s = np.where(valid, V_s, 0.0)
+        self.pi_V_n = self.pi_v * (self.V_c + self.V_s)
+
+    def _shear_demand(self):
+        d = self.d_eff
+        valid = self.shear_valid
+        zeros = np.zeros(self.n)
+
+        res = self.standard.calc_shear_capacity_array(self)
+        if res is not None:
+            self.V_c = np.where(valid, res["V_c"], 0.0)
+            self.V_s = np.where(valid, res["V_s"], 0.0)
+            self.pi_V_n = np.where(valid, res["V_n"], 0.0)
+            self.pi_V_c = self.V_c
+            self.v_theta = np.where(valid, res["theta"], 0.0)
+            with np.errstate(divide='ignore'):
+                self.v_cot_theta = np.where(self.v_theta > 0, 1.0 / np.tan(np.radians(self.v_theta)), 0.0)
+            self.z = 0.9 * d
+            self.v_details = res["details"]
+            self.delta_t = np.where(valid, self.v_details["delta_t"], 0.0)
+            self.delta_tb = np.where(valid, self.v_details["delta_tb"], 0.0)
+            self.av_req = zeros
+            self.av_space_min = zeros
+            self.V_s_max = zeros
+            return
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f_y_shear = self.f_yd if self.method == "LSD" else self.f_y
+            denom = f_y_shear * d * self.pi_v
+            av_req = np.where(denom > 0, (self.Vu_n - self.pi_V_c) * self.av_space / denom, 0.0)
+            av_req = np.maximum(0, av_req)
+        self.av_req = np.where(valid, av_req, 0.0)
+
+    # ── 사용성 ───────────────────────────────────────────────────────────────
+
+    def _service_geometry(self):
+        B, H, d = self.beam_b, self.beam_h, self.d_eff
+        valid = (self.as_use > 0) & (self.E_c > 0) & (B > 0)
+        self.service_valid = valid
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.nr = self.E_s / self.E_c
+            n = self.nr
+            rho = np.where(B * d > 0, self.as_use / (B * d), 0.0)
+            k_neutral = np.sqrt((n * rho)**2 + 2 * n * rho) - n * rho
+            chi_o = k_neutral * d
+            self.z_arm = d - chi_o / 3
+            s_use = np.where(self.as_num1 > 0, B / self.as_num1, 0.0)
+
+        self.chi_o = np.where(valid, chi_o, 0.0)
+        self.s_use = np.where(valid, s_use, 0.0)
+
+        if self.method == "LSD":
+            self.k_scale = np.where(H > 300, np.maximum(0.65, 1.0 - (H - 300) * (1.0 - 0.65) / (800 - 300)), 1.0)
+            self.Act = 0.5 * B * H
+        else:
+            self.c_c = self.dc_1 - self.as_dia1 / 2
+            self.k_cr = map_unique(self.crack_case, self.standard.get_k_cr)
+
+    def _service_stress(self):
+        B, H, d = self.beam_b, self.beam_h, self.d_eff
+        valid = self.service_valid
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            az = self.as_use * self.z_arm
+            f_s = np.where(az > 0, self.Ms_nm / az, 0.0)
+        self.f_s = np.where(valid, f_s, 0.0)
+
+        if self.method == "LSD":
+            f_ctm = self.f_ctm
+            k_scale, Act = self.k_scale, self.Act
+            with np.errstate(divide='ignore', invalid='ignore'):
+                # kc calculation (KDS 24 14 21, 4.2.3.1 (1))
+                sigma_n = np.where(B * H > 0, (self.Nu * 1e3) / (B * H), 0.0)
+                h_star = 1000.0
+                k1 = np.where(self.Nu > 0, 1.5, np.where(H > 0, (2 * h_star) / (3 * H), 1.0))
+                divisor = k1 * (H / h_star) * f_ctm
+                kc_axial = np.where(divisor != 0, 0.4 * (1 - sigma_n / divisor), 0.4)
+                kc_axial = np.minimum(1.0, np.maximum(0.4, kc_axial))
+                kc = np.where(np.abs(self.Nu) < 1e-6, 0.4, kc_axial)
+
+                as_min_lsd = np.where(self.f_y > 0, (kc * k_scale * Act * f_ctm) / self.f_y, 0.0)
+
+            max_dia_limit = _table_limit(self.f_s, MAX_DIA_TABLE)
+            s_table_limit = _table_limit(self.f_s, MAX_SPACING_TABLE)
+            sa_limit = np.where(d > 0, np.minimum(3 * d, s_table_limit), s_table_limit)
+
+            # Rows skipped by the scalar early return behave like an empty service_details
+            self.as_min_lsd = np.where(valid, as_min_lsd, 0.0)
+            self.fsa = np.where(valid, 0.8 * self.f_y, 999.0)
+            self.dia_ok = ~valid | (self.as_dia1 <= max_dia_limit)
+            self.s_min = np.where(valid, sa_limit, 0.0)
+            self.service_details = {
+                "kc": kc, "k_scale": k_scale, "Act": Act, "fctm": f_ctm,
+                "max_dia_limit": max_dia_limit, "s_table_limit": s_table_limit, "sa_limit": sa_limit,
+            }
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.s_min_1 = np.where(self.f_s > 0, 375 * (self.k_cr / self.f_s) - 2.5 * self.c_c, 999.0)
+                self.s_min_2 = np.where(self.f_s > 0, 300 * (self.k_cr / self.f_s), 999.0)
+            self.s_min = np.where(valid, np.minimum(self.s_min_1, self.s_min_2), 0.0)
+
+    def analyze(self, group_sections=None):
+        """
+        전체 해석. 단면 저항 단계는 같은 단면끼리 묶어 한 번씩만 계산한다 (calc_capacity 참고).
+        group_sections: None(자동), True(항상 묶음), False(행별 계산)
+        """
+        self.calc_capacity(group_sections)
+        self.calc_demand()
+
+        calc_data = {
+            "f_ck": self.f_ck, "f_y": self.f_y, "b": self.beam_b, "h": self.beam_h,
+            "d": self.d_eff, "as_use": self.as_use, "as_req": self.as_req,
+            "phi_mn": self.M_r, "mu_nm": self.Mu_nm, "beta_1": self.beta_1
+        }
+        with phase("batch.check_min_rebar"):
+            self.min_rebar_ok = np.asarray(self.standard.check_min_rebar_array(calc_data)["is_ok"], dtype=bool)
+        with phase("batch.check_max_rebar"):
+            self.max_rebar_ok = np.asarray(self.standard.check_max_rebar_array(calc_data)["is_ok"], dtype=bool)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.Mr_rate = np.where(self.Mu_nm > 0, self.M_r / self.Mu_nm, 9.99)
+            self.Vn_rate = np.where(self.Vu_n > 0, self.pi_V_n / self.Vu_n, 9.99)
+        self.v_reinf_needed = self.Vu_n > self.pi_V_c
+
+        if self.method == "LSD":
+            crack_ok = ((self.as_use >= self.as_min_lsd) & (self.f_s <= self.fsa)
+                        & self.dia_ok & (self.s_use <= self.s_min))
+        else:
+            crack_ok = self.s_use <= self.s_min
+        self.has_rebar = self.as_use > 0
+        self.crack_ok = crack_ok & self.has_rebar
+
+        self.s_detailing_max = np.where(self.has_rebar, np.minimum(2 * self.beam_h, 250), 250.0)
+        self.s_detailing_ok_mask = self.has_rebar & (self.s_use <= self.s_detailing_max)
+        return self
+
+    def get_summary_results(self, index=None):
+        """
+        RCSectionAnalyzer.get_summary_result()와 같은 형식의 dict 리스트를 반환한다.
+        index(행 번호 배열)를 주면 해당 행만 만든다.
+        """
+        if self.method == "LSD":
+            ret_phi_f = np.full(self.n, self.phi_c)
+            ret_phi_v = self.phi_s
+        else:
+            ret_phi_f = self.pi_f_r
+            ret_phi_v = self.pi_v
+        phi_v = round(ret_phi_v, 3)
+
+        rows = slice(None) if index is None else np.asarray(index, dtype=np.intp)
+        arrays = (self.as_req, self.as_use, self.M_r, self.Mr_rate, self.pi_V_n, self.Vn_rate, self.v_reinf_needed,
+                  self.f_s, self.has_rebar, self.crack_ok, ret_phi_f, self.min_rebar_ok, self.max_rebar_ok)
+        columns = zip(*(values[rows].tolist() for values in arrays))
+        results = []
+        for as_req, as_use, M_r, Mr_rate, pi_V_n, Vn_rate, reinf, f_s, has_rebar, crack_ok, phi_f, min_ok, max_ok in columns:
+            results.append({
+                "as_req": round(as_req, 1),
+                "as_used": round(as_use, 1),
+                "as_ratio": round(as_use / as_req, 3) if as_req > 0 else 9.99,
+                "Mr": round(M_r / 1e6, 1),
+                "Mr_rate": round(Mr_rate, 3),
+                "Vn": round(pi_V_n / 1e3, 1),
+                "Vn_rate": round(Vn_rate, 3),
+                "V_reinf": "필요" if reinf else "불필요",
+                "fs": round(f_s, 1),
+                "crack_status": ("OK" if crack_ok else "NG") if has_rebar else "-",
+                "phi_f": round(phi_f, 3),
+                "phi_v": phi_v,
+                "min_rebar_ok": min_ok,
+                "max_rebar_ok": max_ok
+            })
+        return results
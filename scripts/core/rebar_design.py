@@ -0,0 +1,163 @@
+"""
+rebar_design.py
+휨 인장철근 자동 설계 — 모든 검토(Mr_rate ≥ 1, 최소/최대 철근비, 균열)를 만족하는 최소 철근량 배근을 찾는다.
+- 후보: KoreanRebar 규격 직경 × 개수 × 최대 3단. 같은 직경으로 1단부터 채우며(단마다 2개 이상),
+  한 단의 개수는 폭 B 안의 수평 순간격 max(25, db, 4/3·굵은골재 최대치수)로 제한한다.
+  각 단 중심 위치: dc1 = 피복 + 스터럽 직경 + db/2, 다음 단은 순간격 max(25, db)만큼 아래.
+- 후보는 철근량(As) 오름차순으로 정렬하고, 가장 깊은 배근의 유효깊이로 구한 As_req로 하한을 잘라낸다.
+- 단면마다 DESIGN_WINDOW개씩 후보를 모아 모든 단면을 하나의 RCSectionBatch로 검토하고,
+  처음 통과한 후보(= 최소 철근량)를 채택한다. 통과 후보가 없는 단면만 다음 구간으로 넘어간다.
+"""
+from functools import lru_cache
+
+import numpy as np
+from core.materials import get_rebar_material
+from core.rc_section_batch import RCSectionBatch, parse_rows
+from rebar_area_ks import get_korean_rebar
+from standards import get_standard
+
+# 후보 직경 (mm)
+DESIGN_DIAMETERS = (13, 16, 19, 22, 25, 29, 32, 35)
+MAX_LAYERS = 3
+# 스터럽 바깥면까지의 피복 (mm), 굵은골재 최대치수 (mm)
+DEFAULT_COVER = 50.0
+DEFAULT_AGGREGATE = 25.0
+# 철근 순간격 최소값 (mm) — 수평/단 사이 공통
+MIN_CLEAR_SPACING = 25.0
+
+# 한 번의 배치 검토에서 단면마다 보는 후보 수
+DESIGN_WINDOW = 64
+# As_req 하한에 곱하는 여유 (유효깊이/중립축 차이로 하한이 실제보다 커지지 않도록)
+AS_BOUND_FACTOR = 0.9
+# 인장지배 φ를 구할 때 쓰는 충분히 큰 순인장변형률
+TENSION_CONTROLLED_STRAIN = 1.0
+
+LAYOUT_KEYS = ("dc1", "dia1", "num1", "dc2", "dia2", "num2", "dc3", "dia3", "num3")
+
+
+@lru_cache(maxsize=256)
+def rebar_candidates(beam_b, av_dia, cover, diameters=DESIGN_DIAMETERS, max_layers=MAX_LAYERS,
+                     aggregate=DEFAULT_AGGREGATE):
+    """
+    폭 beam_b에 들어가는 배근 후보 (As, 철근 개수, 단 수 오름차순).
+    반환: {"as_use": (n,), "dc1".."num3": (n,)} — 같은 인자는 다시 만들지 않는다 (배열은 읽기 전용).
+    """
+    rebar = get_korean_rebar()
+    inner = beam_b - 2 * (cover + av_dia)
+    rows = []
+    for dia in diameters:
+        clear = max(MIN_CLEAR_SPACING, dia, 4 / 3 * aggregate)
+        per_layer = int((inner + clear) // (dia + clear)) if inner > 0 else 0
+        if per_layer < 2:
+            continue
+        area = rebar.get_area(dia)
+        pitch = dia + max(MIN_CLEAR_SPACING, dia)
+        for total in range(2, per_layer * max_layers + 1):
+            layers = [min(per_layer, total - per_layer * k) for k in range(max_layers) if total > per_layer * k]
+            if any(count < 2 for count in layers):
+                continue
+            dc = [cover + av_dia + dia / 2 + pitch * k for k in range(len(layers))]
+            layout = []
+            for k in range(MAX_LAYERS):
+                layout += [dc[k], dia, layers[k]] if k < len(layers) else [0.0, 13, 0]
+            rows.append((area * total, total, len(layers), *layout))
+    rows.sort(key=lambda r: r[:3])
+    table = np.array(rows, dtype=float).reshape(len(rows), 3 + len(LAYOUT_KEYS))
+    candidates = {"as_use": table[:, 0]}
+    for j, key in enumerate(LAYOUT_KEYS):
+        candidates[key] = table[:, 3 + j].astype(int) if key.startswith("dia") else table[:, 3 + j]
+    for values in candidates.values():
+        values.flags.writeable = False
+    return candidates
+
+
+def _section_options(row, cover, aggregate):
+    return (float(row.get("B", 0)), int(row.get("av_dia", 16)), float(row.get("cover", cover)),
+            float(row.get("aggregate", aggregate)))
+
+
+def _as_lower_bounds(f_ck, f_y, standard_name, columns, phi_f, phi_v, shallowest_dc, flexure_method="block"):
+    """
+    가장 깊은 배근(dc1 = shallowest_dc)에서의 As_req × AS_BOUND_FACTOR (단면이 부족해 해가 없으면 0).
+    철근이 없는 probe는 εt = 0이라 φ를 εt로 정하면(USD, phi_f = 0) 압축지배 φ가 나와 하한이 너무 커진다.
+    이때는 가능한 최대값인 인장지배 φ로 As_req를 구한다.
+    As_req는 응력블록 식이므로, 섬유 해석에서 축압축(Nu > 0)이나 추가 철근층이 휨강도를 키우는 단면은 하한 0.
+    """
+    probe = dict(columns, dc1=shallowest_dc)
+    for key in ("num1", "num2", "num3"):
+        probe[key] = np.zeros(len(shallowest_dc))
+    standard = get_standard(standard_name)
+    if standard.get_concrete_method() == "USD" and not phi_f > 0:
+        phi_f = float(standard.get_phi_f_array(np.array([TENSION_CONTROLLED_STRAIN]), np.array([f_y / get_rebar_material(float(f_y)).E_s]))[0])
+    batch = RCSectionBatch(f_ck, f_y, standard_name, probe, phi_f=phi_f, phi_v=phi_v)
+    batch.calc_capacity(group_sections=False)
+    batch.calc_demand()
+    bounds = np.where(batch.as_req < 9999.0, batch.as_req * AS_BOUND_FACTOR, 0.0)
+    if flexure_method == "fiber":
+        helped = columns["Nu"] > 0
+        if "layers" in columns:
+            helped = helped | np.array([len(layers) > 0 for layers in columns["layers"]], dtype=bool)
+        bounds = np.where(helped, 0.0, bounds)
+    return bounds
+
+
+def design_rebar(f_ck, f_y, standard_name, rows, phi_f=0.85, phi_v=None, diameters=DESIGN_DIAMETERS,
+                 max_layers=MAX_LAYERS, cover=DEFAULT_COVER, aggregate=DEFAULT_AGGREGATE, window=None,
+                 flexure_method="block"):
+    """
+    rows(단면, 하중 포함)마다 최소 철근량 배근을 찾는다.
+    반환: [{"found", "layout"(dc1~num3), "as_used", "checked"(검토한 후보 수), "result"(calc 요약 결과)}]
+    단면 행의 "cover", "aggregate" 값이 있으면 기본값 대신 쓴다.
+    """
+    if len(rows) == 0:
+        return []
+    window = window or DESIGN_WINDOW
+    diameters = tuple(sorted(int(d) for d in diameters))
+    columns = parse_rows(rows)
+    options = [_section_options(row, cover, aggregate) for row in rows]
+    tables = [rebar_candidates(b, av_dia, c, diameters, max_layers, agg) for b, av_dia, c, agg in options]
+
+    shallowest = np.array([c + av_dia + diameters[0] / 2 for _, av_dia, c, _ in options])
+    bounds = _as_lower_bounds(f_ck, f_y, standard_name, columns, phi_f, phi_v, shallowest, flexure_method)
+    starts = [int(np.searchsorted(t["as_use"], bound, side="left")) for t, bound in zip(tables, bounds)]
+
+    results = [{"found": False, "layout": None, "as_used": 0.0, "checked": 0, "result": None} for _ in rows]
+    pending = [s for s in range(len(rows)) if starts[s] < len(tables[s]["as_use"])]
+    while pending:
+        spans = [(s, starts[s], min(starts[s] + window, len(tables[s]["as_use"]))) for s in pending]
+        counts = np.array([hi - lo for _, lo, hi in spans], dtype=np.intp)
+        sections = np.array([s for s, _, _ in spans], dtype=np.intp)
+        batch_columns = {key: values[np.repeat(sections, counts)] for key, values in columns.items()}
+        for key in LAYOUT_KEYS:
+            batch_columns[key] = np.concatenate([tables[s][key][lo:hi] for s, lo, hi in spans])
+        batch = RCSectionBatch(f_ck, f_y, standard_name, batch_columns, phi_f=phi_f, phi_v=phi_v,
+                               flexure_method=flexure_method)
+        batch.analyze(group_sections=False)
+        ok = (batch.Mr_rate >= 1.0) & batch.min_rebar_ok & batch.max_rebar_ok & batch.crack_ok
+
+        offset = 0
+        next_pending, found = [], []
+        for (s, lo, hi), n in zip(spans, counts.tolist()):
+            passed = np.flatnonzero(ok[offset:offset + n])
+            if len(passed):
+                k = int(passed[0])
+                table = tables[s]
+                results[s].update(
+                    found=True,
+                    layout={key: table[key][lo + k].item() for key in LAYOUT_KEYS},
+                    as_used=float(table["as_use"][lo + k]),
+                    checked=results[s]["checked"] + k + 1,
+                )
+                found.append((s, offset + k))
+            else:
+                results[s]["checked"] += n
+                if hi < len(tables[s]["as_use"]):
+                    starts[s] = hi
+                    next_pending.append(s)
+            offset += n
+        if found:
+            summaries = batch.get_summary_results([i for _, i in found])
+            for (s, _), summary in zip(found, summaries):
+                results[s]["result"] = summary
+        pending = next_pending
+    return results
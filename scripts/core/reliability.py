@@ -0,0 +1,186 @@
+"""
+reliability.py
+몬테카를로 신뢰성 해석 — 단면(행)마다 재료/치수/하중을 확률변수로 표본 추출해 휨/전단 파괴확률 Pf,
+신뢰성지수 β, 민감도 계수 α를 구한다.
+- 저항은 RCSectionBatch의 휨/전단 강도식을 그대로 쓴다. 기본 강도감소(재료)계수는 1.0 (공칭 강도).
+  · 휨 파괴: Mr_rate < 1 (M_r < Mu),  전단 파괴: Vn_rate < 1 (V_n < Vu),  system: 둘 중 하나
+- 확률변수 (행의 값이 공칭값):
+  · fck, fy       : 재료 강도 (fck 표본은 FCK_RESOLUTION 단위로 반올림 — 기준 계수를 고유값마다 한 번만 산정)
+  · as            : 철근 단면적 계수 (공칭 1.0, 인장철근 개수 num1~3에 곱한다)
+  · cover         : 인장철근 피복 (공칭 = dc1 - av_dia - dia1/2), 공칭과의 차이만큼 dc1~3을 옮긴다
+  · Mu, Vu        : 하중효과 (행의 값을 평균 기준으로 본다)
+- 분포: {"dist": normal | lognormal | gumbel | deterministic, "bias"(평균/공칭) 또는 "mean", "cov" 또는 "std"}
+  표본은 표준정규 u에서 변환하며, 민감도 α는 파괴 표본의 u 평균 방향(-E[u | 파괴] / |E[u | 파괴]|)이다
+  (저항 변수 α > 0, 하중 변수 α < 0).
+- 표본은 (행, 청크) 단위로 SeedSequence(seed, spawn_key=(행, 청크))에서 뽑으므로
+  같은 seed와 청크 크기면 워커 수와 무관하게 같은 결과가 나온다.
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+from core.rc_section_batch import RCSectionBatch, parse_rows
+
+# 한 번의 배치 계산에 넣는 표본 수 (프로세스 풀의 작업 단위이기도 하다)
+RELIABILITY_CHUNK = 65536
+DEFAULT_SAMPLES = 100_000
+# 한 번의 해석에서 허용하는 전체 표본 수 (행 수 × samples) — 작업 목록이 끝없이 커지지 않도록
+MAX_TOTAL_SAMPLES = 20_000_000
+FCK_RESOLUTION = 0.1  # MPa
+
+# 변수 기본 분포 (요청의 "variables"로 이름별로 덮어쓴다)
+DEFAULT_VARIABLES = {
+    "fck": {"dist": "lognormal", "bias": 1.0, "cov": 0.10},
+    "fy": {"dist": "lognormal", "bias": 1.1, "cov": 0.07},
+    "as": {"dist": "normal", "bias": 1.0, "cov": 0.02},
+    "cover": {"dist": "normal", "bias": 1.0, "std": 10.0},
+    "Mu": {"dist": "gumbel", "bias": 1.0, "cov": 0.10},
+    "Vu": {"dist": "gumbel", "bias": 1.0, "cov": 0.10},
+}
+DISTRIBUTIONS = ("normal", "lognormal", "gumbel", "deterministic")
+CHECKS = ("flexure", "shear", "system")
+
+_EULER_GAMMA = 0.5772156649015329
+
+
+def _normal_cdf(u):
+    from scipy.special import ndtr  # Loaded on demand (heavy import)
+    return ndtr(u)
+
+
+def _variable_specs(variables):
+    """기본 분포에 요청 분포를 덮어쓴 {이름: spec} (deterministic 제외)."""
+    specs = {}
+    for name, default in DEFAULT_VARIABLES.items():
+        spec = dict(default, **(variables or {}).get(name, {}))
+        if spec["dist"] not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution for {name}: {spec['dist']!r}")
+        if spec["dist"] != "deterministic":
+            specs[name] = spec
+    unknown = set(variables or {}) - set(DEFAULT_VARIABLES)
+    if unknown:
+        raise ValueError(f"Unknown random variables: {sorted(unknown)}")
+    return specs
+
+
+def _nominal_values(f_ck, f_y, columns):
+    """확률변수의 공칭값 (행 1개짜리 열 dict 기준)."""
+    return {
+        "fck": float(f_ck), "fy": float(f_y), "as": 1.0,
+        "cover": float(columns["dc1"][0] - columns["av_dia"][0] - columns["dia1"][0] / 2),
+        "Mu": float(columns["Mu"][0]), "Vu": float(columns["Vu"][0]),
+    }
+
+
+def _transform(spec, nominal, u):
+    """표준정규 u → spec 분포의 표본."""
+    mean = float(spec["mean"]) if "mean" in spec else nominal * float(spec.get("bias", 1.0))
+    std = float(spec["std"]) if "std" in spec else abs(mean) * float(spec.get("cov", 0.0))
+    if std <= 0:
+        return np.full(u.shape, mean)
+    dist = spec["dist"]
+    if dist == "normal":
+        return mean + std * u
+    if dist == "lognormal":
+        if mean <= 0:
+            raise ValueError("Lognormal variables need a positive mean")
+        zeta2 = math.log(1 + (std / mean) ** 2)
+        return np.exp(math.log(mean) - zeta2 / 2 + math.sqrt(zeta2) * u)
+    # gumbel (최대값 분포)
+    scale = std * math.sqrt(6) / math.pi
+    p = np.clip(_normal_cdf(u), 1e-300, 1 - 1e-16)
+    return mean - _EULER_GAMMA * scale - scale * np.log(-np.log(p))
+
+
+def _sample_chunk(task):
+    """워커: 한 행의 표본 청크 → (표본 수, 검토별 파괴 수, 검토별 파괴 표본의 u 합)."""
+    f_ck, f_y, standard_name, row, specs, n, seed, row_index, chunk_index, phi_f, phi_v, flexure_method = task
+    names = list(specs)
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(row_index, chunk_index)))
+    u = rng.standard_normal((len(names), n))
+
+    columns = parse_rows([row])
+    nominal = _nominal_values(f_ck, f_y, columns)
+    x = {name: _transform(specs[name], nominal[name], u[k]) for k, name in enumerate(names)}
+
+    batch_columns = {key: np.repeat(values, n) for key, values in columns.items()}
+    sample_fck = np.round(x.get("fck", nominal["fck"]) / FCK_RESOLUTION) * FCK_RESOLUTION
+    sample_fy = x.get("fy", nominal["fy"])
+    if "as" in x:
+        for key in ("num1", "num2", "num3"):
+            batch_columns[key] = batch_columns[key] * np.maximum(x["as"], 0.0)
+    if "cover" in x:
+        shift = x["cover"] - nominal["cover"]
+        for key in ("dc1", "dc2", "dc3"):
+            batch_columns[key] = np.where(batch_columns[key] > 0, batch_columns[key] + shift, 0.0)
+    for key in ("Mu", "Vu"):
+        if key in x:
+            batch_columns[key] = np.maximum(x[key], 0.0)
+
+    batch = RCSectionBatch(sample_fck, sample_fy, standard_name, batch_columns, phi_f=phi_f, phi_v=phi_v,
+                           flexure_method=flexure_method)
+    batch.analyze(group_sections=False)
+    flexure = batch.Mr_rate < 1.0
+    shear = batch.Vn_rate < 1.0
+    failed = {"flexure": flexure, "shear": shear, "system": flexure | shear}
+    counts = {check: int(np.count_nonzero(mask)) for check, mask in failed.items()}
+    u_sums = {check: u[:, mask].sum(axis=1) for check, mask in failed.items()}
+    return n, counts, u_sums
+
+
+def _summary(names, n, failures, u_sum):
+    """Pf, β, Pf 추정치의 변동계수, 민감도 α."""
+    pf = failures / n
+    entry = {"pf": pf, "failures": failures, "beta": None, "pf_cov": None, "alpha": None}
+    if failures:
+        entry["beta"] = round(-NormalDist().inv_cdf(pf), 3) if pf < 1 else None
+        entry["pf_cov"] = round(math.sqrt((1 - pf) / (n * pf)), 3)
+        direction = -u_sum / failures
+        norm = float(np.linalg.norm(direction))
+        if names and norm > 0:
+            entry["alpha"] = {name: round(float(a) / norm, 3) for name, a in zip(names, direction)}
+    return entry
+
+
+def check_samples(samples, n_rows):
+    """samples가 양의 정수이고 전체 표본 수(행 수 × samples)가 MAX_TOTAL_SAMPLES 이하인지 확인한다."""
+    if isinstance(samples, bool) or not isinstance(samples, int) or samples < 1:
+        raise ValueError(f"samples must be a positive integer, got {samples!r}")
+    if samples * n_rows > MAX_TOTAL_SAMPLES:
+        raise ValueError(f"samples × rows must not exceed {MAX_TOTAL_SAMPLES} ({samples} × {n_rows} requested)")
+
+
+def analyze_reliability(f_ck, f_y, standard_name, rows, variables=None, samples=DEFAULT_SAMPLES, seed=0,
+                        phi_f=1.0, phi_v=1.0, workers=1, chunk_size=None, flexure_method="block"):
+    """
+    rows(단면, 하중 포함)마다 samples개 표본으로 신뢰성 해석을 수행한다.
+    반환: [{"samples", "variables"(확률변수 이름), "checks": {"flexure" | "shear" | "system":
+            {"pf", "failures", "beta", "pf_cov", "alpha"}}}]  — 파괴 표본이 없으면 beta, alpha는 None (모두 파괴면 beta None)
+    """
+    check_samples(samples, len(rows))
+    specs = _variable_specs(variables)
+    names = list(specs)
+    chunk_size = chunk_size or RELIABILITY_CHUNK
+    tasks = [(f_ck, f_y, standard_name, row, specs, min(chunk_size, samples - start), seed, i, k, phi_f, phi_v,
+              flexure_method)
+             for i, row in enumerate(rows) for k, start in enumerate(range(0, samples, chunk_size))]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            outputs = list(pool.map(_sample_chunk, tasks))
+    else:
+        outputs = [_sample_chunk(task) for task in tasks]
+
+    totals = [{"n": 0, "failures": dict.fromkeys(CHECKS, 0),
+               "u_sum": {check: np.zeros(len(names)) for check in CHECKS}} for _ in rows]
+    for task, (n, counts, u_sums) in zip(tasks, outputs):
+        total = totals[task[7]]
+        total["n"] += n
+        for check in CHECKS:
+            total["failures"][check] += counts[check]
+            total["u_sum"][check] += u_sums[check]
+
+    return [{"samples": total["n"], "variables": names,
+             "checks": {check: _summary(names, total["n"], total["failures"][check], total["u_sum"][check])
+                        for check in CHECKS}}
+            for total in totals]
@@ -0,0 +1,187 @@
+"""
+result_cache.py
+단면 해석 요약 결과(get_summary_result)의 내용 주소(content-addressed) 캐시.
+- 키: (설계기준, 재료, 강도감소계수, 해석에 영향을 주는 행 입력)을 정규화한 JSON의 SHA-256
+  (id, name 등 표시용 필드는 제외하고, 별칭/기본값/형변환은 RCSectionAnalyzer와 같게 맞춘다)
+- 1단: 프로세스 내 LRU (worker 모드에서 요청 간 재사용)
+- 2단: 선택적 SQLite 파일 (환경변수 RC_BEAM_CACHE_DB) — 프로세스가 바뀌어도 유지된다
+- 적중 시 해석기를 만들지 않고 저장된 결과를 그대로 반환한다.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+# 해석 로직/결과 형식이 바뀌면 올린다 (이전 버전의 디스크 캐시는 자연히 무시된다)
+CACHE_VERSION = 2
+
+# 프로세스 내 LRU에 보관할 결과 수
+RESULT_CACHE_SIZE = 4096
+
+# 설정하면 SQLite 디스크 캐시를 함께 사용한다
+CACHE_DB_ENV = "RC_BEAM_CACHE_DB"
+
+# 해석에 영향을 주는 행 입력: (키, 별칭, 기본값, 형변환) — RCSectionAnalyzer / parse_rows와 같은 규칙
+ANALYSIS_INPUTS = (
+    ("H", None, 0, float), ("B", None, 0, float),
+    ("Mu", None, 0, float), ("Vu", None, 0, float), ("Nu", None, 0, float), ("Ms", None, 0, float),
+    ("dc1", "Dc", 0, float), ("dia1", "as_dia", 25, int), ("num1", "as_num", 0, float),
+    ("dc2", None, 0, float), ("dia2", None, 13, int), ("num2", None, 0, float),
+    ("dc3", None, 0, float), ("dia3", None, 13, int), ("num3", None, 0, float),
+    ("av_dia", None, 16, int), ("av_leg", None, 0, float), ("av_space", None, 200, float),
+    ("crack_case", None, "일반환경", str.strip),
+    # 추가 철근층 (섬유 해석 전용): [[깊이, 호칭경, 개수], ...]
+    ("layers", None, None, lambda layers: [[float(l["d"]), int(l.get("dia", 13)), float(l.get("num", 0))]
+                                           for l in layers or ()]),
+)
+
+# SQLite IN (...) 절 하나에 넣을 키 수
+_SQL_BATCH = 500
+
+
+def cache_key(mat, row):
+    """
+    (재료, 행)의 정규화된 해시 키. 값이 해석기에서 형변환되지 않는 입력이면 None (캐시하지 않음).
+    """
+    try:
+        inputs = [cast(row.get(key, row.get(alias, default)) if alias else row.get(key, default))
+                  for key, alias, default, cast in ANALYSIS_INPUTS]
+        material = [mat["design_standard"], float(mat["f_ck"]), float(mat["f_y"]),
+                    float(mat["phi_f"]), None if mat["phi_v"] is None else float(mat["phi_v"]),
+                    mat.get("flexure_method", "block")]
+    except (TypeError, ValueError, AttributeError, KeyError):
+        return None
+    payload = json.dumps([CACHE_VERSION, material, inputs], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """LRU(메모리) + 선택적 SQLite(디스크) 2단 캐시."""
+
+    def __init__(self, maxsize=RESULT_CACHE_SIZE, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self._lru = OrderedDict()
+        self._db = None
+        self.hits = self.disk_hits = self.misses = 0
+
+    # ── 디스크 ────────────────────────────────────────────────────────────────
+
+    def _connect(self):
+        if self._db is None and self.path:
+            import sqlite3
+            try:
+                db = sqlite3.connect(self.path, timeout=5)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+                db.commit()
+                self._db = db
+            except sqlite3.Error:
+                self.path = None  # 디스크 캐시를 쓸 수 없으면 메모리 캐시만 사용한다
+        return self._db
+
+    def _disk_get(self, keys):
+        db = self._connect()
+        if db is None or not keys:
+            return {}
+        import sqlite3
+        found = {}
+        try:
+            for i in range(0, len(keys), _SQL_BATCH):
+                part = keys[i:i + _SQL_BATCH]
+                query = f"SELECT key, result FROM results WHERE key IN ({','.join('?' * len(part))})"
+                found.update((key, json.loads(result)) for key, result in db.execute(query, part))
+        except sqlite3.Error:
+            return {}
+        return found
+
+    def _disk_put(self, items):
+        db = self._connect()
+        if db is None or not items:
+            return
+        import sqlite3
+        try:
+            with db:
+                db.executemany("INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)",
+                               [(key, json.dumps(result, ensure_ascii=False)) for key, result in items])
+        except sqlite3.Error:
+            pass
+
+    # ── 조회/저장 ─────────────────────────────────────────────────────────────
+
+    def _remember(self, key, result):
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def get_many(self, keys):
+        """{키: 결과} (찾은 것만). None 키는 무시한다."""
+        found, missing = {}, []
+        for key in keys:
+            if key is None or key in found:
+                continue
+            result = self._lru.get(key)
+            if result is None:
+                missing.append(key)
+            else:
+                self._lru.move_to_end(key)
+                found[key] = result
+        self.hits += len(found)
+        if missing:
+            disk = self._disk_get(missing)
+            for key, result in disk.items():
+                self._remember(key, result)
+            found.update(disk)
+            self.disk_hits += len(disk)
+            self.misses += len(missing) - len(disk)
+        return found
+
+    def put_many(self, items):
+        """[(키, 결과)]를 저장한다. None 키는 건너뛴다."""
+        items = [(key, result) for key, result in items if key is not None]
+        for key, result in items:
+            self._remember(key, result)
+        self._disk_put(items)
+
+    def clear(self):
+        self._lru.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def info(self):
+        return {"size": len(self._lru), "maxsize": self.maxsize, "hits": self.hits,
+                "disk_hits": self.disk_hits, "misses": self.misses, "path": self.path}
+
+
+_CACHE = None
+
+
+def get_result_cache():
+    """프로세스 공용 캐시 (RC_BEAM_CACHE_DB가 설정되어 있으면 디스크 캐시 포함)."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = ResultCache(path=os.environ.get(CACHE_DB_ENV) or None)
+    return _CACHE
+
+
+def cached_results(mat, rows, compute, cache=None):
+    """
+    rows의 요약 결과 리스트를 반환한다. 캐시에 없는 행만 compute(mat, 행 리스트)로 계산한다.
+    compute가 결과 대신 돌려준 예외 객체(행별 오류)는 저장하지 않는다.
+    """
+    cache = cache or get_result_cache()
+    keys = [cache_key(mat, row) for row in rows]
+    found = cache.get_many(keys)
+
+    missing = [i for i, key in enumerate(keys) if key not in found]
+    computed = compute(mat, [rows[i] for i in missing]) if missing else []
+    cache.put_many((keys[i], dict(result)) for i, result in zip(missing, computed)
+                   if not isinstance(result, Exception))
+
+    results = [None] * len(rows)
+    for i, result in zip(missing, computed):
+        results[i] = result
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            results[i] = dict(found[key])
+    return results
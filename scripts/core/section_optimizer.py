@@ -0,0 +1,149 @@
+"""
+section_optimizer.py
+H × B 격자 단면 최적화 — 후보 단면마다 철근(rebar_design)과 스터럽(stirrup_design)을 자동 설계하고,
+비용 모델로 가장 싼 단면과 비용-활용률 Pareto front를 구한다.
+- 후보 격자: {"H": {"min", "max", "step"} 또는 값 목록, "B": ...} — 부재(행)마다 "grid"로 바꿀 수 있다.
+- 비용 (부재 1 m당): 콘크리트 체적(m³) × concrete + 철근 질량(kg, 주철근 + 스터럽) × rebar
+                    + 거푸집 면적(양 측면 + 바닥, m²) × formwork
+- 활용률: max(1/Mr_rate, 1/Vn_rate) — 설계된 철근/스터럽으로 다시 계산한 값
+- Pareto front: 비용과 활용률이 모두 더 작은 다른 후보가 없는 후보 (비용 오름차순)
+- 후보는 OPTIMIZE_CHUNK개씩 나누어 배치로 설계하며, workers > 1이면 프로세스 풀에서 청크를 나누어 계산한다
+  (워커 수는 코어 수와 청크 수를 넘지 않는다).
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from core.rebar_design import DEFAULT_COVER, design_rebar
+from core.stirrup_design import design_stirrups
+from rebar_area_ks import get_korean_rebar
+
+# 단위 비용 (부재 1 m 기준): 콘크리트 m³, 철근 kg, 거푸집 m²
+COST_MODEL = {"concrete": 100.0, "rebar": 1.2, "formwork": 30.0}
+STEEL_DENSITY = 7850.0  # kg/m³
+
+# 한 번의 배치 설계에 넣는 후보 단면 수 (프로세스 풀의 작업 단위이기도 하다)
+OPTIMIZE_CHUNK = 4096
+DEFAULT_GRID_STEP = 50.0
+
+
+def _axis(spec, name):
+    """{"min", "max", "step"} 범위 또는 값 목록 → 정렬된 값 배열."""
+    if isinstance(spec, dict):
+        lo, hi = float(spec["min"]), float(spec["max"])
+        step = float(spec.get("step", DEFAULT_GRID_STEP))
+        if step <= 0 or hi < lo:
+            raise ValueError(f"Invalid {name} range: {spec}")
+        values = lo + step * np.arange(int(math.floor((hi - lo) / step + 1e-9)) + 1)
+    else:
+        values = np.array(sorted(set(float(v) for v in np.atleast_1d(spec))))
+    if len(values) == 0 or values[0] <= 0:
+        raise ValueError(f"Invalid {name} grid: {spec}")
+    return values
+
+
+def section_grid(grid):
+    """격자 정의 → (H 배열, B 배열) (모든 조합)."""
+    if not grid:
+        raise ValueError("Section grid (H, B) is required")
+    H, B = np.meshgrid(_axis(grid["H"], "H"), _axis(grid["B"], "B"), indexing="ij")
+    return H.ravel(), B.ravel()
+
+
+def _evaluate_chunk(task):
+    """워커: (f_ck, f_y, 설계기준, phi_f, phi_v, 후보 행, 설계 옵션, 휨 해석 방법) → 후보별 평가 결과 리스트."""
+    f_ck, f_y, standard_name, phi_f, phi_v, rows, options, flexure_method = task
+    rebar_options = {k: options[k] for k in ("diameters", "max_layers", "cover", "aggregate") if k in options}
+    stirrup_options = {k: options[k] for k in ("av_dias", "legs", "increment", "min_spacing") if k in options}
+    rebar = design_rebar(f_ck, f_y, standard_name, rows, phi_f=phi_f, phi_v=phi_v, flexure_method=flexure_method,
+                         **rebar_options)
+    found = [i for i, design in enumerate(rebar) if design["found"]]
+    stirrups = design_stirrups(f_ck, f_y, standard_name, [dict(rows[i], **rebar[i]["layout"]) for i in found],
+                               phi_f=phi_f, phi_v=phi_v, flexure_method=flexure_method, **stirrup_options)
+    evaluated = [None] * len(rows)
+    for i, stirrup in zip(found, stirrups):
+        if stirrup["ok"]:
+            evaluated[i] = (rebar[i], stirrup)
+    return evaluated
+
+
+def _costs(H, B, as_used, av_dia, av_leg, av_space, cover, cost):
+    """후보별 (총비용, 콘크리트, 철근, 거푸집) 비용 배열 (부재 1 m당)."""
+    area = get_korean_rebar().get_area_array(av_dia)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stirrup_mm3 = area * (av_leg * np.maximum(H - 2 * cover, 0) + 2 * np.maximum(B - 2 * cover, 0)) * 1e3 / av_space
+    steel_kg = (as_used * 1e3 + stirrup_mm3) * 1e-9 * STEEL_DENSITY
+    concrete = H * B * 1e-6 * cost["concrete"]
+    rebar = steel_kg * cost["rebar"]
+    formwork = (2 * H + B) * 1e-3 * cost["formwork"]
+    return concrete + rebar + formwork, concrete, rebar, formwork
+
+
+def pareto_front(cost, utilization):
+    """비용/활용률 모두 지배되지 않는 후보 번호 (비용 오름차순)."""
+    order = np.lexsort((utilization, cost))
+    running = np.minimum.accumulate(utilization[order])
+    keep = np.r_[True, utilization[order][1:] < running[:-1]]
+    return order[keep]
+
+
+def optimize_sections(f_ck, f_y, standard_name, rows, grid=None, cost=None, phi_f=0.85, phi_v=None,
+                      workers=1, flexure_method="block", **options):
+    """
+    rows(부재, 하중 포함)마다 격자 후보를 설계·평가하여 최적 단면과 Pareto front를 반환한다.
+    반환: [{"candidates", "feasible", "best"(없으면 None), "pareto": [...]}]
+    각 후보: {"H", "B", "cost", "cost_detail", "utilization", "layout", "stirrups", "result"}
+    options: rebar_design / stirrup_design 설계 옵션 (diameters, cover, av_dias, increment, ...)
+    """
+    cost = dict(COST_MODEL, **(cost or {}))
+    grids = [section_grid(row.get("grid", grid)) for row in rows]
+
+    # (부재, 후보) 행을 청크로 나눈다
+    offsets = np.concatenate([[0], np.cumsum([len(H) for H, _ in grids])]).tolist()
+    candidates = [dict(row, H=float(h), B=float(b)) for row, (H, B) in zip(rows, grids) for h, b in zip(H, B)]
+    tasks = [(f_ck, f_y, standard_name, phi_f, phi_v, candidates[i:i + OPTIMIZE_CHUNK], options, flexure_method)
+             for i in range(0, len(candidates), OPTIMIZE_CHUNK)]
+    workers = min(int(workers), os.cpu_count() or 1, len(tasks))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            evaluated = [e for chunk in pool.map(_evaluate_chunk, tasks) for e in chunk]
+    else:
+        evaluated = [e for task in tasks for e in _evaluate_chunk(task)]
+
+    results = []
+    for m, (row, (H, B)) in enumerate(zip(rows, grids)):
+        designs = evaluated[offsets[m]:offsets[m + 1]]
+        ok = np.array([d is not None for d in designs], dtype=bool)
+        entry = {"candidates": len(designs), "feasible": int(ok.sum()), "best": None, "pareto": []}
+        if ok.any():
+            picked = [d for d in designs if d is not None]
+            Hf, Bf = H[ok], B[ok]
+            as_used = np.array([r["as_used"] for r, _ in picked])
+            av_dia = np.array([s["av_dia"] for _, s in picked])
+            av_leg = np.array([s["av_leg"] for _, s in picked], dtype=float)
+            av_space = np.array([s["av_space"] for _, s in picked])
+            cover = float(row.get("cover", options.get("cover", DEFAULT_COVER)))
+            total, concrete, rebar, formwork = _costs(Hf, Bf, as_used, av_dia, av_leg, av_space, cover, cost)
+            result = [s["result"] for _, s in picked]
+            utilization = np.array([max(1 / r["Mr_rate"], 1 / r["Vn_rate"]) if r["Mr_rate"] > 0 and r["Vn_rate"] > 0
+                                    else math.inf for r in result])
+
+            def candidate(k):
+                rebar_design, stirrup = picked[k]
+                return {
+                    "H": float(Hf[k]), "B": float(Bf[k]),
+                    "cost": round(float(total[k]), 2),
+                    "cost_detail": {"concrete": round(float(concrete[k]), 2), "rebar": round(float(rebar[k]), 2),
+                                    "formwork": round(float(formwork[k]), 2)},
+                    "utilization": round(float(utilization[k]), 3),
+                    "layout": rebar_design["layout"],
+                    "stirrups": {key: stirrup[key] for key in ("av_dia", "av_leg", "av_space")},
+                    "result": result[k],
+                }
+
+            front = pareto_front(total, utilization)
+            entry["best"] = candidate(int(front[0]))
+            entry["pareto"] = [candidate(int(k)) for k in front]
+        results.append(entry)
+    return results
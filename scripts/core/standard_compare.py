@@ -0,0 +1,82 @@
+"""
+standard_compare.py
+여러 설계기준 비교 — 같은 행들을 설계기준별로 검토해 안전율과 OK/NG를 나란히 놓은 표를 만든다.
+- 행 파싱과 형상(철근량, 유효깊이, 단면 묶음)은 한 번만 계산하고, RCSectionBatch.with_standard()로
+  설계기준마다 휨/전단/사용성 단계만 다시 계산한다.
+- 강도감소(재료)계수는 설계법별 기본값(COMPARE_FACTORS, 화면의 기본값과 같음)을 쓰며,
+  factors={설계기준 이름: {"phi_f", "phi_v"}}로 바꿀 수 있다.
+- 판정: flexure(Mr_rate ≥ 1), shear(Vn_rate ≥ 1), crack(균열 검토), rebar(최소/최대 철근비), ok(모두 만족)
+  changed: 첫 번째 설계기준과 ok 판정이 다른 행
+"""
+import numpy as np
+from core.rc_section_batch import RCSectionBatch, parse_rows
+from standards import get_standard
+
+# standards를 주지 않았을 때 비교하는 설계기준 (등록된 다섯 기준)
+COMPARE_STANDARDS = (
+    "강도설계법(도로교 설계기준, 2010)",
+    "콘크리트설계기준(KCI/KDS)",
+    "강도설계법(콘크리트구조 설계기준, 2021)",
+    "한계상태설계법(도로교 설계기준, 2012)",
+    "한계상태설계법(도로교 설계기준, 2015)",
+)
+# 설계법별 기본 (phi_f, phi_v) — LSD에서는 재료계수 (φc, φs)
+COMPARE_FACTORS = {"USD": (0.85, 0.80), "LSD": (0.65, 0.90)}
+COMPARE_CHECKS = ("flexure", "shear", "crack", "rebar")
+
+
+def _factors(standard_name, factors):
+    override = (factors or {}).get(standard_name, {})
+    phi_f, phi_v = COMPARE_FACTORS[get_standard(standard_name).get_concrete_method()]
+    return override.get("phi_f", phi_f), override.get("phi_v", phi_v)
+
+
+def compare_standards(f_ck, f_y, standard_names, rows, factors=None, flexure_method="block"):
+    """
+    rows를 standard_names(None이면 COMPARE_STANDARDS)의 설계기준별로 검토한다.
+    반환: {"standards", "rows": [{"id", "name", "changed", "results": {설계기준: {"Mr_rate", "Vn_rate", "fs",
+            "flexure", "shear", "crack", "rebar", "ok"}}}], "summary": {설계기준: {"ng", 검토별 NG 수, "changed"}}}
+    """
+    standard_names = list(dict.fromkeys(COMPARE_STANDARDS if standard_names is None else standard_names))
+    if not standard_names:
+        raise ValueError("At least one design standard is required")
+    if len(rows) == 0:
+        return {"standards": standard_names, "rows": [], "summary": {}}
+
+    base = None
+    columns = {}
+    for name in standard_names:
+        phi_f, phi_v = _factors(name, factors)
+        if base is None:
+            base = RCSectionBatch(f_ck, f_y, name, parse_rows(rows), phi_f=phi_f, phi_v=phi_v,
+                                  flexure_method=flexure_method)
+            batch = base
+        else:
+            batch = base.with_standard(name, phi_f=phi_f, phi_v=phi_v)
+        batch.analyze()
+        checks = {
+            "flexure": batch.Mr_rate >= 1.0,
+            "shear": batch.Vn_rate >= 1.0,
+            "crack": batch.crack_ok,
+            "rebar": batch.min_rebar_ok & batch.max_rebar_ok,
+        }
+        ok = np.logical_and.reduce(list(checks.values()))
+        columns[name] = dict(checks, ok=ok, Mr_rate=np.round(batch.Mr_rate, 3), Vn_rate=np.round(batch.Vn_rate, 3),
+                             fs=np.round(batch.f_s, 1))
+
+    first = columns[standard_names[0]]["ok"]
+    changed = np.zeros(len(rows), dtype=bool)
+    summary = {}
+    for name, values in columns.items():
+        differs = values["ok"] != first
+        changed |= differs
+        summary[name] = {"ng": int(np.count_nonzero(~values["ok"])), "changed": int(np.count_nonzero(differs))}
+        summary[name].update({f"{check}_ng": int(np.count_nonzero(~values[check])) for check in COMPARE_CHECKS})
+
+    keys = ("Mr_rate", "Vn_rate", "fs") + COMPARE_CHECKS + ("ok",)
+    lists = {name: [values[key].tolist() for key in keys] for name, values in columns.items()}
+    table = []
+    for i, row in enumerate(rows):
+        results = {name: dict(zip(keys, (column[i] for column in lists[name]))) for name in standard_names}
+        table.append({"id": row.get("id"), "name": row.get("name"), "changed": bool(changed[i]), "results": results})
+    return {"standards": standard_names, "rows": table, "summary": summary}
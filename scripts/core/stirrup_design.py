@@ -0,0 +1,105 @@
+"""
+stirrup_design.py
+전단철근(스터럽) 설계 — 행마다 Vn ≥ Vu, 최대 전단강도, 최대 간격을 만족하는 최소 다리 수와 최대 간격을 구한다.
+- V_s는 모든 기준에서 Av/s에 비례하므로, av_leg = 1, av_space = 1로 한 번 배치 해석해
+  철근 단위면적당 V_s 계수를 얻고 간격을 닫힌 식으로 푼다 (시행 계산 없음).
+  · USD: φVn = φ(Vc + Vs) → Vs,req = Vu/φ - Vc, Vs,req ≤ Vs,max (기준의 get_vs_max)
+         s_max = min(d/2, 600), Vs,req > (1/3)√fck·b·d 이면 min(d/4, 300)
+  · LSD: Vn = Vcd + Vs, cot θ는 Vu로부터 닫힌 식으로 정해지며(lsd_shear) 스터럽과 무관하다
+         Vu ≤ Vdmax(cot θ = 1), s_max = min(0.75d, 600)
+- 간격은 현장 단위(increment)로 내림하고, STIRRUP_MIN_SPACING 미만이면 다리 수를 늘린다.
+- 다리 수가 가장 적은 조합을 고르고, 후보 직경(av_dias)이 여러 개면 그중 Av/s(단위길이당 철근량)가 작은 직경을 쓴다.
+"""
+import numpy as np
+from core.rc_section_batch import RCSectionBatch, parse_rows
+from rebar_area_ks import get_korean_rebar
+
+# 간격 내림 단위 / 최소 시공 간격 (mm)
+SPACING_INCREMENT = 25.0
+STIRRUP_MIN_SPACING = 100.0
+# 검토하는 다리 수
+STIRRUP_LEGS = (2, 3, 4, 5, 6)
+# 강도식에서 구한 간격에 곱하는 여유 (내림 후에도 부동소수 오차로 Vn < Vu가 되지 않도록)
+_SPACING_TOL = 1 - 1e-9
+
+
+def _shear_terms(batch):
+    """(φVc, Vs 계수 k, 단위 Vs(av_leg=1, av_space=1), 단면 적합 여부, 최대 간격(Vs,req 함수))."""
+    if batch.method == "LSD":
+        details = batch.v_details
+        section_ok = batch.Vu_n <= details["Vdmax2"]
+        return batch.pi_V_c, 1.0, batch.V_s, section_ok, lambda vs_req: details["s_max_2"]
+
+    d, B = batch.d_eff, batch.beam_b
+    vs_limit = np.sqrt(batch.f_ck) / 3 * B * d
+
+    def s_max(vs_req):
+        return np.where(vs_req > vs_limit, np.minimum(d / 4, 300.0), np.minimum(d / 2, 600.0))
+
+    return batch.pi_V_c, batch.pi_v, batch.V_s, None, s_max
+
+
+def design_stirrups(f_ck, f_y, standard_name, rows, phi_f=0.85, phi_v=None, av_dias=None, legs=STIRRUP_LEGS,
+                    increment=SPACING_INCREMENT, min_spacing=STIRRUP_MIN_SPACING, flexure_method="block"):
+    """
+    rows마다 스터럽(av_dia, av_leg, av_space)을 설계한다. av_dias를 주지 않으면 행의 av_dia를 쓴다.
+    반환: [{"ok", "reason"(실패 시 "section" / "legs"), "av_dia", "av_leg", "av_space", "s_max", "Vs_req"(kN),
+            "result"(설계 스터럽으로 계산한 calc 요약 결과)}]
+    """
+    if len(rows) == 0:
+        return []
+    columns = parse_rows(rows)
+    n = len(rows)
+    probe = dict(columns, av_leg=np.ones(n), av_space=np.ones(n))
+    batch = RCSectionBatch(f_ck, f_y, standard_name, probe, phi_f=phi_f, phi_v=phi_v,
+                           flexure_method=flexure_method).analyze(group_sections=False)
+
+    rebar = get_korean_rebar()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pi_V_c, k_s, V_s_unit, section_ok, s_max_of = _shear_terms(batch)
+        vs_per_area = np.where(batch.av_use > 0, V_s_unit / batch.av_use, 0.0)
+        vs_req = np.maximum(0.0, (batch.Vu_n - pi_V_c) / k_s)
+        s_max = s_max_of(vs_req)
+        if section_ok is None:
+            section_ok = vs_req <= batch.V_s_max
+        section_ok = section_ok & batch.shear_valid
+
+        # 후보 (직경, 다리 수) × 행
+        dias = np.array(sorted(set(int(d) for d in av_dias)) if av_dias else [0])
+        legs = np.array(sorted(set(int(l) for l in legs)), dtype=float)
+        dia_grid = np.where(dias[:, None, None] > 0, dias[:, None, None], columns["av_dia"][None, None, :])
+        dia_grid = np.broadcast_to(dia_grid, (len(dias), len(legs), n))
+        av = rebar.get_area_array(dia_grid) * legs[None, :, None]
+        s_strength = np.where(vs_req > 0, av * vs_per_area / vs_req * _SPACING_TOL, np.inf)
+        spacing = np.floor(np.minimum(s_strength, s_max) / increment) * increment
+        feasible = (spacing >= min_spacing) & section_ok
+
+        # 다리 수가 가장 적은 조합, 그중 Av/s(단위길이당 철근량)가 가장 작은 직경
+        steel = np.where(feasible, av / np.where(spacing > 0, spacing, 1.0), np.inf)
+        leg_pick = np.argmax(feasible.any(axis=0), axis=0)
+        cols = np.arange(n)
+        dia_pick = np.argmin(steel[:, leg_pick, cols], axis=0)
+    pick = (dia_pick, leg_pick, cols)
+    ok = feasible[pick]
+    av_dia = dia_grid[pick].astype(int)
+    av_leg = legs[leg_pick]
+    av_space = spacing[pick]
+
+    # 설계 결과로 다시 계산한 요약 (실패한 행은 입력 스터럽 그대로)
+    final = dict(columns)
+    final["av_dia"] = np.where(ok, av_dia, columns["av_dia"])
+    final["av_leg"] = np.where(ok, av_leg, columns["av_leg"])
+    final["av_space"] = np.where(ok, av_space, columns["av_space"])
+    summaries = RCSectionBatch(f_ck, f_y, standard_name, final, phi_f=phi_f, phi_v=phi_v,
+                               flexure_method=flexure_method).analyze().get_summary_results()
+
+    results = []
+    for i in range(n):
+        design = {"ok": bool(ok[i]), "s_max": round(float(s_max[i]), 1), "Vs_req": round(float(vs_req[i]) / 1e3, 1),
+                  "result": summaries[i]}
+        if ok[i]:
+            design.update(av_dia=int(av_dia[i]), av_leg=int(av_leg[i]), av_space=float(av_space[i]))
+        else:
+            design["reason"] = "section" if not section_ok[i] else "legs"
+        results.append(design)
+    return results
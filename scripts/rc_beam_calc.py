@@ -1,80 +1,668 @@
 import sys
+import io
 import json
 import os
+import hashlib
+import time
 
 # Ensure the scripts directory is in the python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from core import phase_timer
+from core.phase_timer import phase
 from core.rc_section_analyzer import RCSectionAnalyzer
-from reports.text_builder import TextReportBuilder
-from reports.excel_builder import ExcelReportBuilder
+
+# Report builders (and openpyxl) are imported inside the modes that use them,
+# so a plain 'calc' call only loads the analyzer and the selected standard.
+
+DEFAULT_STANDARD = "강도설계법(도로교 설계기준, 2010)"
+
+# Requests with at least this many rows use the vectorized batch engine (loads numpy);
+# smaller ones stay on the scalar analyzer to keep cold start light.
+BATCH_MIN_ROWS = 32
+
+# NDJSON streaming (--ndjson) computes batch-sized requests this many rows at a time
+# and flushes each chunk as soon as it is done, so memory stays bounded on both sides.
+STREAM_CHUNK_ROWS = 256
+
+# Exports with at least this many sheets use the write-only (streaming) Excel backend,
+# which keeps only the sheet being written in memory. "excel_backend" in the request overrides it.
+WRITE_ONLY_MIN_ROWS = 20
+
+# Exports with at least this many sheets are rendered by a process pool (one worker per core);
+# "export_workers" in the request sets the worker count explicitly (1 = serial).
+PARALLEL_EXPORT_MIN_ROWS = 64
+
+# Batch text reports with at least this many rows are rendered by a process pool;
+# "report_workers" in the request sets the worker count explicitly (1 = serial).
+PARALLEL_REPORT_MIN_ROWS = 64
+
+# Section optimization with at least this many grid candidates (all members) is split across a process pool;
+# "optimize_workers" in the request sets the worker count explicitly (1 = serial).
+PARALLEL_OPTIMIZE_MIN_CANDIDATES = 8192
+
+# Reliability runs with at least this many samples (all rows) are split across a process pool;
+# "reliability_workers" in the request sets the worker count explicitly (1 = serial).
+PARALLEL_RELIABILITY_MIN_SAMPLES = 262144
+# ProcessPoolExecutor는 Windows에서 max_workers > 61을 받지 않는다
+WINDOWS_MAX_WORKERS = 61
+
+
+def _read_material(input_data):
+    """요청 데이터에서 공통 재료/설계기준 정보를 추출한다."""
+    material = input_data.get("material", {})
+    return {
+        "design_standard": input_data.get("design_standard", DEFAULT_STANDARD),
+        "f_ck": material.get("fck", 35),
+        "f_y": material.get("fy", 400),
+        "phi_f": material.get("phi_f", 0.85),
+        "phi_v": material.get("phi_v", 0.8),
+        # "fiber": 섬유 단면 변형률 적합 해석 (축력 Nu, 행의 "layers" 추가 철근층 반영) — core.fiber_section
+        "flexure_method": input_data.get("flexure_method", "block"),
+    }
+
+
+def _analyze_row(mat, row):
+    beam_h = row.get("H", 0)
+    beam_b = row.get("B", 0)
+    with phase("construct"):
+        analyzer = RCSectionAnalyzer(mat["f_ck"], mat["f_y"], mat["design_standard"], beam_h, beam_b, row, row,
+                                     phi_f=mat["phi_f"], phi_v=mat["phi_v"], flexure_method=mat["flexure_method"])
+    with phase("analyze"):
+        analyzer.analyze()
+    return analyzer
+
+
+def _batch_results(mat, rows):
+    from core.rc_section_batch import RCSectionBatch
+    with phase("batch.construct"):
+        batch = RCSectionBatch.from_rows(mat["f_ck"], mat["f_y"], mat["design_standard"], rows,
+                                         phi_f=mat["phi_f"], phi_v=mat["phi_v"],
+                                         flexure_method=mat["flexure_method"])
+    with phase("batch.analyze"):
+        batch.analyze()
+    with phase("batch.summary"):
+        return batch.get_summary_results()
+
+
+def _compute_results(mat, rows):
+    if len(rows) >= BATCH_MIN_ROWS:
+        return _batch_results(mat, rows)
+
+    results = []
+    for row in rows:
+        results.append(_analyze_row(mat, row).get_summary_result())
+    return results
+
+
+def run_calc(input_data):
+    """
+    Standard calculation mode: 각 행의 요약 결과 리스트를 반환한다.
+    결과 캐시(core.result_cache)에 없는 행만 해석한다 ("cache": false 이면 캐시를 건너뛴다).
+    """
+    mat = _read_material(input_data)
+    rows = input_data.get("rows", [])
+    if input_data.get("cache", True):
+        from core.result_cache import cached_results
+        return cached_results(mat, rows, _compute_results)
+    return _compute_results(mat, rows)
+
+
+def _calc_chunk(mat, rows, use_batch):
+    """행 묶음의 요약 결과 리스트. 실패한 행은 결과 대신 예외 객체가 들어간다."""
+    if use_batch:
+        try:
+            return _batch_results(mat, rows)
+        except Exception:
+            pass  # 어느 행이 실패했는지 알 수 있도록 스칼라 해석으로 다시 계산한다
+    results = []
+    for row in rows:
+        try:
+            results.append(_analyze_row(mat, row).get_summary_result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def iter_calc(input_data):
+    """
+    calc 결과를 계산되는 대로 [(행 번호, 결과 또는 예외)] 묶음으로 내보낸다.
+    배치 엔진 대상이면 STREAM_CHUNK_ROWS 행씩, 아니면 한 행씩 계산한다.
+    """
+    mat = _read_material(input_data)
+    rows = input_data.get("rows", [])
+    use_batch = len(rows) >= BATCH_MIN_ROWS
+    size = STREAM_CHUNK_ROWS if use_batch else 1
+    compute = lambda m, chunk: _calc_chunk(m, chunk, use_batch)
+    if input_data.get("cache", True):
+        from core.result_cache import cached_results
+        calc = lambda chunk: cached_results(mat, chunk, compute)
+    else:
+        calc = lambda chunk: compute(mat, chunk)
+    for start in range(0, len(rows), size):
+        yield list(enumerate(calc(rows[start:start + size]), start))
+
+
+def stream_calc(input_data, out):
+    """
+    --ndjson: 행마다 한 줄({"index", "id", "result"} 또는 {"index", "id", "error"})을 계산되는 대로 쓰고,
+    마지막에 요약 줄({"done": true, "count", "errors", "elapsed_ms"})을 쓴다.
+    """
+    start = time.perf_counter()
+    rows = input_data.get("rows", [])
+    count = errors = 0
+    for chunk in iter_calc(input_data):
+        for index, result in chunk:
+            line = {"index": index, "id": rows[index].get("id")}
+            if isinstance(result, Exception):
+                line["error"] = str(result)
+                errors += 1
+            else:
+                line["result"] = result
+            out.write(json.dumps(line, ensure_ascii=False) + "\n")
+        count += len(chunk)
+        out.flush()
+    _write_trailer(out, count=count, errors=errors, elapsed_ms=round((time.perf_counter() - start) * 1e3, 1),
+                   **_timings_field())
+
+
+def _write_trailer(out, **fields):
+    out.write(json.dumps({"done": True, **fields}, ensure_ascii=False) + "\n")
+    out.flush()
+
+
+def run_envelope(input_data):
+    """
+    Envelope mode: 행(단면)마다 여러 하중 케이스/하중조합을 검토하고 휨/전단/균열의 지배 케이스를 반환한다.
+    하중 입력 형식은 core.load_envelope 참고. "include_cases": true 이면 케이스별 결과도 담는다.
+    """
+    from core.load_envelope import evaluate_envelopes
+    mat = _read_material(input_data)
+    return evaluate_envelopes(mat["f_ck"], mat["f_y"], mat["design_standard"], input_data.get("rows", []),
+                              phi_f=mat["phi_f"], phi_v=mat["phi_v"],
+                              include_cases=bool(input_data.get("include_cases", False)),
+                              flexure_method=mat["flexure_method"])
+
+
+def run_import_forces(input_data):
+    """
+    Import-forces mode: 골조해석 부재력 파일(path, CSV/XLSX — 업로드 루트 안, core.data_paths)을 청크 단위로 읽어 단면("sections", 부재 목록 "members")별
+    하중조합 포락으로 줄이고, 포락 해석 결과를 함께 반환한다 ("analyze": false 이면 하중 행만 반환).
+    옵션: sheet, columns(머리글 지정), service_cases, moment(abs/positive/negative), encoding
+    "store"(프로젝트 id)를 주면 부재력을 저장소 루트 아래 열 저장소(core.force_store)에 두고 재사용한다.
+    - path + store: 원본을 읽어 저장소를 새로 만든다
+    - store만: 원본을 다시 읽지 않고 memmap으로 재검토한다 (sections를 주면 저장된 단면 정의를 바꾼다)
+    - recheck_members: 해당 부재의 행만 읽어 재검토한다
+    """
+    options = {"service_cases": input_data.get("service_cases", ()), "moment": input_data.get("moment", "abs")}
+    read = {"columns": input_data.get("columns"), "sheet": input_data.get("sheet"),
+            "encoding": input_data.get("encoding", "utf-8-sig")}
+    from core.data_paths import resolve_upload, store_dir
+    sections = input_data.get("sections")
+    source = resolve_upload(input_data["path"]) if input_data.get("path") else None
+    store_path = store_dir(input_data["store"]) if input_data.get("store") else None
+    if store_path:
+        from core.force_store import ForceStore
+        if source:
+            store = ForceStore.build(store_path, source, sections=sections, **read)
+        else:
+            store = ForceStore(store_path)
+            if sections is not None:
+                store.set_sections(sections)
+        envelope = store.envelope(members=input_data.get("recheck_members"), **options)
+    else:
+        from core.force_import import import_forces
+        if not source:
+            raise ValueError("import_forces needs a 'path' (or an existing 'store')")
+        envelope = import_forces(source, sections or [], **options, **read)
+    rows = envelope.to_rows()
+    result = {"rows_read": envelope.rows_read, "unmapped": envelope.unmapped, "rows": rows}
+    if input_data.get("analyze", True):
+        result["envelopes"] = run_envelope(dict(input_data, rows=rows))
+    return result
+
+
+def run_design_rebar(input_data):
+    """
+    Design-rebar mode: 행(단면, 하중)마다 모든 검토를 만족하는 최소 철근량 인장철근 배근(dc1~num3)을 찾는다.
+    옵션: diameters, max_layers, cover(스터럽 바깥 피복), aggregate(굵은골재 최대치수) — core.rebar_design 참고
+    """
+    from core import rebar_design
+    mat = _read_material(input_data)
+    options = {key: input_data[key] for key in ("diameters", "max_layers", "cover", "aggregate") if key in input_data}
+    return rebar_design.design_rebar(mat["f_ck"], mat["f_y"], mat["design_standard"], input_data.get("rows", []),
+                                     phi_f=mat["phi_f"], phi_v=mat["phi_v"], flexure_method=mat["flexure_method"],
+                                     **options)
+
+
+def run_design_stirrups(input_data):
+    """
+    Design-stirrups mode: 행마다 Vn ≥ Vu, 최대 전단강도, 최대 간격을 만족하는 최소 다리 수 / 최대 간격을 구한다.
+    옵션: av_dias, legs, increment(간격 단위), min_spacing — core.stirrup_design 참고
+    """
+    from core import stirrup_design
+    mat = _read_material(input_data)
+    options = {key: input_data[key] for key in ("av_dias", "legs", "increment", "min_spacing") if key in input_data}
+    return stirrup_design.design_stirrups(mat["f_ck"], mat["f_y"], mat["design_standard"], input_data.get("rows", []),
+                                          phi_f=mat["phi_f"], phi_v=mat["phi_v"],
+                                          flexure_method=mat["flexure_method"], **options)
+
+
+def run_optimize_sections(input_data):
+    """
+    Optimize-sections mode: 행(부재, 하중)마다 H × B 격자("grid", 행별 "grid"로 덮어쓰기)의 후보 단면을 자동 설계하여
+    비용 모델("cost")상 가장 싼 단면과 비용-활용률 Pareto front를 반환한다.
+    옵션: design_rebar / design_stirrups 설계 옵션 — core.section_optimizer 참고
+    """
+    from core import section_optimizer
+    mat = _read_material(input_data)
+    rows = input_data.get("rows", [])
+    grid = input_data.get("grid")
+    keys = ("diameters", "max_layers", "cover", "aggregate", "av_dias", "legs", "increment", "min_spacing")
+    options = {key: input_data[key] for key in keys if key in input_data}
+    n_candidates = sum(len(section_optimizer.section_grid(row.get("grid", grid))[0]) for row in rows)
+    workers = _pool_workers(input_data, "optimize_workers", n_candidates, PARALLEL_OPTIMIZE_MIN_CANDIDATES)
+    return section_optimizer.optimize_sections(mat["f_ck"], mat["f_y"], mat["design_standard"], rows, grid=grid,
+                                               cost=input_data.get("cost"), phi_f=mat["phi_f"], phi_v=mat["phi_v"],
+                                               workers=workers, flexure_method=mat["flexure_method"], **options)
+
+
+def run_sweep(input_data):
+    """
+    Sweep mode: 입력 축("axes")의 모든 조합을 배치 엔진으로 계산해 열 파일(csv/npz/parquet)로 쓴다.
+    축에 없는 값은 "base" 행과 material/design_standard에서 가져온다 — core.param_sweep 참고.
+    저장 위치: out_path (출력 루트 기준 상대 경로 — core.data_paths 참고, 없으면 임시 파일),
+    형식: "format" 또는 확장자 (기본 csv)
+    """
+    from core import param_sweep
+    from core.data_paths import resolve_output
+    mat = _read_material(input_data)
+    fmt = input_data.get("format")
+    out_path = input_data.get("out_path")
+    if out_path:
+        out_path = resolve_output(out_path)
+    else:
+        import tempfile
+        fd, out_path = tempfile.mkstemp(prefix="Calc_As_Sweep_", suffix="." + (fmt or "csv"))
+        os.close(fd)
+    return param_sweep.run_sweep(input_data.get("axes", {}), out_path, base=input_data.get("base"), fmt=fmt,
+                                 standard_name=mat["design_standard"], f_ck=mat["f_ck"], f_y=mat["f_y"],
+                                 phi_f=mat["phi_f"], phi_v=mat["phi_v"], outputs=input_data.get("outputs"),
+                                 chunk_rows=input_data.get("chunk_rows"), flexure_method=mat["flexure_method"])
+
+
+def run_reliability(input_data):
+    """
+    Reliability mode: 행(단면, 하중)마다 몬테카를로 표본으로 휨/전단 파괴확률 Pf, 신뢰성지수 β, 민감도 α를 구한다.
+    옵션: variables(분포), samples, seed — core.reliability 참고
+    강도는 공칭값(계수 1.0)으로 계산하며, "nominal": false 이면 material의 phi_f, phi_v를 쓴다.
+    """
+    from core import reliability
+    mat = _read_material(input_data)
+    rows = input_data.get("rows", [])
+    samples = input_data.get("samples", reliability.DEFAULT_SAMPLES)
+    reliability.check_samples(samples, len(rows))
+    phi = {"phi_f": 1.0, "phi_v": 1.0}
+    if not input_data.get("nominal", True):
+        phi = {"phi_f": mat["phi_f"], "phi_v": mat["phi_v"]}
+    workers = _pool_workers(input_data, "reliability_workers", samples * len(rows), PARALLEL_RELIABILITY_MIN_SAMPLES)
+    return reliability.analyze_reliability(mat["f_ck"], mat["f_y"], mat["design_standard"], rows,
+                                           variables=input_data.get("variables"), samples=samples,
+                                           seed=int(input_data.get("seed", 0)), workers=workers,
+                                           flexure_method=mat["flexure_method"], **phi)
+
+
+def run_compare(input_data):
+    """
+    Compare mode: 같은 행들을 여러 설계기준("standards", 없으면 등록된 다섯 기준)으로 한 번에 검토해
+    설계기준별 안전율과 OK/NG 표를 반환한다. "factors": {설계기준: {"phi_f", "phi_v"}} — core.standard_compare 참고
+    """
+    from core.standard_compare import compare_standards
+    mat = _read_material(input_data)
+    return compare_standards(mat["f_ck"], mat["f_y"], input_data.get("standards"), input_data.get("rows", []),
+                             factors=input_data.get("factors"), flexure_method=mat["flexure_method"])
+
+
+def run_report(input_data):
+    """
+    Report mode: 텍스트 보고서를 반환한다.
+    - format 없음: 첫 번째 행의 보고서 딕셔너리 (기존 동작)
+    - format "json": 모든 행의 보고서 리스트 ([{"name", "total", <섹션>...}])
+    - format "zip": 행별 .txt 파일을 담은 zip을 기록한다 (out_path / 임시 파일, export와 동일)
+    - sections: 생성할 섹션 목록 (flexure / shear / service, 기본 전체). 고르지 않은 섹션은 만들지 않는다.
+    """
+    fmt = input_data.get("format")
+    if fmt is None:
+        from reports.text_builder import TextReportBuilder
+
+        mat = _read_material(input_data)
+        rows = input_data.get("rows", [])
+        if not rows:
+            return {"error": "No rows provided"}
+        builder = TextReportBuilder(_analyze_row(mat, rows[0]))
+        return builder.generate(input_data.get("sections"))
+
+    if fmt == "zip":
+        return _write_output(input_data, build_report_zip(input_data), ".zip")
+    if fmt != "json":
+        raise ValueError(f"Unknown report format: {fmt}")
+    names, reports = _render_reports(input_data)
+    return [{"name": name, **report} for name, report in zip(names, reports)]
+
+
+def _render_reports(input_data):
+    """모든 행의 보고서를 (이름 목록, 보고서 목록)으로 반환한다. 행이 많으면 프로세스 풀을 사용한다."""
+    from reports.text.base_text_builder import select_sections
+    from reports.text.batch_report import render_reports
+
+    mat = _read_material(input_data)
+    rows = input_data.get("rows", [])
+    sections = select_sections(input_data.get("sections"))
+    workers = _pool_workers(input_data, "report_workers", len(rows), PARALLEL_REPORT_MIN_ROWS)
+    return _sheet_names(rows), render_reports(_analyze_row, mat, rows, sections, workers)
+
+
+def build_report_zip(input_data):
+    """행별 텍스트 보고서(.txt)를 담은 zip 바이트를 반환한다."""
+    from reports.text.batch_report import build_zip
+
+    names, reports = _render_reports(input_data)
+    return build_zip(names, reports)
+
+
+def _use_write_only(input_data):
+    backend = input_data.get("excel_backend")
+    if backend in ("write_only", "standard"):
+        return backend == "write_only"
+    return len(input_data.get("rows", [])) >= WRITE_ONLY_MIN_ROWS
+
+
+def _sheet_names(rows):
+    """행별 시트 이름 (엑셀 31자 제한, 중복 이름은 _2, _3 ... 접미사로 구분)."""
+    names, used = [], set()
+    for i, row in enumerate(rows):
+        base = (row.get('name') if row.get('name') else f"Beam_{row.get('id', i+1)}")[:31]
+        name, n = base, 1
+        while name.lower() in used:
+            n += 1
+            suffix = f"_{n}"
+            name = base[:31 - len(suffix)] + suffix
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+
+def _pool_workers(input_data, key, n_rows, min_rows):
+    """
+    프로세스 풀 워커 수: 요청의 key 값, 없으면 행 수가 min_rows 이상일 때 코어 수 (1 = 직렬).
+    요청 값도 코어 수와 행 수를 넘지 않는다 (양의 정수가 아니면 ValueError).
+    """
+    cpus = os.cpu_count() or 1
+    if sys.platform == "win32":
+        cpus = min(cpus, WINDOWS_MAX_WORKERS)
+    workers = input_data.get(key)
+    if workers is None:
+        if n_rows < min_rows:
+            return 1
+        workers = cpus
+    elif isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"{key} must be a positive integer, got {workers!r}")
+    return max(1, min(workers, cpus, n_rows))
+
+
+def build_export_workbook(input_data):
+    """여러 시트를 가진 하나의 엑셀 파일을 만들어 xlsx 바이트로 반환한다."""
+    mat = _read_material(input_data)
+    rows = input_data.get("rows", [])
+    items = list(zip(_sheet_names(rows), rows))
+
+    workers = _pool_workers(input_data, "export_workers", len(rows), PARALLEL_EXPORT_MIN_ROWS)
+    if workers > 1:
+        from reports.excel.parallel_export import export_parallel
+        return export_parallel(_analyze_row, mat, items, workers)
+
+    from reports.excel_builder import ExcelReportBuilder
+    if _use_write_only(input_data):
+        from reports.excel.write_only import WriteOnlyWorkbook
+        wb = WriteOnlyWorkbook()
+    else:
+        from openpyxl import Workbook
+        wb = Workbook()
+        # Remove default sheet
+        wb.remove(wb.active)
+
+    for sheet_name, row in items:
+        builder = ExcelReportBuilder(_analyze_row(mat, row))
+        builder.add_to_workbook(wb, sheet_name)
+
+    buffer = io.BytesIO()
+    with phase("excel.save"):
+        wb.save(buffer)
+    wb.close()
+    return buffer.getvalue()
+
+
+def _export_header(data):
+    return {"success": True, "size": len(data), "etag": hashlib.sha1(data).hexdigest()}
+
+
+def _write_output(input_data, data, suffix, out_fd=None):
+    """
+    생성한 파일 바이트를 기록하고 헤더(success, size, etag)와 위치를 반환한다.
+    - out_fd: 명령행(--out-fd N)으로 받은 파일 디스크립터에 기록 (요청 JSON의 out_fd는 받지 않는다)
+    - out_path: 출력 루트 기준 상대 경로에 기록 (core.data_paths 참고)
+    - 둘 다 없으면 요청마다 고유한 임시 파일을 만든다 (동시 요청 간 덮어쓰기 방지)
+    """
+    _check_request(input_data)
+    result = _export_header(data)
+
+    out_path = input_data.get("out_path")
+    if out_fd is not None:
+        with os.fdopen(out_fd, "wb", closefd=False) as f:
+            f.write(data)
+        result["fd"] = out_fd
+        return result
+
+    if out_path:
+        from core.data_paths import resolve_output
+        out_path = resolve_output(out_path)
+        with open(out_path, "wb") as f:
+            f.write(data)
+    else:
+        import tempfile
+        fd, out_path = tempfile.mkstemp(prefix="Calc_As_Output_", suffix=suffix)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    result["file"] = out_path
+    return result
+
+
+def run_export(input_data):
+    """Export mode: 엑셀 파일을 생성하여 저장한다 (저장 위치는 _write_output 참고)."""
+    return _write_output(input_data, build_export_workbook(input_data), ".xlsx")
+
+
+# --stream 으로 바이트를 바로 내보낼 수 있는 mode
+STREAM_BUILDERS = {
+    "export": build_export_workbook,
+    "report": build_report_zip,
+}
+
+
+def write_to_fd(input_data, out_fd):
+    """--out-fd N: export(xlsx) / report(zip) 바이트를 명령행으로 받은 파일 디스크립터 N에 쓰고 헤더를 반환한다."""
+    builder = STREAM_BUILDERS.get(input_data.get("mode", "export"), build_export_workbook)
+    return _write_output(input_data, builder(input_data), None, out_fd=out_fd)
+
+
+def stream_export(input_data, out):
+    """
+    --stream: 헤더 한 줄(JSON: success, size, etag) 뒤에 파일 바이트를 그대로 out(바이너리)에 쓴다.
+    export는 xlsx, report는 행별 .txt를 담은 zip이다. 디스크를 거치지 않으므로 라우트는 stdout만 읽으면 된다.
+    """
+    builder = STREAM_BUILDERS.get(input_data.get("mode", "export"), build_export_workbook)
+    data = builder(input_data)
+    out.write((json.dumps(dict(_export_header(data), **_timings_field())) + "\n").encode("utf-8"))
+    out.write(data)
+    out.flush()
+
+
+MODE_HANDLERS = {
+    "calc": run_calc,
+    "report": run_report,
+    "export": run_export,
+    "envelope": run_envelope,
+    "import_forces": run_import_forces,
+    "design_rebar": run_design_rebar,
+    "design_stirrups": run_design_stirrups,
+    "optimize_sections": run_optimize_sections,
+    "sweep": run_sweep,
+    "reliability": run_reliability,
+    "compare": run_compare,
+}
+
+
+def _check_request(input_data):
+    """요청 본문으로 받으면 안 되는 필드를 거른다 (HTTP 라우트가 본문을 그대로 worker로 넘기므로)."""
+    if "out_fd" in input_data:
+        raise ValueError("out_fd is not accepted in a request; pass --out-fd N on the command line")
+
+
+def handle_request(input_data):
+    """mode에 맞는 핸들러로 요청을 처리한다. (알 수 없는 mode는 calc로 처리)"""
+    _check_request(input_data)
+    mode = input_data.get("mode", "calc")  # 'calc', 'export', 'report', or 'envelope'
+    handler = MODE_HANDLERS.get(mode, run_calc)
+    with phase(f"mode.{mode}"):
+        return handler(input_data)
+
+
+# ── 계측 (core.phase_timer) ───────────────────────────────────────────────────
+
+def _read_request(text):
+    """JSON 요청을 읽는다. 반환: (요청, 디코딩 (wall, CPU) 초) — 계측 여부는 요청을 읽은 뒤에야 알 수 있다."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    request = json.loads(text)
+    return request, (time.perf_counter() - wall, time.process_time() - cpu)
+
+
+def _timed_session(input_data, decode, profile=True):
+    """요청/환경변수에 따라 계측 세션을 연다 (decode: _read_request의 디코딩 시간). 프로파일은 환경변수로만 켠다."""
+    session = phase_timer.session(phase_timer.enabled(input_data), phase_timer.profile_path() if profile else None)
+    if session.timer is not None:
+        session.timer.record("json.decode", *decode)
+    return session
+
+
+def _timings_field():
+    """계측 중이면 {"_timings": 요약}, 아니면 빈 dict."""
+    timer = phase_timer.active()
+    return {"_timings": timer.summary()} if timer is not None else {}
+
+
+def _dumps(result):
+    """
+    결과를 JSON 문자열로 만든다. 계측 중이면 인코딩 시간까지 담은 _timings를 붙인다
+    (결과가 dict가 아니면 {"result": 결과, "_timings": ...}로 감싼다).
+    """
+    with phase("json.encode"):
+        text = json.dumps(result, ensure_ascii=False)
+    timings = _timings_field()
+    if not timings:
+        return text
+    timings = json.dumps(timings["_timings"], ensure_ascii=False)
+    if isinstance(result, dict):
+        return text[:-1] + (", " if result else "") + '"_timings": ' + timings + "}"
+    return '{"result": ' + text + ', "_timings": ' + timings + "}"
+
+
+def _warm_up():
+    """Worker 시작 시 요청 경로에서 지연 로딩되는 모듈을 미리 불러온다."""
+    import openpyxl  # noqa: F401
+    import tempfile  # noqa: F401
+    import reports.text_builder  # noqa: F401
+    import reports.excel_builder  # noqa: F401
+    import reports.excel.write_only  # noqa: F401
+    import reports.text.batch_report  # noqa: F401
+    import core.load_envelope  # noqa: F401
+    import core.force_import  # noqa: F401
+    import core.force_store  # noqa: F401
+    import core.rebar_design  # noqa: F401
+    import core.stirrup_design  # noqa: F401
+    import core.section_optimizer  # noqa: F401
+    import core.param_sweep  # noqa: F401
+    import core.reliability  # noqa: F401
+    import core.standard_compare  # noqa: F401
+    import core.fiber_section  # noqa: F401
+
+
+def run_worker(stdin, stdout):
+    """
+    Persistent worker mode.
+    stdin으로 한 줄에 하나씩 JSON 요청({"id": ..., "mode": ..., ...})을 받고,
+    stdout으로 요청 id가 붙은 JSON 응답을 한 줄씩 반환한다.
+    stdin이 닫히면(EOF) 종료한다.
+    계측("timings")은 요청마다 따로 재서 응답에 _timings로 붙인다. 환경변수 RC_BEAM_PROFILE이 있으면
+    워커 수명 전체를 프로파일한다 (요청마다 따로 프로파일하지 않는다).
+    """
+    _warm_up()
+    with phase_timer.session(profile=phase_timer.profile_path()):
+        for line in stdin:
+            line = line.strip()
+            if not line:
+                continue
+            req_id = None
+            try:
+                request, decode = _read_request(line)
+                req_id = request.get("id")
+                with _timed_session(request, decode, profile=False):
+                    response = _dumps({"id": req_id, "ok": True, "result": handle_request(request)})
+            except Exception as e:
+                response = json.dumps({"id": req_id, "ok": False, "error": str(e)}, ensure_ascii=False)
+            stdout.write(response + "\n")
+            stdout.flush()
+
+
+def _cli_out_fd(argv):
+    """명령행의 --out-fd N (없으면 None)."""
+    if "--out-fd" not in argv:
+        return None
+    index = argv.index("--out-fd") + 1
+    if index >= len(argv) or not argv[index].isdigit():
+        raise ValueError("--out-fd needs a file descriptor number")
+    return int(argv[index])
+
 
 if __name__ == "__main__":
     try:
         # Use UTF-8 for stdin/stdout on Windows
         if sys.platform == "win32":
-            import io
             sys.stdin = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
             sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-        input_data = json.loads(sys.stdin.read())
-        mode = input_data.get("mode", "calc") # 'calc', 'export', or 'report'
-        material = input_data.get("material", {})
-        design_standard = input_data.get("design_standard", "강도설계법(도로교 설계기준, 2010)")
-        
-        f_ck = material.get("fck", 35)
-        f_y = material.get("fy", 400)
-        phi_f = material.get("phi_f", 0.85)
-        phi_v = material.get("phi_v", 0.8)
-        
-        if mode == "export":
-            # Export mode: generate a single excel with multiple sheets
-            from openpyxl import Workbook
-            import tempfile
-            
-            wb = Workbook()
-            # Remove default sheet
-            wb.remove(wb.active)
-            
-            for i, row in enumerate(input_data.get("rows", [])):
-                beam_h = row.get("H", 0)
-                beam_b = row.get("B", 0)
-                analyzer = RCSectionAnalyzer(f_ck, f_y, design_standard, beam_h, beam_b, row, row, phi_f=phi_f, phi_v=phi_v)
-                analyzer.analyze()
-                builder = ExcelReportBuilder(analyzer)
-                sheet_name = row.get('name') if row.get('name') else f"Beam_{row.get('id', i+1)}"
-                builder.add_to_workbook(wb, sheet_name[:31])
-            
-            temp_dir = tempfile.gettempdir()
-            out_path = os.path.join(temp_dir, "Calc_As_Output.xlsx")
-            wb.save(out_path)
-            wb.close()
-            print(json.dumps({"success": True, "file": out_path}, ensure_ascii=False))
-            
-        elif mode == "report":
-            # Report mode: generate text for a single row
-            rows = input_data.get("rows", [])
-            if not rows:
-                print(json.dumps({"error": "No rows provided"}, ensure_ascii=False))
-            else:
-                row = rows[0]
-                beam_h = row.get("H", 0)
-                beam_b = row.get("B", 0)
-                analyzer = RCSectionAnalyzer(f_ck, f_y, design_standard, beam_h, beam_b, row, row, phi_f=phi_f, phi_v=phi_v)
-                analyzer.analyze()
-                builder = TextReportBuilder(analyzer)
-                print(json.dumps(builder.generate(), ensure_ascii=False))
-                
+        if "--worker" in sys.argv[1:]:
+            run_worker(sys.stdin, sys.stdout)
+        elif "--ndjson" in sys.argv[1:]:
+            try:
+                input_data, decode = _read_request(sys.stdin.read())
+                with _timed_session(input_data, decode):
+                    stream_calc(input_data, sys.stdout)
+            except Exception as e:
+                # 스트림은 항상 요약 줄로 끝난다 (요청 자체가 실패한 경우 error 포함)
+                _write_trailer(sys.stdout, error=str(e))
+        elif "--stream" in sys.argv[1:]:
+            input_data, decode = _read_request(sys.stdin.read())
+            with _timed_session(input_data, decode):
+                stream_export(input_data, sys.stdout.buffer)
+        elif "--out-fd" in sys.argv[1:]:
+            out_fd = _cli_out_fd(sys.argv[1:])
+            input_data, decode = _read_request(sys.stdin.read())
+            with _timed_session(input_data, decode):
+                print(_dumps(write_to_fd(input_data, out_fd)))
         else:
-            # Standard calculation mode
-            results = []
-            for row in input_data.get("rows", []):
-                beam_h = row.get("H", 0)
-                beam_b = row.get("B", 0)
-                analyzer = RCSectionAnalyzer(f_ck, f_y, design_standard, beam_h, beam_b, row, row, phi_f=phi_f, phi_v=phi_v)
-                analyzer.analyze()
-                results.append(analyzer.get_summary_result())
-            print(json.dumps(results, ensure_ascii=False))
-            
+            input_data, decode = _read_request(sys.stdin.read())
+            with _timed_session(input_data, decode):
+                print(_dumps(handle_request(input_data)))
+
     except Exception as e:
         print(json.dumps([{"error": str(e)}], ensure_ascii=False))
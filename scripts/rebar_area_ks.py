@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 
 class KoreanRebar:
     def __init__(self):
@@ -32,6 +33,18 @@ class KoreanRebar:
             
         return self.rebar_data.get(d, (math.pi * d**2) / 4.0)
 
+    def get_area_array(self, diameters):
+        # Vectorized get_area for integer diameter arrays (one lookup per distinct size)
+        import numpy as np
+        uniq, inv = np.unique(np.asarray(diameters, dtype=int), return_inverse=True)
+        areas = np.array([self.get_area(d) for d in uniq.tolist()], dtype=float)
+        return areas[inv.reshape(-1)].reshape(np.shape(diameters))
+
+@lru_cache(maxsize=1)
+def get_korean_rebar():
+    # Shared catalogue instance (the area table is read-only)
+    return KoreanRebar()
+
 if __name__ == "__main__":
     rebar = KoreanRebar()
     print(f"D13 area: {rebar.get_area(13)}")
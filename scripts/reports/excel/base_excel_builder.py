@@ -2,11 +2,13 @@
 base_excel_builder.py
 모든 설계법 Excel Builder가 공통으로 사용하는 기반 클래스.
 - 셀 스타일, 헤더, 섹션 1~5 (단면제원, 재료상수, 강도감소계수, 필요/사용철근량) 공통 구현
+- 고정 레이아웃(병합/테두리/채우기/라벨)은 설계기준별 템플릿으로 한 번만 만들고, 시트마다 복제 후 값만 기록
 - 서브클래스에서 반드시 구현해야 하는 메서드 선언
 """
 from abc import ABC, abstractmethod
-from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
 from string import ascii_uppercase
+from .styles import THIN_BORDER, get_font, get_alignment, get_fill
+from .template import SheetTemplate, get_template
 
 
 class BaseExcelBuilder(ABC):
@@ -23,27 +25,51 @@ class BaseExcelBuilder(ABC):
     def add_to_workbook(self, wb, sheet_name):
         """워크북에 보고서 시트를 추가한다."""
         wsout = wb.create_sheet(title=sheet_name)
-        self._setup_sheet(wsout)
-        self._write_header(wsout)
-        self._write_section1(wsout)
-        self._write_section2(wsout)
-        self._write_section3(wsout)
-        self._write_section4(wsout)
-        self._write_section5(wsout)
-        row_offset = self._write_section6(wsout)  # 설계법별 구현
-        self._write_flexure_strength(wsout, row_offset)
-        self._write_shear(wsout, row_offset)
-        self._write_crack(wsout, row_offset)
+        template = get_template((type(self).__name__, self.std.name), lambda: SheetTemplate.record(self._write_layout))
+        template.clone_into(wsout)
+        self._write_values(wsout)
+
+    def _write_values(self, ws):
+        """템플릿 위에 보고서 값을 기록한다."""
+        self._write_section1(ws)
+        self._write_section2(ws)
+        self._write_section3(ws)
+        self._write_section4(ws)
+        self._write_section5(ws)
+        row_offset = self._write_section6(ws)  # 설계법별 구현
+        self._write_flexure_strength(ws, row_offset)
+        self._write_shear(ws, row_offset)
+        self._write_crack(ws, row_offset)
 
     # ── 공통 초기화 ───────────────────────────────────────────────────────────
 
+    def _write_layout(self, ws):
+        """설계기준별 템플릿: 보고서 값과 무관한 서식과 고정 라벨."""
+        self._setup_sheet(ws)
+        self._write_header(ws)
+        self._write_section1_layout(ws)
+        ws['B7'].value = '2) 콘크리트 재료상수'
+        ws['C8'].value = 'β1    : 등가 사각형 응력 블록의 깊이계수'
+        ws['P8'].value = '='
+        ws['B10'].value = '3) 강도감소계수(Ø) 산정'
+        ws['B18'].value = '4) 필요철근량 산정'
+        ws['C19'].value = 'Mu / Øf = As x fy  x (d - a / 2)              ----------------   ①'
+        ws['C20'].value = ' a = As x fy  / ( 0.85 x fck x b)             ----------------   ②'
+        ws['C21'].value = ' 식②를 식①에 대입하여 이차방정식으로 As를 구한다'
+        ws['E22'].value = ' fy²                                Mu'
+        ws['C24'].value = ' 2 x 0.85 x fck x b                         Øf '
+
     def _setup_sheet(self, ws):
         alpalist = list(ascii_uppercase)
         for i in range(1, 100):
             ws.row_dimensions[i].height = 15
         for col in alpalist:
             ws.column_dimensions[col].width = 3.0
-        font_format = Font(size=9, name='굴림체')
+        font_format = get_font(9)
+        if hasattr(ws, "set_base_font"):
+            # write-only 백엔드: 기본 글꼴은 행을 기록할 때 적용한다 (빈 셀 2,600개를 미리 만들지 않음)
+            ws.set_base_font(font_format, max_row=100, max_col=len(alpalist))
+            return
         for rows in ws["A1":"Z100"]:
             for cell in rows:
                 cell.font = font_format
@@ -52,27 +78,16 @@ class BaseExcelBuilder(ABC):
         """헤더: 보고서 제목"""
         ws.merge_cells('B1:M1')
         ws['B1'].value = f"[{self.std.name}] - RC 단면 검토 보고서"
-        ws['B1'].font = Font(size=11, bold=True, name='굴림체')
-        ws['B1'].alignment = Alignment(horizontal='left')
-
-    def _write_section1(self, ws):
-        """1) 단면제원 및 설계가정"""
-        ana = self.analyzer
-        label_f = "Øc" if ana.method == "LSD" else "Øf"
-        label_v = "Øs" if ana.method == "LSD" else "Øv"
-        phi_f_val = ana.phi_c if ana.method == "LSD" else ana.pi_f
-        phi_v_val = ana.phi_s if ana.method == "LSD" else ana.pi_v
+        ws['B1'].font = get_font(11, bold=True)
+        ws['B1'].alignment = get_alignment('left')
 
+    def _write_section1_layout(self, ws):
+        """1) 단면제원 표의 서식과 머리글"""
         ws['B2'].value = '1) 단면제원 및 설계가정'
-        ws['C3'].value = f"fck = {ana.f_ck} MPa, fy = {ana.f_y} MPa, {label_f} = {phi_f_val:.2f}, {label_v} = {phi_v_val:.2f}, Es = {ana.E_s} MPa"
-
         for r in range(4, 6):
             for c in range(3, 24):
-                ws.cell(r, c).alignment = Alignment(horizontal='center', vertical='center')
-                ws.cell(r, c).border = Border(
-                    left=Side(border_style='thin'), right=Side(border_style='thin'),
-                    top=Side(border_style='thin'), bottom=Side(border_style='thin')
-                )
+                ws.cell(r, c).alignment = get_alignment('center', 'center')
+                ws.cell(r, c).border = THIN_BORDER
         for r in range(4, 6):
             for c in [3, 6, 9, 12]:
                 ws.merge_cells(start_row=r, start_column=c, end_row=r, end_column=c+2)
@@ -80,11 +95,21 @@ class BaseExcelBuilder(ABC):
             for c in [15, 19, 23]:
                 ws.merge_cells(start_row=r, start_column=c, end_row=r, end_column=c+3)
         for c in range(3, 24):
-            ws.cell(4, c).fill = PatternFill(fill_type='solid', fgColor='0FFFF0')
+            ws.cell(4, c).fill = get_fill('0FFFF0')
 
         ws['C4'].value = 'B(mm)';   ws['F4'].value = 'H(mm)'; ws['I4'].value = 'd(mm)'
         ws['L4'].value = '피복(mm)'; ws['O4'].value = 'Mu(N.mm)'
         ws['S4'].value = 'Vu(N)';   ws['W4'].value = 'Ms(N.mm)'
+
+    def _write_section1(self, ws):
+        """1) 단면제원 및 설계가정 (값)"""
+        ana = self.analyzer
+        label_f = "Øc" if ana.method == "LSD" else "Øf"
+        label_v = "Øs" if ana.method == "LSD" else "Øv"
+        phi_f_val = ana.phi_c if ana.method == "LSD" else ana.pi_f
+        phi_v_val = ana.phi_s if ana.method == "LSD" else ana.pi_v
+
+        ws['C3'].value = f"fck = {ana.f_ck} MPa, fy = {ana.f_y} MPa, {label_f} = {phi_f_val:.2f}, {label_v} = {phi_v_val:.2f}, Es = {ana.E_s} MPa"
         ws['C5'].value = ana.beam_b
         ws['F5'].value = ana.beam_h
         ws['I5'].value = f"{ana.d_eff:.1f}"
@@ -96,15 +121,11 @@ class BaseExcelBuilder(ABC):
     def _write_section2(self, ws):
         """2) 콘크리트 재료상수"""
         ana = self.analyzer
-        ws['B7'].value = '2) 콘크리트 재료상수'
-        ws['C8'].value = 'β1    : 등가 사각형 응력 블록의 깊이계수'
-        ws['P8'].value = '='
         ws['Q8'].value = ana.beta_1
 
     def _write_section3(self, ws):
         """3) 강도감소계수(Ø) 산정"""
         ana = self.analyzer
-        ws['B10'].value = '3) 강도감소계수(Ø) 산정'
         if ana.method == "LSD":
             ws['C11'].value = f"T = As x fy = {ana.as_use:.3f} x {ana.f_yd:.1f} = {ana.tension_force:.1f} N"
             ws['C12'].value = f"C = alpha_cc x phi_c x fck x alpha x b = {ana.alpha_cc:.2f} x {ana.phi_c:.2f} x {ana.f_ck} x {ana.alpha_fac:.2f} x {ana.beam_b} = {ana.compression_force:.1f} x c"
@@ -120,13 +141,7 @@ class BaseExcelBuilder(ABC):
     def _write_section4(self, ws):
         """4) 필요철근량 산정"""
         ana = self.analyzer
-        ws['B18'].value = '4) 필요철근량 산정'
-        ws['C19'].value = 'Mu / Øf = As x fy  x (d - a / 2)              ----------------   ①'
-        ws['C20'].value = ' a = As x fy  / ( 0.85 x fck x b)             ----------------   ②'
-        ws['C21'].value = ' 식②를 식①에 대입하여 이차방정식으로 As를 구한다'
-        ws['E22'].value = ' fy²                                Mu'
         ws['C23'].value = f" ────────── As² - fy x d x As + ───  = 0 ,   Asreq = {ana.as_req:.3f} mm²"
-        ws['C24'].value = ' 2 x 0.85 x fck x b                         Øf '
 
     def _write_section5(self, ws):
         """5) 사용철근량"""
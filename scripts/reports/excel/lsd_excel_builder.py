@@ -3,7 +3,9 @@ lsd_excel_builder.py
 한계상태설계법(LSD) 전용 Excel 보고서 빌더.
 """
 from .base_excel_builder import BaseExcelBuilder
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from .styles import THIN_BORDER, get_font, get_alignment, get_fill
+from .template import SheetTemplate, get_template
+from .write_only import BufferedSheet
 import math
 
 class LSDExcelBuilder(BaseExcelBuilder):
@@ -12,49 +14,59 @@ class LSDExcelBuilder(BaseExcelBuilder):
     def add_to_workbook(self, wb, sheet_name):
         """LSD 전용 동적 행 구조로 워크북에 시트를 추가한다."""
         wsout = wb.create_sheet(title=sheet_name)
-        self._setup_sheet(wsout)
-        self._write_header(wsout)
-        
+        if isinstance(wsout, BufferedSheet):
+            # write-only 백엔드는 시트 자체가 버퍼이므로 바로 기록
+            self._write_sheet(wsout)
+            return
+
+        # 버퍼에 먼저 기록한 뒤, 같은 행 구성(signature)의 레이아웃 템플릿을 복제하고 값만 채운다
+        sheet = BufferedSheet()
+        signature = self._write_sheet(sheet)
+        key = (type(self).__name__, self.std.name, signature)
+        template = get_template(key, lambda: SheetTemplate.from_sheet(sheet))
+        template.clone_into(wsout)
+        template.fill_from(sheet, wsout)
+
+    def _write_sheet(self, ws):
+        """시트 전체를 기록하고 행 구성 signature(섹션별 시작 행, 병합 범위)를 반환한다."""
+        self._setup_sheet(ws)
+        self._write_header(ws)
+
         # LSD는 상세 정보가 많아 행 번호를 추적하며 동적으로 작성
-        curr = 2 
-        curr = self._write_section1_lsd(wsout, curr)
-        curr = self._write_section2_lsd(wsout, curr)
-        curr = self._write_section3_lsd(wsout, curr)
-        curr = self._write_section4_lsd(wsout, curr)
-        curr = self._write_section5_lsd(wsout, curr)
-        curr = self._write_section6_lsd(wsout, curr)
-        curr = self._write_flexure_strength_lsd(wsout, curr)
-        curr = self._write_shear_lsd(wsout, curr)
-        self._write_crack_lsd_detail(wsout, curr)
+        rows = [2]
+        for write in (self._write_section1_lsd, self._write_section2_lsd, self._write_section3_lsd,
+                      self._write_section4_lsd, self._write_section5_lsd, self._write_section6_lsd,
+                      self._write_flexure_strength_lsd, self._write_shear_lsd):
+            rows.append(write(ws, rows[-1]))
+        self._write_crack_lsd_detail(ws, rows[-1])
+        has_crack = bool(getattr(self.analyzer, 'service_details', {}))
+        return tuple(rows), has_crack, tuple(ws.merged_ranges)
 
     def _merge_row_text(self, ws, row, start_col, end_col, text, align='left', bold=False, color=None):
         """셀을 병합하고 스타일을 적용하여 텍스트를 입력하는 헬퍼 (Section 1 전용)."""
         ws.merge_cells(start_row=row, start_column=start_col, end_row=row, end_column=end_col)
         cell = ws.cell(row, start_col)
         cell.value = text
-        cell.alignment = Alignment(horizontal=align, vertical='center')
-        cell.font = Font(bold=bold, size=9, name='굴림체')
+        cell.alignment = get_alignment(align, 'center')
+        cell.font = get_font(9, bold=bold)
         if color:
-            cell.fill = PatternFill(fill_type='solid', fgColor=color)
+            cell.fill = get_fill(color)
         return cell
 
     def _write_row_text(self, ws, row, col, text, bold=False, color=None, align='left'):
         """병합 없이 스타일만 적용하여 텍스트를 입력하는 헬퍼 (Section 2~9 전용)."""
         cell = ws.cell(row, col)
         cell.value = text
-        cell.alignment = Alignment(horizontal=align, vertical='center')
-        cell.font = Font(bold=bold, size=9, name='굴림체')
+        cell.alignment = get_alignment(align, 'center')
+        cell.font = get_font(9, bold=bold)
         if color:
-            cell.fill = PatternFill(fill_type='solid', fgColor=color)
+            cell.fill = get_fill(color)
         return cell
 
     def _apply_border(self, ws, row, start_col, end_col):
         """병합된 셀 범위에 테두리를 적용."""
         for c in range(start_col, end_col + 1):
-            ws.cell(row, c).border = Border(
-                left=Side(style='thin'), right=Side(style='thin'), 
-                top=Side(style='thin'), bottom=Side(style='thin')
-            )
+            ws.cell(row, c).border = THIN_BORDER
 
     def _write_section1_lsd(self, ws, row):
         ana = self.analyzer
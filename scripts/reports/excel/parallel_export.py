@@ -0,0 +1,106 @@
+"""
+parallel_export.py
+여러 프로세스에서 시트를 나누어 렌더링하고 하나의 xlsx로 조립하는 병렬 Export.
+- 각 워커는 연속된 행 묶음(chunk)을 해석하고 write-only 백엔드로 작은 xlsx를 만들어 반환한다.
+- 조립 단계는 워커별 styles.xml의 셀 서식 번호를 최종 워크북 기준으로 바꾸고(<c ... s="N">),
+  시트 XML을 원래 행 순서대로 최종 파일에 넣는다. 문자열은 inlineStr이므로 별도 처리가 필요 없다.
+"""
+import io
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from openpyxl import Workbook
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.xml.functions import fromstring
+
+from ..excel_builder import ExcelReportBuilder
+from .write_only import WriteOnlyWorkbook
+
+SHEET_PART = re.compile(r"^xl/worksheets/sheet(\d+)\.xml$")
+CELL_STYLE = re.compile(rb'(<c r="[A-Z]+[0-9]+" s=")([0-9]+)(")')
+
+
+def render_chunk(analyze, mat, items):
+    """워커: (시트 이름, 행) 목록을 해석/렌더링하여 xlsx 바이트로 반환한다."""
+    wb = WriteOnlyWorkbook()
+    for sheet_name, row in items:
+        ExcelReportBuilder(analyze(mat, row)).add_to_workbook(wb, sheet_name)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    wb.close()
+    return buffer.getvalue()
+
+
+def split_chunks(items, count):
+    """순서를 유지하며 items를 최대 count개의 연속 구간으로 나눈다."""
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    chunks, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def export_parallel(analyze, mat, items, workers):
+    """
+    items([(시트 이름, 행)])를 workers개 프로세스로 나누어 렌더링하고 하나의 xlsx 바이트로 조립한다.
+    analyze(mat, row)는 분석이 끝난 RCSectionAnalyzer를 반환하는 최상위 함수여야 한다 (pickle 가능).
+    워커 수는 코어 수와 행 수를 넘지 않는다.
+    """
+    workers = max(1, min(int(workers), os.cpu_count() or 1, len(items)))
+    # 워커 수보다 조금 잘게 나누어 행별 계산량 차이에 따른 대기 시간을 줄인다
+    chunks = split_chunks(items, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(render_chunk, [analyze] * len(chunks), [mat] * len(chunks), chunks))
+    return assemble(parts, [name for name, _ in items])
+
+
+def _sheet_parts(archive):
+    parts = sorted((int(m.group(1)), name) for name in archive.namelist() if (m := SHEET_PART.match(name)))
+    return [archive.read(name) for _, name in parts]
+
+
+def _register_styles(wb, stylesheet):
+    """워커 styles.xml의 셀 서식(cellXfs)을 최종 워크북에 등록하고 번호 대응표를 반환한다."""
+    remap = []
+    for style in stylesheet.cell_styles:
+        merged = StyleArray()
+        merged.fontId = wb._fonts.add(stylesheet.fonts[style.fontId])
+        merged.fillId = wb._fills.add(stylesheet.fills[style.fillId])
+        merged.borderId = wb._borders.add(stylesheet.borders[style.borderId])
+        merged.alignmentId = wb._alignments.add(stylesheet.alignments[style.alignmentId])
+        merged.protectionId = wb._protections.add(stylesheet.protections[style.protectionId])
+        merged.numFmtId = style.numFmtId  # 보고서는 기본 표시형식만 사용
+        remap.append(wb._cell_styles.add(merged))
+    return remap
+
+
+def assemble(parts, titles):
+    """워커가 만든 xlsx 조각들을 titles 순서의 시트를 가진 하나의 xlsx로 합친다."""
+    wb = Workbook(write_only=True)
+    for title in titles:
+        wb.create_sheet(title=title)
+
+    sheets = []
+    for part in parts:
+        with zipfile.ZipFile(io.BytesIO(part)) as archive:
+            remap = _register_styles(wb, Stylesheet.from_tree(fromstring(archive.read("xl/styles.xml"))))
+            renumber = lambda m: m.group(1) + str(remap[int(m.group(2))]).encode() + m.group(3)
+            sheets.extend(CELL_STYLE.sub(renumber, xml) for xml in _sheet_parts(archive))
+    if len(sheets) != len(titles):
+        raise ValueError(f"Expected {len(titles)} sheets, got {len(sheets)}")
+
+    # 빈 시트로 저장한 뼈대(workbook.xml, styles.xml 등)에 시트 XML만 바꾸어 넣는다
+    skeleton = io.BytesIO()
+    wb.save(skeleton)
+    out = io.BytesIO()
+    with zipfile.ZipFile(skeleton) as src, zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            m = SHEET_PART.match(info.filename)
+            dst.writestr(info, sheets[int(m.group(1)) - 1] if m else src.read(info))
+    return out.getvalue()
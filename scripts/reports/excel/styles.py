@@ -0,0 +1,28 @@
+"""
+styles.py
+Excel 보고서 공용 스타일 풀.
+- 셀마다 Font/Alignment/Border/PatternFill을 새로 만들지 않고, 같은 인자에 대해 하나의 객체를 공유한다.
+- openpyxl 스타일 객체는 셀에 대입될 때 값으로 복사/색인되므로 공유해도 안전하다.
+"""
+from functools import lru_cache
+from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
+
+FONT_NAME = '굴림체'
+
+THIN_SIDE = Side(border_style='thin')
+THIN_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+
+
+@lru_cache(maxsize=None)
+def get_font(size=9, bold=False):
+    return Font(size=size, bold=bold, name=FONT_NAME)
+
+
+@lru_cache(maxsize=None)
+def get_alignment(horizontal=None, vertical=None):
+    return Alignment(horizontal=horizontal, vertical=vertical)
+
+
+@lru_cache(maxsize=None)
+def get_fill(color):
+    return PatternFill(fill_type='solid', fgColor=color)
@@ -0,0 +1,146 @@
+"""
+template.py
+Excel 보고서의 고정 레이아웃(병합, 테두리, 채우기, 행/열 크기, 고정 라벨) 템플릿.
+- 레이아웃은 BufferedSheet에 한 번 기록해 두고, 시트마다 복제한 뒤 값 셀만 채운다.
+- 일반 Workbook에는 워크북별로 StyleArray를 한 번 산정해 두고 셀마다 복사만 한다 (스타일 해시 생략).
+- write-only 백엔드(BufferedSheet)에는 셀 버퍼를 그대로 복사한다.
+"""
+from copy import copy
+from weakref import WeakKeyDictionary
+from openpyxl.cell.cell import Cell, MergedCell
+from .write_only import BufferedSheet, STYLE_ATTRS
+
+_TEMPLATES = {}
+_COMPILED = WeakKeyDictionary()  # Workbook -> {SheetTemplate: [(row, col, merged, value, StyleArray)]}
+
+
+def get_template(key, factory):
+    """key(빌더, 설계기준, 행 구성)별 템플릿을 반환한다. 처음 한 번만 factory()로 만든다."""
+    template = _TEMPLATES.get(key)
+    if template is None:
+        template = _TEMPLATES[key] = factory()
+    return template
+
+
+def template_cache_info():
+    return {"templates": len(_TEMPLATES), "workbooks": len(_COMPILED)}
+
+
+class SheetTemplate:
+    """BufferedSheet에 기록된 레이아웃의 스냅샷."""
+
+    def __init__(self, layout, keep_values=True):
+        self.base_font = layout._base_font
+        self.base_rows = layout._base_rows
+        self.base_cols = layout._base_cols
+        self.cells = {}
+        for pos, cell in layout._cells.items():
+            cell = cell.copy()
+            if not keep_values:
+                cell.value = None
+            self.cells[pos] = cell
+        self.merged_ranges = list(layout.merged_ranges)
+        self.row_heights = {r: d.height for r, d in layout.row_dimensions.items() if d.height is not None}
+        self.col_widths = {c: d.width for c, d in layout.column_dimensions.items() if d.width is not None}
+
+    @classmethod
+    def record(cls, build):
+        """build(ws)가 BufferedSheet에 기록한 레이아웃(고정 라벨 포함)으로 템플릿을 만든다."""
+        layout = BufferedSheet()
+        build(layout)
+        return cls(layout)
+
+    @classmethod
+    def from_sheet(cls, sheet):
+        """값을 제외한 레이아웃만 담은 템플릿 (LSD처럼 행 구성이 달라지는 보고서용)."""
+        return cls(sheet, keep_values=False)
+
+    def cell_styles(self, pos):
+        cell = self.cells.get(pos)
+        if cell is not None:
+            return cell.styles()
+        if pos[0] <= self.base_rows and pos[1] <= self.base_cols:
+            return (self.base_font, None, None, None)
+        return (None, None, None, None)
+
+    # ── 복제 ─────────────────────────────────────────────────────────────────
+
+    def clone_into(self, ws):
+        if isinstance(ws, BufferedSheet):
+            self._clone_into_buffer(ws)
+        else:
+            self._clone_into_worksheet(ws)
+
+    def _clone_into_buffer(self, ws):
+        ws.set_base_font(self.base_font, self.base_rows, self.base_cols)
+        ws._cells = {pos: cell.copy() for pos, cell in self.cells.items()}
+        ws.merged_ranges = list(self.merged_ranges)
+        for row, height in self.row_heights.items():
+            ws.row_dimensions[row].height = height
+        for col, width in self.col_widths.items():
+            ws.column_dimensions[col].width = width
+
+    def _clone_into_worksheet(self, ws):
+        for row, height in self.row_heights.items():
+            ws.row_dimensions[row].height = height
+        for col, width in self.col_widths.items():
+            ws.column_dimensions[col].width = width
+
+        cells = ws._cells
+        for row, col, merged, value, style in self._compiled(ws):
+            if merged:
+                cell = MergedCell(ws, row=row, column=col)
+                if style is not None:
+                    cell._style = copy(style)
+            else:
+                cell = Cell(ws, row=row, column=col, value=value, style_array=copy(style) if style is not None else None)
+            cells[(row, col)] = cell
+        for coord in self.merged_ranges:
+            ws.merged_cells.add(coord)
+
+    def _compiled(self, ws):
+        per_wb = _COMPILED.setdefault(ws.parent, {})
+        compiled = per_wb.get(self)
+        if compiled is None:
+            arrays = {}
+            positions = set(self.cells)
+            positions.update((r, c) for r in range(1, self.base_rows + 1) for c in range(1, self.base_cols + 1))
+            compiled = []
+            for pos in sorted(positions):
+                cell = self.cells.get(pos)
+                style = _style_array(ws, self.cell_styles(pos), arrays)
+                compiled.append((pos[0], pos[1], bool(cell and cell.merged), cell.value if cell else None, style))
+            per_wb[self] = compiled
+        return compiled
+
+    # ── 값 채우기 (LSD) ─────────────────────────────────────────────────────────
+
+    def fill_from(self, sheet, ws):
+        """
+        sheet(BufferedSheet)에 기록된 값을 복제된 ws에 채운다.
+        템플릿과 스타일이 다른 셀(데이터에 따라 강조가 달라지는 경우 등)은 스타일도 함께 덮어쓴다.
+        """
+        arrays = {}
+        for pos in set(sheet._cells).union(self.cells):
+            styles = sheet.cell_styles(*pos)
+            if styles != self.cell_styles(pos):
+                target = ws.cell(*pos)
+                style = _style_array(ws, styles, arrays)
+                target._style = copy(style) if style is not None else type(target._style)()
+        for pos, cell in sheet._cells.items():
+            if cell.value is not None:
+                ws.cell(*pos).value = cell.value
+
+
+def _style_array(ws, styles, cache):
+    """(font, alignment, border, fill) 조합을 ws의 워크북 기준 StyleArray로 변환한다."""
+    key = tuple(map(id, styles))
+    entry = cache.get(key)
+    if entry is None:
+        probe = Cell(ws)
+        for attr, style in zip(STYLE_ATTRS, styles):
+            if style is not None:
+                setattr(probe, attr, style)
+        entry = (styles, probe._style if probe.has_style else None)
+        cache[key] = entry
+    return entry[1]
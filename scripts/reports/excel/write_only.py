@@ -0,0 +1,223 @@
+"""
+write_only.py
+openpyxl write-only 모드를 사용하는 대용량 Export 백엔드.
+- ExcelBuilder는 셀을 임의 순서로 기록하므로, 시트 하나 분량의 셀만 BufferedSheet에 모았다가
+  행 순서대로 write-only 시트에 흘려보낸다. 다음 시트를 만들거나 저장할 때 이전 시트의 버퍼는 해제된다.
+- 시트 수와 관계없이 메모리에는 현재 작성 중인 시트 하나만 남는다.
+"""
+from collections import defaultdict
+from functools import lru_cache
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string, range_boundaries
+from openpyxl.worksheet.cell_range import CellRange
+
+STYLE_ATTRS = ("font", "alignment", "border", "fill")
+EDGE_NAMES = ("top", "left", "right", "bottom")
+
+
+@lru_cache(maxsize=None)
+def _combine_border(base, extra):
+    # openpyxl의 `cell.border += Border(...)`와 같은 결과를 공유 객체로 반환
+    return (base or Border()) + extra
+
+
+class BufferedCell:
+    """스타일이 공유 객체 참조로만 남는 가벼운 셀. merged는 병합 범위의 좌상단 이외 셀 표시."""
+    __slots__ = ("value", "merged") + STYLE_ATTRS
+
+    def __init__(self, merged=False):
+        self.value = None
+        self.merged = merged
+        self.font = None
+        self.alignment = None
+        self.border = None
+        self.fill = None
+
+    def styles(self):
+        return (self.font, self.alignment, self.border, self.fill)
+
+    def copy(self):
+        cell = BufferedCell(self.merged)
+        cell.value = self.value
+        cell.font, cell.alignment, cell.border, cell.fill = self.font, self.alignment, self.border, self.fill
+        return cell
+
+
+class _Dimension:
+    __slots__ = ("height", "width")
+
+    def __init__(self):
+        self.height = None
+        self.width = None
+
+
+class BufferedSheet:
+    """
+    ExcelBuilder가 사용하는 Worksheet 인터페이스(ws['B1'], ws.cell, merge_cells,
+    row/column_dimensions)를 흉내내는 시트 버퍼. flush()에서 write-only 시트로 기록한다.
+    target 없이 만들면 템플릿 레이아웃 기록용으로 쓸 수 있다 (reports/excel/template.py).
+    """
+
+    def __init__(self, target=None, style_pool=None):
+        self._target = target
+        self._style_pool = style_pool if style_pool is not None else {}
+        self._cells = {}
+        self._base_font = None
+        self._base_rows = 0
+        self._base_cols = 0
+        self.merged_ranges = []
+        self.row_dimensions = defaultdict(_Dimension)
+        self.column_dimensions = defaultdict(_Dimension)
+
+    @property
+    def title(self):
+        return self._target.title
+
+    def set_base_font(self, font, max_row, max_col):
+        """A1 ~ (max_row, max_col) 범위의 기본 글꼴 (_setup_sheet 대체)."""
+        self._base_font = font
+        self._base_rows = max_row
+        self._base_cols = max_col
+
+    def cell(self, row, column, value=None):
+        cell = self._cells.get((row, column))
+        if cell is None:
+            cell = BufferedCell()
+            if row <= self._base_rows and column <= self._base_cols:
+                cell.font = self._base_font
+            self._cells[(row, column)] = cell
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            min_col, min_row, _, _ = range_boundaries(key.start)
+            _, _, max_col, max_row = range_boundaries(key.stop)
+            return tuple(tuple(self.cell(r, c) for c in range(min_col, max_col + 1))
+                         for r in range(min_row, max_row + 1))
+        column, row = coordinate_from_string(key)
+        return self.cell(row, column_index_from_string(column))
+
+    def merge_cells(self, range_string=None, start_row=None, start_column=None, end_row=None, end_column=None):
+        cr = CellRange(range_string=range_string, min_col=start_column, min_row=start_row,
+                       max_col=end_column, max_row=end_row)
+        self.merged_ranges.append(cr.coord)
+
+        # openpyxl MergedCellRange와 동일하게 처리:
+        # 좌상단 셀은 우하단 셀의 right/bottom 테두리를 받고, 나머지 셀은 스타일 없는 병합 셀이 되며,
+        # 가장자리 병합 셀은 좌상단 셀의 테두리를 이어받는다.
+        start = self.cell(cr.min_row, cr.min_col)
+        end = self._cells.get((cr.max_row, cr.max_col))
+        if end is not None and end is not start and end.border is not None:
+            start.border = _combine_border(start.border, Border(right=end.border.right, bottom=end.border.bottom))
+        cells = cr.cells
+        next(cells)
+        for pos in cells:
+            self._cells[pos] = BufferedCell(merged=True)
+
+        if start.border is None:
+            return
+        for name in EDGE_NAMES:
+            side = getattr(start.border, name)
+            if side and side.style is None:
+                continue
+            edge = Border(**{name: side})
+            for pos in getattr(cr, name):
+                cell = self._cells[pos]
+                cell.border = _combine_border(cell.border, edge)
+
+    def cell_styles(self, row, column):
+        """(row, column) 셀의 (font, alignment, border, fill). 기록되지 않은 셀은 기본 글꼴 영역 여부로 판단."""
+        cell = self._cells.get((row, column))
+        if cell is not None:
+            return cell.styles()
+        if row <= self._base_rows and column <= self._base_cols:
+            return (self._base_font, None, None, None)
+        return (None, None, None, None)
+
+    def flush(self):
+        """버퍼의 셀을 행 순서대로 write-only 시트에 기록하고 버퍼를 비운다."""
+        target = self._target
+        for row, dim in self.row_dimensions.items():
+            if dim.height is not None:
+                target.row_dimensions[row].height = dim.height
+        for col, dim in self.column_dimensions.items():
+            if dim.width is not None:
+                target.column_dimensions[col].width = dim.width
+        for coord in self.merged_ranges:
+            target.merged_cells.add(coord)
+
+        by_row = {}
+        for (row, col), cell in self._cells.items():
+            by_row.setdefault(row, {})[col] = cell
+
+        max_row = max([self._base_rows] + list(by_row))
+        for row in range(1, max_row + 1):
+            cells = by_row.get(row, {})
+            width = max([self._base_cols if row <= self._base_rows else 0] + list(cells))
+            values = []
+            for col in range(1, width + 1):
+                cell = cells.get(col)
+                if cell is None:
+                    in_base = row <= self._base_rows and col <= self._base_cols
+                    values.append(self._write_cell(None, (self._base_font, None, None, None)) if in_base else None)
+                else:
+                    values.append(self._write_cell(cell.value, cell.styles()))
+            target.append(values)
+        self._cells = {}
+
+    def _write_cell(self, value, styles):
+        out = WriteOnlyCell(self._target, value=value)
+        style_array = self._style_array(styles)
+        if style_array is not None:
+            out._style = style_array
+        return out
+
+    def _style_array(self, styles):
+        """
+        (font, alignment, border, fill) 조합별 StyleArray를 워크북 단위로 한 번만 산정한다.
+        빌더가 styles.py의 공유 객체를 쓰므로 객체 id로 찾을 수 있고, 셀마다 스타일을 해시하지 않는다.
+        """
+        key = tuple(map(id, styles))
+        entry = self._style_pool.get(key)
+        if entry is None:
+            template = WriteOnlyCell(self._target)
+            for attr, style in zip(STYLE_ATTRS, styles):
+                if style is not None:
+                    setattr(template, attr, style)
+            # styles도 함께 보관하여 id가 재사용되지 않도록 한다
+            entry = (styles, template._style if template.has_style else None)
+            self._style_pool[key] = entry
+        return entry[1]
+
+
+class WriteOnlyWorkbook:
+    """
+    ExcelBuilder.add_to_workbook()에 Workbook 대신 넘길 수 있는 write-only 워크북.
+    create_sheet()가 호출되면 이전 시트를 기록하고 버퍼를 해제한다.
+    """
+
+    def __init__(self):
+        self._wb = Workbook(write_only=True)
+        self._current = None
+        self._style_pool = {}  # 시트 간 공유되는 StyleArray 풀
+
+    def create_sheet(self, title=None):
+        self._flush_current()
+        self._current = BufferedSheet(self._wb.create_sheet(title=title), self._style_pool)
+        return self._current
+
+    def _flush_current(self):
+        if self._current is not None:
+            self._current.flush()
+            self._current = None
+
+    def save(self, filename):
+        self._flush_current()
+        self._wb.save(filename)
+
+    def close(self):
+        self._wb.close()
@@ -8,6 +8,7 @@ excel_builder.py  — Facade
     KCI/KDS계열      → KCIExcelBuilder       (reports/excel/kci_excel_builder.py)
     USD 2010(기본)   → USD2010ExcelBuilder   (reports/excel/usd_2010_excel_builder.py)
 """
+from core.phase_timer import phase
 from .excel import get_excel_builder
 
 
@@ -21,4 +22,5 @@ class ExcelReportBuilder:
         self._builder = get_excel_builder(analyzer)
 
     def add_to_workbook(self, wb, sheet_name):
-        return self._builder.add_to_workbook(wb, sheet_name)
+        with phase("report.excel"):
+            return self._builder.add_to_workbook(wb, sheet_name)
@@ -4,9 +4,27 @@ base_text_builder.py
 - 섹션 1~5 (단면제원, 재료상수, 강도감소계수, 필요/사용철근량) 공통 구현
 - 전단 및 균열 검토 공통 구현 (USD 계열)
 - 서브클래스에서 반드시 구현해야 하는 메서드 선언
+- 섹션 선택(select_sections): 요청하지 않은 섹션은 만들지 않는다
 """
 from abc import ABC, abstractmethod
 
+# 보고서 섹션 (출력 순서)
+SECTIONS = ("flexure", "shear", "service")
+
+
+def select_sections(sections=None):
+    """요청한 섹션 이름을 검증하여 보고서 순서대로 반환한다. None이면 전체 섹션."""
+    if sections is None:
+        return SECTIONS
+    if isinstance(sections, str):
+        sections = [sections]
+    unknown = sorted(set(sections) - set(SECTIONS))
+    if unknown:
+        raise ValueError(f"Unknown report sections: {unknown} (expected {list(SECTIONS)})")
+    if not sections:
+        raise ValueError("No report sections selected")
+    return tuple(name for name in SECTIONS if name in sections)
+
 
 class BaseTextBuilder(ABC):
     """
@@ -18,32 +36,27 @@ class BaseTextBuilder(ABC):
         self.analyzer = analyzer
         self.std = analyzer.standard
 
-    def generate(self):
-        """보고서를 생성하여 딕셔너리로 반환한다."""
+    def generate(self, sections=None):
+        """보고서를 생성하여 딕셔너리로 반환한다. sections로 고른 섹션만 만든다 (None이면 전체)."""
+        sections = select_sections(sections)
         try:
-            ana = self.analyzer
-            header = self._build_header()
-            flex_all = self._build_flexure_sections(header)
-            shear = self._build_shear_section()
-            service = self._build_service_section()
-
-            total = []
-            total.extend(flex_all)
-            total.append("")
-            total.extend(shear)
-            total.append("")
-            total.extend(service)
-
-            return {
-                "total": "\n".join(total),
-                "flexure": "\n".join(flex_all),
-                "shear": "\n".join(shear),
-                "service": "\n".join(service),
+            builders = {
+                "flexure": lambda: self._build_flexure_sections(self._build_header()),
+                "shear": self._build_shear_section,
+                "service": self._build_service_section,
             }
+            result, total = {}, []
+            for name in sections:
+                lines = builders[name]()
+                if total:
+                    total.append("")
+                total.extend(lines)
+                result[name] = "\n".join(lines)
+            return {"total": "\n".join(total), **result}
         except Exception as e:
             import traceback
             err_msg = f"보고서 생성 중 오류 발생: {str(e)}\n{traceback.format_exc()}"
-            return {"total": err_msg, "flexure": err_msg, "shear": err_msg, "service": err_msg}
+            return dict.fromkeys(("total",) + sections, err_msg)
 
     # ── 공통 섹션 ────────────────────────────────────────────────────────────
 
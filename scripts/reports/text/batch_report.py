@@ -0,0 +1,47 @@
+"""
+batch_report.py
+여러 행의 텍스트 보고서를 한 번에 만드는 배치 렌더러.
+- 행마다 get_text_builder로 설계법별 빌더를 골라 요청한 섹션만 생성한다.
+- 행이 많으면 프로세스 풀로 나누어 렌더링하고, 결과는 항상 입력 행 순서를 유지한다.
+- zip 출력은 행마다 하나의 .txt 파일(UTF-8)을 담는다.
+"""
+import io
+import math
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from core.phase_timer import phase
+from . import get_text_builder
+
+
+def render_row(analyze, mat, sections, row):
+    """워커: 한 행을 해석하여 보고서 딕셔너리를 반환한다."""
+    builder = get_text_builder(analyze(mat, row))
+    with phase("report.text"):
+        return builder.generate(sections)
+
+
+def render_reports(analyze, mat, rows, sections, workers=1):
+    """
+    rows의 보고서를 입력 순서대로 반환한다.
+    analyze(mat, row)는 분석이 끝난 RCSectionAnalyzer를 반환하는 최상위 함수여야 한다 (pickle 가능).
+    """
+    render = partial(render_row, analyze, mat, sections)
+    if workers <= 1:
+        return [render(row) for row in rows]
+
+    # 워커 수보다 조금 잘게 나누어 행별 계산량 차이에 따른 대기 시간을 줄인다
+    chunksize = max(1, math.ceil(len(rows) / (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render, rows, chunksize=chunksize))
+
+
+def build_zip(names, reports):
+    """보고서의 total 텍스트를 '<이름>.txt' 파일로 담은 zip 바이트를 반환한다."""
+    buffer = io.BytesIO()
+    with phase("report.zip"), zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, report in zip(names, reports):
+            filename = name.replace("/", "_").replace("\\", "_")
+            archive.writestr(f"{filename}.txt", report["total"].encode("utf-8"))
+    return buffer.getvalue()
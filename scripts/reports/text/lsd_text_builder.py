@@ -4,6 +4,8 @@ lsd_text_builder.py
 """
 import math
 
+from .base_text_builder import select_sections
+
 
 class LSDTextBuilder:
     """한계상태설계법(LSD) 전용 텍스트 보고서 빌더."""
@@ -12,15 +14,30 @@ class LSDTextBuilder:
         self.analyzer = analyzer
         self.std = analyzer.standard
 
-    def generate(self):
+    def generate(self, sections=None):
+        """보고서를 생성한다. sections로 고른 섹션(flexure/shear/service)만 만든다 (None이면 전체)."""
+        sections = select_sections(sections)
         try:
-            return self._build_report()
+            return self._build_report(sections)
         except Exception as e:
             import traceback
             err_msg = f"보고서 생성 중 오류 발생: {str(e)}\n{traceback.format_exc()}"
-            return {"total": err_msg, "flexure": err_msg, "shear": err_msg, "service": err_msg}
+            return dict.fromkeys(("total",) + sections, err_msg)
+
+    def _build_report(self, sections):
+        builders = {"flexure": self._build_flexure, "shear": self._build_shear, "service": self._build_service}
+        result, total = {}, []
+        for name in sections:
+            lines = builders[name]()
+            if lines is None:
+                result[name] = "사용성 검토 결과가 없습니다."
+                continue
+            total.extend(lines)
+            result[name] = "\n".join(lines)
+        return {"total": "\n".join(total), **result}
 
-    def _build_report(self):
+    def _build_flexure(self):
+        """헤더와 1)~6) 휨 검토"""
         ana = self.analyzer
         con = ana.con_material
 
@@ -129,8 +146,11 @@ class LSDTextBuilder:
         mom.append(f"  Mr = {ana.as_use:>8.1f} \u00d7 {ana.f_yd:.0f} \u00d7 ( {ana.d_eff:^7.1f} - a / 2 ) = {ana.M_r/1e6:>8.2f} kN.m")
         mom.append(f"     \u2265 Mu ( = {ana.Mu:>8.3f} kN.m)  \u2234 {res_m}   [ S.F = {ana.M_sf:>8.3f} ]")
         mom.append("")
+        return header + sec_prop + con_mat + reb_mat + req_as + used_as + rebar_check + mom
 
-        # Shear
+    def _build_shear(self):
+        """7) 전단검토 및 종방향 철근의 추가인장력 검토"""
+        ana = self.analyzer
         shr = []
         vd = ana.v_details
         shr.append("7) 전단검토 (d = {0:>10.1f} mm)".format(ana.d_eff))
@@ -218,79 +238,66 @@ class LSDTextBuilder:
             comp_sym = "\u2264" if t_ok == "O.K" else ">"
             add_reb.append(f"  \u2234 \u0394T = {ana.delta_t/1e3:.2f} kN {comp_sym} \u0394TB = {ana.delta_tb/1e3:.2f} kN .. {t_ok}")
 
-        total = []
-        total.extend(header)
-        total.extend(sec_prop)
-        total.extend(con_mat)
-        total.extend(reb_mat)
-        total.extend(req_as)
-        total.extend(used_as)
-        total.extend(rebar_check)
-        total.extend(mom)
-        total.extend(shr)
-        total.extend(add_reb)
+        return shr + add_reb
 
+    def _build_service(self):
+        """8) 균열 및 철근 간격 검토 (사용성 검토 결과가 없으면 None)"""
+        ana = self.analyzer
         # Serviceability (Crack)
-        if hasattr(ana, 'service_details'):
-            sd = ana.service_details
-            srv = []
-            srv.append("")
-            #srv.append("-" * 80)
-            srv.append("8) 균열 및 철근 간격 검토")
-            #srv.append("-" * 80)
-            
-            # 1. Min Rebar
-            srv.append("  \u2460 최소철근량 검토")
-            as_min_formula = "kc \u00d7 k \u00d7 Act \u00d7 fct / fs"
-            as_min_calc = f"{sd.get('kc',0.4):.2f} \u00d7 {sd.get('k_scale',1.0):.2f} \u00d7 {sd.get('Act',0):.0f} \u00d7 {sd.get('fctm',0):.2f} / {ana.f_y:.0f}"
-            srv.append(f"     As_min = {as_min_formula}")
-            srv.append(f"            = {as_min_calc} = {sd.get('as_min_lsd',0):>8.2f} mm\u00b2")
-            
-            srv.append(f"        kc  : 균열발생 직전의 단면 내 응력 분포 상태를 반영하는 계수 = {sd.get('kc',0.4):.2f}")
-            srv.append(f"        k   : 부등 분포하는 응력의 영향을 반영하는 계수          = {sd.get('k_scale',1.0):.2f}")
-            srv.append(f"        Act : 첫 균열발생 직전 상태의 콘크리트 인장영역 단면적    = {sd.get('Act',0):.0f} mm\u00b2")
-            srv.append(f"        fct : 첫 균열 발생 시 유효 콘크리트 인장강도 (fctm)      = {sd.get('fctm',0):.2f} MPa")
-            srv.append(f"        fs  : 허용하는 철근 인장강도 (fy)                        = {ana.f_y:.0f} MPa")
-            
-            status_min = "O.K" if ana.as_use >= sd.get('as_min_lsd', 0) else "N.G"
-            srv.append(f"     As_use = {ana.as_use:>8.2f} mm\u00b2 > As_min = {sd.get('as_min_lsd',0):>8.2f} mm\u00b2    \u2234 {status_min}")
-            srv.append("")
-            
-            # 2. Indirect Crack Control (Stress fs)
-            srv.append("  \u2461 간접균열제어")
-            srv.append(f"     사용 한계상태 모멘트 (Ms) = {sd.get('Ms_knm',0):>8.3f} kN.m")
-            fs_formula = "Ms / ( As \u00d7 ( d - c / 3 ) )"
-            fs_calc = f"{sd.get('Ms_knm',0)*1e3:.3f} / ( {ana.as_use:.1f} \u00d7 ( {ana.d_eff:.1f} - {sd.get('c_neutral',0):.1f} / 3 ) )"
-            srv.append(f"     fs = {fs_formula}")
-            srv.append(f"        = {fs_calc}")
-            srv.append(f"        = {sd.get('fs',0):>8.3f} MPa \u2264 fsa = 0.8 \u00d7 fy = {sd.get('fsa',0):.1f} MPa    \u2234 {'O.K' if sd.get('fs',0) <= sd.get('fsa',0) else 'N.G'}")
-            
-            srv.append(f"        n   : 탄성계수비 (Es / Ec)                              = {sd.get('n',0):.2f}")
-            srv.append(f"        \u03c1   : 철근비                                            = {sd.get('rho',0):.5f}")
-            srv.append(f"        k   : 중립축 비                                         = {sd.get('k_neutral',0):.5f}")
-            srv.append(f"        c   : 중립축 (kd)                                       = {sd.get('c_neutral',0):.1f} mm")
-            srv.append("")
-            
-            # 3. Max Bar Diameter check
-            srv.append(f"  \u2462 철근직경검토 (KDS 24 14 21, 표 4.2-4)")
-            dia_limit = sd.get('max_dia_limit', 0)
-            dia_use = ana.as_dia1
-            srv.append(f"     \u03a6_limit = {dia_limit:.1f} mm (fs = {sd.get('fs',0):.1f} MPa 기준)")
-            srv.append(f"     \u03a6_use = {dia_use:.0f} mm \u2264 \u03a6_limit = {dia_limit:.1f} mm    \u2234 {'O.K' if dia_use <= dia_limit else 'N.G'}")
-            srv.append("")
-
-            # 4. Spacing check
-            srv.append(f"  \u2463 철근 간격검토 (KDS 24 14 21, 표 4.2-5)")
-            sa_val = sd.get('sa_limit', 300.0)
-            s_table = sd.get('s_table_limit', 300.0)
-            srv.append(f"     Sa = min(3d, {s_table:.1f}) = {sa_val:.1f} mm")
-            s_use = ana.beam_b / ana.as_num1 if ana.as_num1 > 0 else 0
-            srv.append(f"     S = {ana.beam_b:.0f} / {ana.as_num1:.1f} EA = {s_use:>8.1f} mm \u2264 Sa = {sa_val:.1f} mm    \u2234 {'O.K' if s_use <= sa_val else 'N.G'}")
-            total.extend(srv)
+        if not hasattr(ana, 'service_details'):
+            return None
+        sd = ana.service_details
+        srv = []
+        srv.append("")
+        #srv.append("-" * 80)
+        srv.append("8) 균열 및 철근 간격 검토")
+        #srv.append("-" * 80)
+        
+        # 1. Min Rebar
+        srv.append("  \u2460 최소철근량 검토")
+        as_min_formula = "kc \u00d7 k \u00d7 Act \u00d7 fct / fs"
+        as_min_calc = f"{sd.get('kc',0.4):.2f} \u00d7 {sd.get('k_scale',1.0):.2f} \u00d7 {sd.get('Act',0):.0f} \u00d7 {sd.get('fctm',0):.2f} / {ana.f_y:.0f}"
+        srv.append(f"     As_min = {as_min_formula}")
+        srv.append(f"            = {as_min_calc} = {sd.get('as_min_lsd',0):>8.2f} mm\u00b2")
+        
+        srv.append(f"        kc  : 균열발생 직전의 단면 내 응력 분포 상태를 반영하는 계수 = {sd.get('kc',0.4):.2f}")
+        srv.append(f"        k   : 부등 분포하는 응력의 영향을 반영하는 계수          = {sd.get('k_scale',1.0):.2f}")
+        srv.append(f"        Act : 첫 균열발생 직전 상태의 콘크리트 인장영역 단면적    = {sd.get('Act',0):.0f} mm\u00b2")
+        srv.append(f"        fct : 첫 균열 발생 시 유효 콘크리트 인장강도 (fctm)      = {sd.get('fctm',0):.2f} MPa")
+        srv.append(f"        fs  : 허용하는 철근 인장강도 (fy)                        = {ana.f_y:.0f} MPa")
+        
+        status_min = "O.K" if ana.as_use >= sd.get('as_min_lsd', 0) else "N.G"
+        srv.append(f"     As_use = {ana.as_use:>8.2f} mm\u00b2 > As_min = {sd.get('as_min_lsd',0):>8.2f} mm\u00b2    \u2234 {status_min}")
+        srv.append("")
+        
+        # 2. Indirect Crack Control (Stress fs)
+        srv.append("  \u2461 간접균열제어")
+        srv.append(f"     사용 한계상태 모멘트 (Ms) = {sd.get('Ms_knm',0):>8.3f} kN.m")
+        fs_formula = "Ms / ( As \u00d7 ( d - c / 3 ) )"
+        fs_calc = f"{sd.get('Ms_knm',0)*1e3:.3f} / ( {ana.as_use:.1f} \u00d7 ( {ana.d_eff:.1f} - {sd.get('c_neutral',0):.1f} / 3 ) )"
+        srv.append(f"     fs = {fs_formula}")
+        srv.append(f"        = {fs_calc}")
+        srv.append(f"        = {sd.get('fs',0):>8.3f} MPa \u2264 fsa = 0.8 \u00d7 fy = {sd.get('fsa',0):.1f} MPa    \u2234 {'O.K' if sd.get('fs',0) <= sd.get('fsa',0) else 'N.G'}")
+        
+        srv.append(f"        n   : 탄성계수비 (Es / Ec)                              = {sd.get('n',0):.2f}")
+        srv.append(f"        \u03c1   : 철근비                                            = {sd.get('rho',0):.5f}")
+        srv.append(f"        k   : 중립축 비                                         = {sd.get('k_neutral',0):.5f}")
+        srv.append(f"        c   : 중립축 (kd)                                       = {sd.get('c_neutral',0):.1f} mm")
+        srv.append("")
+        
+        # 3. Max Bar Diameter check
+        srv.append(f"  \u2462 철근직경검토 (KDS 24 14 21, 표 4.2-4)")
+        dia_limit = sd.get('max_dia_limit', 0)
+        dia_use = ana.as_dia1
+        srv.append(f"     \u03a6_limit = {dia_limit:.1f} mm (fs = {sd.get('fs',0):.1f} MPa 기준)")
+        srv.append(f"     \u03a6_use = {dia_use:.0f} mm \u2264 \u03a6_limit = {dia_limit:.1f} mm    \u2234 {'O.K' if dia_use <= dia_limit else 'N.G'}")
+        srv.append("")
 
-        return {
-            "total": "\n".join(total),
-            "flexure": "\n".join(header + sec_prop + con_mat + reb_mat + req_as + used_as + rebar_check + mom),
-            "shear": "\n".join(shr + add_reb),
-            "service": "\n".join(srv) if hasattr(ana, 'service_details') else "사용성 검토 결과가 없습니다."
-        }
+        # 4. Spacing check
+        srv.append(f"  \u2463 철근 간격검토 (KDS 24 14 21, 표 4.2-5)")
+        sa_val = sd.get('sa_limit', 300.0)
+        s_table = sd.get('s_table_limit', 300.0)
+        srv.append(f"     Sa = min(3d, {s_table:.1f}) = {sa_val:.1f} mm")
+        s_use = ana.beam_b / ana.as_num1 if ana.as_num1 > 0 else 0
+        srv.append(f"     S = {ana.beam_b:.0f} / {ana.as_num1:.1f} EA = {s_use:>8.1f} mm \u2264 Sa = {sa_val:.1f} mm    \u2234 {'O.K' if s_use <= sa_val else 'N.G'}")
+        return srv
@@ -8,6 +8,7 @@ text_builder.py  — Facade
     KCI/KDS계열      → KCITextBuilder        (reports/text/kci_text_builder.py)
     USD 2010(기본)   → USD2010TextBuilder    (reports/text/usd_2010_text_builder.py)
 """
+from core.phase_timer import phase
 from .text import get_text_builder
 
 
@@ -20,5 +21,6 @@ class TextReportBuilder:
     def __init__(self, analyzer):
         self._builder = get_text_builder(analyzer)
 
-    def generate(self):
-        return self._builder.generate()
+    def generate(self, sections=None):
+        with phase("report.text"):
+            return self._builder.generate(sections)
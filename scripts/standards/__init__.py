@@ -1,17 +1,55 @@
-from .usd_2010 import USD2010
-from .kds_2021 import KDS2021
-from .lsd_2015 import LSD2015
-from .lsd_2012 import LSD2012
-from .kci_2017 import KCI2017
+"""
+standards/__init__.py
+설계기준 이름에 맞는 Standard 인스턴스를 반환하는 Factory 함수.
+각 설계기준 모듈은 실제로 선택될 때만 import 한다. (예: LSD2012는 scipy를 사용)
+설계기준 이름은 한 번만 해석하고, 기준마다 하나의 읽기 전용 인스턴스를 공유한다.
+"""
+import importlib
+from functools import lru_cache
 
-def get_standard(standard_name):
+_STANDARD_MODULES = {
+    "USD2010": ".usd_2010",
+    "KDS2021": ".kds_2021",
+    "LSD2015": ".lsd_2015",
+    "LSD2012": ".lsd_2012",
+    "KCI2017": ".kci_2017",
+}
+
+
+def _load(class_name):
+    module = importlib.import_module(_STANDARD_MODULES[class_name], __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name):
+    # `from standards import LSD2012` 형태의 기존 사용법 유지
+    if name in _STANDARD_MODULES:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_INSTANCES = {}
+
+
+@lru_cache(maxsize=None)
+def resolve_standard_key(standard_name):
+    """설계기준 이름 → 클래스 이름 (문자열 매칭은 이름마다 한 번만 수행)"""
     if "2021" in standard_name:
-        return KDS2021()
+        return "KDS2021"
     elif "2015" in standard_name:
-        return LSD2015()
+        return "LSD2015"
     elif "2012" in standard_name:
-        return LSD2012()
+        return "LSD2012"
     elif "콘크리트" in standard_name or "KCI" in standard_name:
-        return KCI2017()
+        return "KCI2017"
     else:
-        return USD2010()
+        return "USD2010"
+
+
+def get_standard(standard_name):
+    key = resolve_standard_key(standard_name)
+    instance = _INSTANCES.get(key)
+    if instance is None:
+        instance = _load(key)().freeze()
+        _INSTANCES[key] = instance
+    return instance
@@ -2,6 +2,16 @@ from abc import ABC, abstractmethod
 import math
 
 class BaseDesignStandard(ABC):
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} instance is shared by get_standard() and read-only")
+        super().__setattr__(name, value)
+
+    def freeze(self):
+        """get_standard()가 공유하는 인스턴스를 읽기 전용으로 만든다."""
+        object.__setattr__(self, "_frozen", True)
+        return self
+
     @property
     @abstractmethod
     def name(self):
@@ -43,6 +53,10 @@ class BaseDesignStandard(ABC):
         # Default implementation remains in the analyzer or provided here
         return None 
 
+    def has_shear_model(self):
+        """calc_shear_capacity를 구현한 기준인지 (θ가 하중에 따라 정해지므로 단면 저항 단계에서 제외)."""
+        return type(self).calc_shear_capacity is not BaseDesignStandard.calc_shear_capacity
+
     def get_beta_1(self, f_ck):
         """등가 사각형 응력 블록 깊이 계수 산정"""
         if f_ck <= 28:
@@ -107,3 +121,48 @@ class BaseDesignStandard(ABC):
             "lo_bal": lo_bal,
             "details": f"ρmax = {lo_max:.6f}"
         }
+
+    # ── 배열 버전 (RCSectionBatch용) ─────────────────────────────────────────
+
+    def get_phi_f_array(self, epsilon_t, epsilon_y):
+        """get_phi_f의 배열 버전. 기본은 원소별로 get_phi_f를 호출한다."""
+        import numpy as np
+        pairs = zip(np.ravel(epsilon_t).tolist(), np.ravel(epsilon_y).tolist())
+        return np.array([self.get_phi_f(t, y)[0] for t, y in pairs], dtype=float)
+
+    def calc_shear_capacity_array(self, batch):
+        """calc_shear_capacity의 배열 버전. None이면 RCSectionBatch의 기본(USD) 전단 로직을 사용한다."""
+        return None
+
+    def check_min_rebar_array(self, calc_data):
+        """check_min_rebar의 배열 버전 (calc_data의 값은 numpy 배열)"""
+        import numpy as np
+        f_ck = calc_data['f_ck']
+        f_y = calc_data['f_y']
+        divisor = calc_data['b'] * calc_data['d']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lo_min_1 = np.where(f_y > 0, 1.4 / f_y, 0.0)
+            lo_min_2 = np.where(f_y > 0, 0.25 * np.sqrt(f_ck) / f_y, 0.0)
+            lo_min = np.maximum(lo_min_1, lo_min_2)
+            lo_use = np.where(divisor > 0, calc_data['as_use'] / divisor, 0.0)
+            lo_min_3 = np.where(divisor > 0, (4/3) * (calc_data['as_req'] / divisor), 0.0)
+
+        is_ok = (lo_use >= lo_min) | (lo_use >= lo_min_3)
+        return {"is_ok": is_ok, "lo_min": lo_min, "lo_min_3": lo_min_3}
+
+    def check_max_rebar_array(self, calc_data):
+        """check_max_rebar의 배열 버전 (beta_1은 calc_data['beta_1']로 전달)"""
+        import numpy as np
+        f_ck = calc_data['f_ck']
+        f_y = calc_data['f_y']
+        beta_1 = calc_data['beta_1']
+        divisor = calc_data['b'] * calc_data['d']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lo_bal = np.where(f_y > 0, (0.85 * beta_1 * f_ck / f_y) * (600 / (600 + f_y)), 0.0)
+            lo_max = 0.75 * lo_bal
+            lo_use = np.where(divisor > 0, calc_data['as_use'] / divisor, 0.0)
+
+        is_ok = lo_use <= lo_max
+        return {"is_ok": is_ok, "lo_max": lo_max, "lo_bal": lo_bal}
@@ -97,3 +97,35 @@ class KCI2017(BaseDesignStandard):
             "rho_bal": rho_b,
             "details": f"ρmax = {rho_max:.6f}, ρuse = {rho_use:.6f}"
         }
+
+    def check_min_rebar_array(self, calc_data):
+        """check_min_rebar의 배열 버전 (phi*Mn >= min(1.2*Mcr, 4/3*Mu))"""
+        import numpy as np
+        b = calc_data['b']
+        h = calc_data['h']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ig = (b * (h ** 3)) / 12.0
+            fr = 0.63 * np.sqrt(calc_data['f_ck'])
+            mcr = (fr * ig) / (h / 2.0)
+            limit = np.minimum(1.2 * mcr, (4.0/3.0) * calc_data['mu_nm'])
+
+        is_ok = calc_data['phi_mn'] >= limit
+        return {"is_ok": is_ok, "mcr": mcr, "limit": limit, "ig": ig, "fr": fr}
+
+    def check_max_rebar_array(self, calc_data):
+        """check_max_rebar의 배열 버전 (rho_max = 0.726 * rho_b, alpha = 0.80)"""
+        import numpy as np
+        f_ck = calc_data['f_ck']
+        f_y = calc_data['f_y']
+        alpha = 0.80
+        ecu = 0.0033
+        es = 200000.0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rho_b = alpha * 0.85 * (f_ck / f_y) * (ecu * es) / (ecu * es + f_y)
+            rho_max = 0.726 * rho_b
+            rho_use = calc_data['as_use'] / (calc_data['b'] * calc_data['d'])
+
+        is_ok = rho_use <= rho_max
+        return {"is_ok": is_ok, "rho_max": rho_max, "rho_use": rho_use, "rho_bal": rho_b}
@@ -1,19 +1,34 @@
 import math
-import numpy as np
-from scipy import interpolate
+from bisect import bisect_left
 from .base_standard import BaseDesignStandard
 
+
+def _build_segments(xs, ys):
+    """구간별 (x0, y0, slope) 보간표를 미리 계산한다."""
+    return tuple((xs[i], ys[i], (ys[i+1] - ys[i]) / (xs[i+1] - xs[i])) for i in range(len(xs) - 1))
+
+
 class LSD2012(BaseDesignStandard):
     """
     한계상태설계법 (도로교 설계기준, 2012)
     사용자 제공 Sec_back 로직 반영
     """
-    def __init__(self):
-        # Interpolation tables for alpha, beta, eta
-        self.fck_list = [40, 50, 60, 70, 80, 90]
-        self.alpha_list = [0.8, 0.78, 0.72, 0.67, 0.63, 0.59]
-        self.beta_list = [0.4, 0.4, 0.38, 0.37, 0.36, 0.35]
-        self.eta_list = [1.0, 0.97, 0.95, 0.91, 0.87, 0.84]
+    # Interpolation tables for alpha, beta, eta
+    fck_list = (40, 50, 60, 70, 80, 90)
+    alpha_list = (0.8, 0.78, 0.72, 0.67, 0.63, 0.59)
+    beta_list = (0.4, 0.4, 0.38, 0.37, 0.36, 0.35)
+    eta_list = (1.0, 0.97, 0.95, 0.91, 0.87, 0.84)
+
+    # Precomputed linear segments (same arithmetic as scipy interp1d: slope * (x - x0) + y0)
+    _alpha_segments = _build_segments(fck_list, alpha_list)
+    _beta_segments = _build_segments(fck_list, beta_list)
+    _eta_segments = _build_segments(fck_list, eta_list)
+
+    def _interp(self, segments, f_ck):
+        # interp1d picks the left segment at interior knots (searchsorted side='left')
+        i = min(max(bisect_left(self.fck_list, f_ck), 1), len(self.fck_list) - 1) - 1
+        x0, y0, slope = segments[i]
+        return slope * (f_ck - x0) + y0
 
     @property
     def name(self):
@@ -37,19 +52,31 @@ class LSD2012(BaseDesignStandard):
             alpha = self.alpha_list[5]
             beta = self.beta_list[5]
         else:
-            f_alpha = interpolate.interp1d(self.fck_list, self.alpha_list)
-            alpha = float(f_alpha(f_ck))
-            f_beta = interpolate.interp1d(self.fck_list, self.beta_list)
-            beta = float(f_beta(f_ck))
-            
+            alpha = self._interp(self._alpha_segments, f_ck)
+            beta = self._interp(self._beta_segments, f_ck)
+
         return alpha, beta
 
+    def get_eta(self, f_ck):
+        """등가 사각형 응력 블록의 크기계수 (eta)"""
+        f_ck = min(max(f_ck, self.fck_list[0]), self.fck_list[-1])
+        return self._interp(self._eta_segments, f_ck)
+
     def get_phi_f(self, epsilon_t, epsilon_y):
         return 1.0, "한계상태(LSD)"
 
     def get_phi_v(self):
         return 1.0
 
+    def get_phi_f_array(self, epsilon_t, epsilon_y):
+        import numpy as np
+        return np.full(np.shape(epsilon_t), 1.0)
+
+    def calc_shear_capacity_array(self, batch):
+        """가변각 트러스 모델 (LSD 2012) — RCSectionBatch용 배열 버전"""
+        from .lsd_shear import calc_truss_shear_array
+        return calc_truss_shear_array(batch)
+
     def calc_shear_capacity(self, analyzer):
         """가변각 트러스 모델 (LSD 2012)"""
         # (This will be called by RCSectionAnalyzer)
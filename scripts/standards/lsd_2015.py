@@ -13,6 +13,15 @@ class LSD2015(BaseDesignStandard):
     def get_phi_v(self):
         return 1.0
 
+    def get_phi_f_array(self, epsilon_t, epsilon_y):
+        import numpy as np
+        return np.full(np.shape(epsilon_t), 1.0)
+
+    def calc_shear_capacity_array(self, batch):
+        """가변각 트러스 모델 (LSD 2015) — RCSectionBatch용 배열 버전"""
+        from .lsd_shear import calc_truss_shear_array
+        return calc_truss_shear_array(batch)
+
     def get_concrete_method(self):
         return "LSD"
 
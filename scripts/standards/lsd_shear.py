@@ -0,0 +1,74 @@
+"""
+lsd_shear.py
+LSD 가변각 트러스 모델 전단강도의 배열(NumPy) 버전.
+LSD2012 / LSD2015의 calc_shear_capacity와 동일한 식을 RCSectionBatch의 모든 행에 한 번에 적용한다.
+"""
+import numpy as np
+
+
+def calc_truss_shear_array(batch):
+    """가변각 트러스 모델 (LSD 2012/2015 공통) — batch의 열 배열을 사용한다."""
+    f_ck = batch.f_ck
+    phi_s = batch.phi_s
+    phi_c = batch.phi_c
+    f_y = batch.f_y
+    B = batch.beam_b
+    D = batch.d_tensile
+    Vu_n = batch.Vu_n
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = 0.9 * D
+        nu = 0.6 * (1 - f_ck / 250)
+
+        # Section checking (Vdmax): cot(theta) = 2.5 / 1.0
+        asin_divisor = nu * phi_c * f_ck * B * z
+        Vdmax1 = asin_divisor / (2.5 + 1 / 2.5)
+        Vdmax2 = asin_divisor / (1.0 + 1 / 1.0)
+
+        # Automatic cot(theta) in closed form: Vu = nu*phi_c*fck*b*z * sin(2 theta) / 2
+        val_to_asin = np.where(asin_divisor > 0, Vu_n / asin_divisor, 0.0)
+        in_range = np.abs(val_to_asin) <= 1.0
+        tan_theta = np.tan(0.5 * np.arcsin(np.clip(val_to_asin, -1.0, 1.0)))
+        cot_auto = np.where(tan_theta != 0, 1 / tan_theta, 2.5)
+        cot_auto = np.where(in_range, np.clip(cot_auto, 1.0, 2.5), 1.0)
+        cot_theta = np.where(Vu_n <= Vdmax1, 2.5, np.where(Vu_n > Vdmax2, 1.0, cot_auto))
+
+        # Concrete capacity (Vc)
+        k = np.where(D > 0, 1 + np.sqrt(200 / D), 2.0)
+        k = np.minimum(k, 2.0)
+        rho_l = batch.rho_l_tensile
+        rho_l_limited = np.minimum(rho_l, 0.02)
+
+        Ac = B * batch.beam_h
+        fn = np.where(Ac > 0, batch.Nu * 1e3 / Ac, 0.0)
+        fn_limited = np.minimum(fn, 0.2 * phi_c * f_ck)
+        f_ctk = batch.f_ctk
+
+        Vcd_calc = (0.85 * phi_c * k * (rho_l_limited * f_ck)**(1/3) + 0.15 * fn_limited) * (B * D)
+        Vcd_min = (0.4 * phi_c * f_ctk + 0.15 * fn_limited) * (B * D)
+        V_c = np.maximum(Vcd_calc, Vcd_min)
+
+        # Stirrup capacity
+        av_use = batch.av_use
+        av_space = batch.av_space
+        V_s = np.where(av_space > 0, (phi_s * f_y * av_use * z / av_space) * cot_theta, 0.0)
+
+        delta_t = 0.5 * Vu_n * cot_theta
+        delta_tb = np.where(z > 0, (batch.M_r - batch.Mu_nm) / z, 0.0)
+
+    return {
+        "V_c": V_c,
+        "V_s": V_s,
+        "V_n": V_c + V_s,
+        "V_max": Vdmax2,
+        "theta": np.degrees(np.arctan(1 / cot_theta)),
+        "details": {
+            "k": k, "rho_l": rho_l, "fn": fn, "f_ctk": f_ctk, "Ac": Ac,
+            "Vcd_calc": Vcd_calc, "Vcd_min": Vcd_min,
+            "nu": nu, "cot_theta": cot_theta, "z": z, "av_use": av_use,
+            "Vdmax1": Vdmax1, "Vdmax2": Vdmax2,
+            "delta_t": delta_t, "delta_tb": delta_tb,
+            "s_max_1": 0.75 * D,
+            "s_max_2": np.minimum(0.75 * D, 600),
+        },
+    }
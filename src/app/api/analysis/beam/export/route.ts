@@ -1,7 +1,15 @@
 import { NextRequest, NextResponse } from "next/server";
 import { spawn } from "child_process";
 import path from "path";
-import fs from "fs";
+
+// `rc_beam_calc.py --stream` writes one JSON header line ({ success, size, etag })
+// followed by the raw xlsx bytes, so no shared temp file is involved.
+type ExportHeader = {
+    success?: boolean;
+    size?: number;
+    etag?: string;
+    error?: string;
+};
 
 export async function POST(req: NextRequest) {
     try {
@@ -10,9 +18,9 @@ export async function POST(req: NextRequest) {
 
         // Start Python process
         const scriptPath = path.join(process.cwd(), "scripts", "rc_beam_calc.py");
-        const pythonProcess = spawn("python", [scriptPath]);
+        const pythonProcess = spawn("python", [scriptPath, "--stream"]);
 
-        let outputData = "";
+        const chunks: Buffer[] = [];
         let errorData = "";
 
         // Send input to Python
@@ -21,8 +29,8 @@ export async function POST(req: NextRequest) {
         pythonProcess.stdin.end();
 
         return new Promise<NextResponse>((resolve) => {
-            pythonProcess.stdout.on("data", (data) => {
-                outputData += data.toString();
+            pythonProcess.stdout.on("data", (data: Buffer) => {
+                chunks.push(data);
             });
 
             pythonProcess.stderr.on("data", (data) => {
@@ -35,33 +43,37 @@ export async function POST(req: NextRequest) {
                     return resolve(NextResponse.json({ error: "Python Execution Failed", details: errorData }, { status: 500 }));
                 }
 
+                const output = Buffer.concat(chunks);
+                const newline = output.indexOf(0x0a);
+                const headerText = (newline >= 0 ? output.subarray(0, newline) : output).toString("utf-8");
+
+                let header: ExportHeader;
                 try {
-                    const result = JSON.parse(outputData);
-                    if (result.success && result.file) {
-                        const filePath = result.file;
-                        if (fs.existsSync(filePath)) {
-                            const fileBuffer = fs.readFileSync(filePath);
+                    const parsed = JSON.parse(headerText);
+                    header = Array.isArray(parsed) ? parsed[0] : parsed;
+                } catch (e) {
+                    console.error("Parse Error:", e, headerText);
+                    return resolve(NextResponse.json({ error: "Failed to parse result", output: headerText }, { status: 500 }));
+                }
 
-                            // Optional: Delete the temp file after reading if needed, 
-                            // but usually it's better to let OS clean temp dir or handle manually.
+                if (!header.success) {
+                    return resolve(NextResponse.json({ error: "Export Failed", details: header }, { status: 500 }));
+                }
 
-                            return resolve(new NextResponse(fileBuffer, {
-                                status: 200,
-                                headers: {
-                                    "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                                    "Content-Disposition": `attachment; filename="RC_Beam_Report.xlsx"`,
-                                },
-                            }));
-                        } else {
-                            return resolve(NextResponse.json({ error: "File Not Found" }, { status: 500 }));
-                        }
-                    } else {
-                        return resolve(NextResponse.json({ error: "Export Failed", details: result }, { status: 500 }));
-                    }
-                } catch (e) {
-                    console.error("Parse Error:", e, outputData);
-                    return resolve(NextResponse.json({ error: "Failed to parse result", output: outputData }, { status: 500 }));
+                const fileBuffer = output.subarray(newline + 1);
+                if (fileBuffer.length !== header.size) {
+                    return resolve(NextResponse.json({ error: "Incomplete export", expected: header.size, received: fileBuffer.length }, { status: 500 }));
                 }
+
+                return resolve(new NextResponse(fileBuffer, {
+                    status: 200,
+                    headers: {
+                        "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        "Content-Disposition": `attachment; filename="RC_Beam_Report.xlsx"`,
+                        "Content-Length": String(header.size),
+                        "ETag": `"${header.etag}"`,
+                    },
+                }));
             });
         });
 
@@ -1,60 +1,42 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { spawn } from 'child_process';
-import path from 'path';
+import { getPythonWorker, WorkerTimeoutError } from '@/lib/pythonWorker';
+
+// The shared worker answers one request at a time, so this route only serves what the beam page
+// needs (section check and text report). Heavy modes (export, optimize, reliability, sweep, ...)
+// run in their own process through the dedicated routes or the CLI.
+const ALLOWED_MODES = ['calc', 'report'];
 
 export async function POST(req: NextRequest) {
     try {
         const body = await req.json();
+        const { mode = 'calc', design_standard, material, rows } = body ?? {};
 
-        // Define path to python script
-        const scriptPath = path.join(process.cwd(), 'scripts', 'rc_beam_calc.py');
-
-        // Use python or python3 depending on environment
-        const runPython = (cmd: string): Promise<string> => {
-            return new Promise((resolve, reject) => {
-                const pythonProcess = spawn(cmd, [scriptPath]);
-                let resultData = '';
-                let errorData = '';
-
-                pythonProcess.stdin.write(JSON.stringify(body));
-                pythonProcess.stdin.end();
-
-                pythonProcess.stdout.on('data', (data) => resultData += data.toString());
-                pythonProcess.stderr.on('data', (data) => errorData += data.toString());
-
-                pythonProcess.on('close', (code) => {
-                    if (code !== 0) reject(errorData);
-                    else resolve(resultData);
-                });
-
-                pythonProcess.on('error', (err) => reject(err.message));
-            });
-        };
+        if (!ALLOWED_MODES.includes(mode)) {
+            return NextResponse.json({ error: `Unsupported mode: ${mode}` }, { status: 400 });
+        }
+        if (!Array.isArray(rows)) {
+            return NextResponse.json({ error: 'rows must be an array' }, { status: 400 });
+        }
 
-        let output;
+        let results;
         try {
-            output = await runPython('python');
+            // Reuse the persistent python worker instead of spawning per request.
+            // Only the fields the page sends are forwarded (no output paths, worker counts, ...).
+            results = await getPythonWorker().request({ mode, design_standard, material, rows });
         } catch (e) {
-            // If 'python' fails, try 'python3'
-            try {
-                output = await runPython('python3');
-            } catch (e2) {
-                // If both fail, try 'py' (Windows Python Launcher)
-                try {
-                    output = await runPython('py');
-                } catch (e3) {
-                    console.error('Python execution failed:', e, e2, e3);
-                    return NextResponse.json({ error: 'Python not found or script error' }, { status: 500 });
-                }
+            if (e instanceof WorkerTimeoutError) {
+                console.error('Python worker timed out:', e);
+                return NextResponse.json({ error: 'Calculation timed out' }, { status: 504 });
+            }
+            if (e instanceof Error) {
+                console.error('Python execution failed:', e);
+                return NextResponse.json({ error: 'Python not found or script error' }, { status: 500 });
             }
+            // Errors raised inside the script keep the original one-shot output shape
+            return NextResponse.json([{ error: String(e) }]);
         }
 
-        try {
-            const results = JSON.parse(output);
-            return NextResponse.json(results);
-        } catch (e) {
-            return NextResponse.json({ error: 'Invalid result format' }, { status: 500 });
-        }
+        return NextResponse.json(results);
 
     } catch (error) {
         console.error('API Error:', error);
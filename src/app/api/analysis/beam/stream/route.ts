@@ -0,0 +1,60 @@
+import { NextRequest, NextResponse } from "next/server";
+import { spawn } from "child_process";
+import path from "path";
+
+// `rc_beam_calc.py --ndjson` writes one JSON line per row as soon as it is computed
+// ({ index, id, result } or { index, id, error }) and ends with a trailer line
+// ({ done: true, count, errors, elapsed_ms } or { done: true, error }).
+// The lines are passed through as they arrive, so neither side buffers the whole table.
+
+export async function POST(req: NextRequest) {
+    try {
+        const body = await req.json();
+        const { design_standard, material, rows } = body;
+
+        const scriptPath = path.join(process.cwd(), "scripts", "rc_beam_calc.py");
+        const pythonProcess = spawn("python", [scriptPath, "--ndjson"]);
+
+        pythonProcess.stdin.write(JSON.stringify({ mode: "calc", design_standard, material, rows }));
+        pythonProcess.stdin.end();
+
+        let errorData = "";
+        pythonProcess.stderr.on("data", (data) => {
+            errorData += data.toString();
+        });
+
+        const stream = new ReadableStream<Uint8Array>({
+            start(controller) {
+                pythonProcess.stdout.on("data", (data: Buffer) => {
+                    controller.enqueue(new Uint8Array(data));
+                });
+                pythonProcess.on("close", (code) => {
+                    if (code !== 0) {
+                        console.error("Python Error:", errorData);
+                        const trailer = { done: true, error: "Python Execution Failed", details: errorData };
+                        controller.enqueue(new TextEncoder().encode(JSON.stringify(trailer) + "\n"));
+                    }
+                    controller.close();
+                });
+                pythonProcess.on("error", (err) => {
+                    controller.error(err);
+                });
+            },
+            cancel() {
+                pythonProcess.kill();
+            },
+        });
+
+        return new Response(stream, {
+            status: 200,
+            headers: {
+                "Content-Type": "application/x-ndjson; charset=utf-8",
+                "Cache-Control": "no-store",
+            },
+        });
+
+    } catch (error: any) {
+        console.error("API Error:", error);
+        return NextResponse.json({ error: error.message }, { status: 500 });
+    }
+}
@@ -0,0 +1,140 @@
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+
+// Long-lived `rc_beam_calc.py --worker` process shared by the API routes.
+// Requests are written as one JSON line each and matched to responses by id,
+// so the python interpreter and its imports are paid for only once.
+// The worker answers one request at a time, so a request that does not answer within
+// the timeout is rejected and the worker is restarted instead of blocking every later caller.
+
+type Pending = {
+    resolve: (value: any) => void;
+    reject: (reason: any) => void;
+    proc: ChildProcessWithoutNullStreams;
+    timer: NodeJS.Timeout;
+};
+
+type WorkerResponse = {
+    id: number;
+    ok: boolean;
+    result?: any;
+    error?: string;
+};
+
+const PYTHON_COMMANDS = ['python', 'python3', 'py'];
+
+// Per-request timeout (ms); RC_BEAM_WORKER_TIMEOUT_MS overrides the default.
+const DEFAULT_TIMEOUT_MS = 30_000;
+
+function requestTimeout(): number {
+    const value = Number(process.env.RC_BEAM_WORKER_TIMEOUT_MS);
+    return Number.isFinite(value) && value > 0 ? value : DEFAULT_TIMEOUT_MS;
+}
+
+export class WorkerTimeoutError extends Error {
+    constructor(ms: number) {
+        super(`Python worker did not answer within ${ms} ms`);
+        this.name = 'WorkerTimeoutError';
+    }
+}
+
+class PythonWorker {
+    private proc: ChildProcessWithoutNullStreams | null = null;
+    private starting: Promise<ChildProcessWithoutNullStreams> | null = null;
+    private pending = new Map<number, Pending>();
+    private nextId = 1;
+
+    private spawnWith(cmd: string): Promise<ChildProcessWithoutNullStreams> {
+        const scriptPath = path.join(process.cwd(), 'scripts', 'rc_beam_calc.py');
+        return new Promise((resolve, reject) => {
+            const proc = spawn(cmd, [scriptPath, '--worker']);
+            proc.once('spawn', () => resolve(proc));
+            proc.once('error', (err) => reject(err));
+        });
+    }
+
+    private attach(proc: ChildProcessWithoutNullStreams) {
+        const lines = readline.createInterface({ input: proc.stdout });
+        lines.on('line', (line) => {
+            let msg: WorkerResponse;
+            try {
+                msg = JSON.parse(line);
+            } catch (e) {
+                console.error('Invalid worker output:', line);
+                return;
+            }
+            const entry = this.pending.get(msg.id);
+            if (!entry) return;
+            clearTimeout(entry.timer);
+            this.pending.delete(msg.id);
+            if (msg.ok) entry.resolve(msg.result);
+            else entry.reject(msg.error ?? 'Unknown worker error');
+        });
+        proc.stderr.on('data', (data) => console.error('Python worker:', data.toString()));
+        proc.on('exit', (code) => {
+            if (this.proc === proc) this.proc = null;
+            // Only the requests sent to this process; a replacement may already be serving new ones
+            for (const [id, entry] of this.pending) {
+                if (entry.proc !== proc) continue;
+                clearTimeout(entry.timer);
+                this.pending.delete(id);
+                entry.reject(new Error(`Python worker exited (code ${code})`));
+            }
+        });
+    }
+
+    private restart(proc: ChildProcessWithoutNullStreams) {
+        // The next request spawns a fresh worker; the exit handler rejects whatever was queued on this one
+        if (this.proc === proc) this.proc = null;
+        proc.kill();
+    }
+
+    private async ensureStarted(): Promise<ChildProcessWithoutNullStreams> {
+        if (this.proc) return this.proc;
+        if (!this.starting) {
+            this.starting = (async () => {
+                const errors: unknown[] = [];
+                for (const cmd of PYTHON_COMMANDS) {
+                    try {
+                        const proc = await this.spawnWith(cmd);
+                        this.attach(proc);
+                        this.proc = proc;
+                        return proc;
+                    } catch (e) {
+                        errors.push(e);
+                    }
+                }
+                throw new Error(`Python not found: ${errors.join(', ')}`);
+            })().finally(() => {
+                this.starting = null;
+            });
+        }
+        return this.starting;
+    }
+
+    async request(payload: Record<string, any>): Promise<any> {
+        const proc = await this.ensureStarted();
+        const id = this.nextId++;
+        const timeout = requestTimeout();
+        return new Promise((resolve, reject) => {
+            const timer = setTimeout(() => {
+                if (!this.pending.delete(id)) return;
+                reject(new WorkerTimeoutError(timeout));
+                this.restart(proc);
+            }, timeout);
+            this.pending.set(id, { resolve, reject, proc, timer });
+            proc.stdin.write(JSON.stringify({ ...payload, id }) + '\n');
+        });
+    }
+}
+
+// Keep a single worker across hot reloads in development.
+const globalForWorker = globalThis as unknown as { rcBeamWorker?: PythonWorker };
+
+export function getPythonWorker(): PythonWorker {
+    if (!globalForWorker.rcBeamWorker) {
+        globalForWorker.rcBeamWorker = new PythonWorker();
+    }
+    return globalForWorker.rcBeamWorker;
+}
@@ -0,0 +1,75 @@
+import sys
+import os
+import json
+import tempfile
+
+sys.path.append(os.path.abspath('scripts'))
+sys.path.append(os.path.abspath('benchmarks'))
+
+from run_benchmarks import BENCHMARK_VERSION, run
+from compare_benchmarks import compare, main as compare_main
+from synthetic_rows import STANDARDS, synthetic_rows
+from rc_beam_calc import handle_request
+
+
+def test_synthetic_rows_analyze():
+    print("--- Testing synthetic benchmark rows under every standard ---")
+    rows = synthetic_rows(40, seed=3)
+    assert rows == synthetic_rows(40, seed=3)
+    for std in STANDARDS:
+        results = handle_request({"mode": "calc", "design_standard": std, "material": {"fck": 35, "fy": 400},
+                                  "rows": rows, "cache": False})
+        assert all(r["as_used"] > 0 and r["Mr"] > 0 for r in results)
+
+
+def test_run_subset():
+    print("--- Testing a reduced benchmark run ---")
+    data = run(repeat=1, rows=2, export_sizes=(), only=["analyzer.", "text.generate[LSD2015]"])
+    assert data["version"] == BENCHMARK_VERSION
+    names = list(data["results"])
+    assert len([n for n in names if n.startswith("analyzer.analyze[")]) == len(STANDARDS)
+    assert len([n for n in names if n.startswith("analyzer.analyze_cached[")]) == len(STANDARDS)
+    assert names[-1] == "text.generate[LSD2015]" and len(names) == 2 * len(STANDARDS) + 1
+    assert all(r["median_ms"] > 0 and r["per"] == 2 for r in data["results"].values())
+
+
+def result(**medians):
+    return {"version": BENCHMARK_VERSION, "machine": {},
+            "results": {name.replace("_", "."): {"median_ms": ms} for name, ms in medians.items()}}
+
+
+def test_compare():
+    print("--- Testing baseline comparison ---")
+    baseline = result(a=10.0, b=10.0, c=0.01, d=5.0, gone=1.0)
+    current = result(a=10.5, b=13.0, c=0.03, d=3.0, added=2.0)
+    diff = compare(baseline, current)
+    status = {row["name"]: row["status"] for row in diff["rows"]}
+    assert status == {"a": "ok", "b": "regression", "c": "ok", "d": "improved"}  # c: 노이즈 이하
+    assert diff["regressions"] == ["b"] and diff["missing"] == ["gone"] and diff["new"] == ["added"]
+    assert compare(baseline, current, threshold=0.5)["regressions"] == []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name, data in [("base.json", baseline), ("cur.json", current)]:
+            paths.append(os.path.join(tmp, name))
+            with open(paths[-1], "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        assert compare_main(paths) == 1
+        assert compare_main(paths + ["--threshold", "0.5"]) == 0
+        assert compare_main([paths[0], paths[0]]) == 0
+
+
+def test_baseline_file():
+    print("--- Testing the committed baseline ---")
+    with open(os.path.join("benchmarks", "baseline.json"), encoding="utf-8") as f:
+        baseline = json.load(f)
+    assert baseline["version"] == BENCHMARK_VERSION
+    for prefix in ("analyzer.analyze[", "text.generate[", "excel.add_to_workbook[", "export[", "cli."):
+        assert any(name.startswith(prefix) for name in baseline["results"])
+
+
+if __name__ == "__main__":
+    test_synthetic_rows_analyze()
+    test_run_subset()
+    test_compare()
+    test_baseline_file()
@@ -0,0 +1,67 @@
+import sys
+import os
+import io
+import json
+import subprocess
+
+sys.path.append(os.path.abspath('scripts'))
+
+import rc_beam_calc
+from rc_beam_calc import run_calc, stream_calc
+from test_excel_write_only import row
+
+SCRIPT = os.path.join('scripts', 'rc_beam_calc.py')
+
+
+def read_lines(request):
+    out = io.StringIO()
+    stream_calc(request, out)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_ndjson_matches_calc():
+    print("--- Testing NDJSON lines against the calc array (scalar and batch) ---")
+    original = rc_beam_calc.STREAM_CHUNK_ROWS
+    rc_beam_calc.STREAM_CHUNK_ROWS = 16
+    try:
+        for n in [3, 40]:
+            rows = [dict(row, id=i, Mu=200 + 37 * i, Vu=[50, 900][i % 2]) for i in range(n)]
+            request = {"mode": "calc", "design_standard": "콘크리트설계기준(KCI/KDS)", "rows": rows}
+            lines = read_lines(request)
+            trailer = lines.pop()
+            assert trailer["done"] and trailer["count"] == n and trailer["errors"] == 0
+            assert [l["index"] for l in lines] == list(range(n))
+            assert [l["id"] for l in lines] == list(range(n))
+            assert [l["result"] for l in lines] == run_calc(request)
+            print(f"[{n} rows] OK ({trailer['elapsed_ms']} ms)")
+    finally:
+        rc_beam_calc.STREAM_CHUNK_ROWS = original
+
+
+def test_ndjson_row_error():
+    print("--- Testing per-row errors in the stream ---")
+    rows = [dict(row, id="a"), dict(row, id="b", dia1="bad"), dict(row, id="c")]
+    lines = read_lines({"mode": "calc", "rows": rows})
+    assert "result" in lines[0] and "result" in lines[2]
+    assert lines[1]["id"] == "b" and "error" in lines[1]
+    assert lines[3] == dict(lines[3], done=True, count=3, errors=1)
+
+
+def test_ndjson_cli():
+    print("--- Testing --ndjson CLI output ---")
+    request = {"mode": "calc", "rows": [dict(row, id=1), dict(row, id=2)]}
+    proc = subprocess.run([sys.executable, SCRIPT, "--ndjson"], input=json.dumps(request).encode(),
+                          capture_output=True, check=True)
+    lines = [json.loads(l) for l in proc.stdout.decode("utf-8").splitlines()]
+    assert [l.get("id") for l in lines[:2]] == [1, 2]
+    assert lines[-1]["done"] and lines[-1]["count"] == 2
+
+    proc = subprocess.run([sys.executable, SCRIPT, "--ndjson"], input=b"not json", capture_output=True, check=True)
+    trailer = json.loads(proc.stdout)
+    assert trailer["done"] and "error" in trailer
+
+
+if __name__ == "__main__":
+    test_ndjson_matches_calc()
+    test_ndjson_row_error()
+    test_ndjson_cli()
@@ -0,0 +1,58 @@
+import sys
+import os
+import io
+
+sys.path.append(os.path.abspath('scripts'))
+
+from openpyxl import Workbook
+from rc_beam_calc import _read_material, _analyze_row
+from reports.excel import get_excel_builder
+from reports.excel.template import template_cache_info
+from test_excel_write_only import dump, row
+
+
+def test_template_matches_direct_layout():
+    print("--- Testing template-cloned sheets against direct layout ---")
+    for std in ["강도설계법(도로교 설계기준, 2010)", "콘크리트설계기준(KCI/KDS)"]:
+        mat = _read_material({"design_standard": std, "material": {"fck": 35, "fy": 400}})
+        wb = Workbook()
+        wb.remove(wb.active)
+        for i, beam in enumerate([row, dict(row, Vu=50), dict(row, Mu=5000)]):
+            builder = get_excel_builder(_analyze_row(mat, beam))
+            direct = wb.create_sheet(f"direct{i}")
+            builder._write_layout(direct)
+            builder._write_values(direct)
+            builder.add_to_workbook(wb, f"template{i}")
+
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        sheets = dump(buffer.getvalue())
+        for direct, templated in zip(sheets[0::2], sheets[1::2]):
+            assert direct[1:] == templated[1:], (std, direct[0])
+        print(f"[{std}] OK")
+
+
+def test_lsd_layout_signature_cache():
+    print("--- Testing LSD layout cache per row signature ---")
+    mat = _read_material({"design_standard": "한계상태설계법(도로교 설계기준, 2012)", "material": {"fck": 35, "fy": 400}})
+    beams = [row, dict(row, Vu=50), dict(row, num2=3, dia2=22, dc2=130)]
+    wb = Workbook()
+    wb.remove(wb.active)
+    for i, beam in enumerate(beams * 3):
+        get_excel_builder(_analyze_row(mat, beam)).add_to_workbook(wb, f"S{i}")
+    after_first = template_cache_info()["templates"]
+    for i, beam in enumerate(beams * 3):
+        get_excel_builder(_analyze_row(mat, beam)).add_to_workbook(wb, f"T{i}")
+    assert template_cache_info()["templates"] == after_first
+
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    sheets = dump(buffer.getvalue())
+    for first, second in zip(sheets[:9], sheets[9:]):
+        assert first[1:] == second[1:]
+    assert sheets[0][1:] != sheets[1][1:]
+
+
+if __name__ == "__main__":
+    test_template_matches_direct_layout()
+    test_lsd_layout_signature_cache()
@@ -0,0 +1,40 @@
+import sys
+import os
+import io
+
+sys.path.append(os.path.abspath('scripts'))
+
+from openpyxl import load_workbook
+from rc_beam_calc import build_export_workbook
+
+row = {"id": 1, "name": "WO", "Mu": 500, "Vu": 900, "Ms": 300, "H": 800, "B": 1000,
+       "dc1": 80, "dia1": 25, "num1": 6, "av_dia": 13, "av_leg": 2, "av_space": 200, "crack_case": "일반환경"}
+
+
+def dump(data):
+    wb = load_workbook(io.BytesIO(data))
+    sheets = []
+    for ws in wb.worksheets:
+        cells = {}
+        for cells_row in ws.iter_rows():
+            for c in cells_row:
+                if c.value is not None or c.has_style:
+                    cells[c.coordinate] = (c.value, c.font.b, c.font.sz, c.font.name, c.alignment.horizontal,
+                                           c.border.left.style, c.fill.fgColor.rgb)
+        sheets.append((ws.title, sorted(map(str, ws.merged_cells.ranges)), cells,
+                       ws.row_dimensions[5].height, ws.column_dimensions['C'].width))
+    return sheets
+
+
+def test_excel_write_only():
+    print("--- Testing write-only Excel backend against the standard backend ---")
+    for std in ["강도설계법(도로교 설계기준, 2010)", "콘크리트설계기준(KCI/KDS)", "한계상태설계법(도로교 설계기준, 2015)"]:
+        request = {"design_standard": std, "material": {"fck": 35, "fy": 400}, "rows": [row, dict(row, name="WO2", Vu=50)]}
+        standard = dump(build_export_workbook(dict(request, excel_backend="standard")))
+        write_only = dump(build_export_workbook(dict(request, excel_backend="write_only")))
+        assert standard == write_only, std
+        print(f"[{std}] {len(standard[0][2])} cells OK")
+
+
+if __name__ == "__main__":
+    test_excel_write_only()
@@ -0,0 +1,73 @@
+import sys
+import os
+import json
+import hashlib
+import subprocess
+import tempfile
+
+SCRIPT = os.path.abspath(os.path.join('scripts', 'rc_beam_calc.py'))
+
+material = {"fck": 35, "fy": 400}
+row = {"id": 1, "name": "StreamTest", "Mu": 500, "Vu": 200, "Ms": 300, "H": 800, "B": 1000,
+       "dc1": 80, "dia1": 25, "num1": 6, "av_dia": 13, "av_leg": 2, "av_space": 200, "crack_case": "일반환경"}
+request = {"mode": "export", "material": material, "rows": [row, dict(row, id=2, name="")]}
+
+
+def test_export_stream():
+    print("--- Testing streamed xlsx export ---")
+    process = subprocess.run([sys.executable, SCRIPT, "--stream"], input=json.dumps(request).encode('utf-8'),
+                             capture_output=True)
+    header_line, _, data = process.stdout.partition(b"\n")
+    header = json.loads(header_line)
+    print(header)
+    assert header["success"] and header["size"] == len(data)
+    assert header["etag"] == hashlib.sha1(data).hexdigest()
+    assert data[:2] == b"PK"  # xlsx (zip) signature
+
+
+def test_export_unique_paths():
+    print("--- Testing export to unique / caller-supplied paths ---")
+    sys.path.append(os.path.abspath('scripts'))
+    from rc_beam_calc import run_export
+
+    first = run_export(request)
+    second = run_export(request)
+    try:
+        assert first["file"] != second["file"]
+        assert os.path.getsize(first["file"]) == first["size"]
+    finally:
+        os.remove(first["file"])
+        os.remove(second["file"])
+
+    from core.data_paths import OUTPUT_ROOT_ENV
+    from test_force_import import scoped_env
+
+    with tempfile.TemporaryDirectory() as tmp, scoped_env(OUTPUT_ROOT_ENV, tmp):
+        out_path = os.path.join(os.path.realpath(tmp), "report.xlsx")
+        result = run_export(dict(request, out_path="report.xlsx"))
+        assert result["file"] == out_path and os.path.getsize(out_path) == result["size"]
+        try:
+            run_export(dict(request, out_path=os.path.join(os.path.dirname(tmp), "report.xlsx")))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("out_path outside the output root should be rejected")
+
+        # 파일 디스크립터는 명령행으로만 받는다
+        try:
+            run_export(dict(request, out_fd=1))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("out_fd in the request should be rejected")
+        with open(os.path.join(tmp, "fd.xlsx"), "wb") as f:
+            fd = f.fileno()
+            process = subprocess.run([sys.executable, SCRIPT, "--out-fd", str(fd)], input=json.dumps(request),
+                                     pass_fds=(fd,), capture_output=True, text=True, check=True)
+        result = json.loads(process.stdout)
+        assert result["fd"] == fd and os.path.getsize(os.path.join(tmp, "fd.xlsx")) == result["size"]
+
+
+if __name__ == "__main__":
+    test_export_stream()
+    test_export_unique_paths()
@@ -0,0 +1,172 @@
+import sys
+import os
+import math
+import random
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath('scripts'))
+
+from core.data_paths import OUTPUT_ROOT_ENV
+from core.fiber_section import FiberSection
+from core.materials import get_conc_material
+from core.rc_section_analyzer import RCSectionAnalyzer
+from core.rc_section_batch import RCSectionBatch
+from core.result_cache import cache_key
+from rc_beam_calc import handle_request
+from test_force_import import scoped_env
+
+USD = "강도설계법(도로교 설계기준, 2010)"
+LSD = "한계상태설계법(도로교 설계기준, 2015)"
+STANDARDS = [USD, "콘크리트설계기준(KCI/KDS)", "강도설계법(콘크리트구조 설계기준, 2021)",
+             "한계상태설계법(도로교 설계기준, 2012)", LSD]
+ROW = {"H": 800, "B": 400, "dc1": 70, "dia1": 25, "num1": 4, "Mu": 300, "Vu": 200, "Ms": 150,
+       "av_dia": 13, "av_leg": 2, "av_space": 200}
+
+
+def factors(std):
+    return (0.65, 0.9) if std.startswith("한계") else (0.85, 0.8)
+
+
+def analyze(std, row, method):
+    phi_f, phi_v = factors(std)
+    return RCSectionAnalyzer(35, 400, std, row["H"], row["B"], row, row, phi_f=phi_f, phi_v=phi_v,
+                             flexure_method=method).analyze()
+
+
+def test_closed_form():
+    print("--- Testing fiber integration against the closed-form parabola-rectangle block ---")
+    con = get_conc_material(35.0, method="LSD")  # n = 2, εco = 0.002, εcu = 0.0033
+    eps_co, eps_cu = con.eps_co, con.eps_cu
+    f_c, f_yd, B, d, As = 35 * 0.65 * 0.85, 360.0, 400.0, 730.0, 2026.8
+    alpha = 1 - eps_co / (3 * eps_cu)
+    arm = 1 - (eps_cu**2 / 2 - eps_co**2 / 12) / (eps_cu * (eps_cu - eps_co / 3))
+
+    result = FiberSection(800, B, f_c, con.n_eps, eps_co, eps_cu, f_yd, 2e5, [[d]], [[As]]).capacity()
+    c = As * f_yd / (alpha * f_c * B)
+    assert result["converged"][0]
+    assert math.isclose(result["c"][0], c, rel_tol=1e-4)
+    assert math.isclose(result["M"][0], As * f_yd * (d - arm * c), rel_tol=1e-4)
+    assert math.isclose(result["eps_top"][0], eps_cu)
+
+
+def test_block_agreement():
+    print("--- Testing fiber vs. equivalent block for pure bending ---")
+    for std in STANDARDS:
+        block, fiber = analyze(std, ROW, "block"), analyze(std, ROW, "fiber")
+        assert fiber.fiber_converged and block.fiber_converged is None
+        assert math.isclose(block.M_r, fiber.M_r, rel_tol=0.01), (std, block.M_r, fiber.M_r)
+        assert math.isclose(block.c, fiber.c, rel_tol=0.05), (std, block.c, fiber.c)
+        assert fiber.as_req == block.as_req  # 소요 철근량은 응력블록 식 그대로
+
+
+def test_axial_and_compression_steel():
+    print("--- Testing axial load and compression reinforcement ---")
+    con = get_conc_material(35.0, method="LSD")
+    f_c, f_yd, H, B = 35 * 0.65 * 0.85, 360.0, 800.0, 400.0
+    depth, area = [[60.0, 740.0]], [[1500.0, 2000.0]]
+    N = np.array([-1.5e6, -5e5, 0.0, 2e6, 5e6, 1e7])
+    section = FiberSection(np.full(N.size, H), B, f_c, con.n_eps, con.eps_co, con.eps_cu, f_yd, 2e5, depth, area)
+    result = section.capacity(N)
+    # 순인장 강도(-ΣAs·f_yd = -1.26e6 N)와 압축 강도를 넘는 축력은 해가 없다
+    assert result["converged"].tolist() == [False, True, True, True, True, False]
+    assert result["M"][0] == 0 and result["M"][-1] == 0
+    # 평형: 콘크리트 + 철근층 힘 = N
+    ok = result["converged"]
+    total = result["concrete_force"] + result["layer_force"].sum(axis=1)
+    assert np.allclose(total[ok], N[ok], rtol=1e-6, atol=1.0)
+    # 축력이 커질수록 중립축이 내려가고, 전단면 압축 쪽으로 가면 휨강도가 다시 줄어든다
+    assert np.all(np.diff(result["c"][ok]) > 0)
+    assert result["M"][2] < result["M"][3] and result["M"][4] < result["M"][3]
+
+    row = dict(ROW, Nu=1500)
+    with_top = dict(row, layers=[{"d": 60, "dia": 22, "num": 4}])
+    plain, top = analyze(LSD, row, "fiber"), analyze(LSD, with_top, "fiber")
+    assert plain.M_r > analyze(LSD, ROW, "fiber").M_r  # 휨 지배 구간의 축압축은 휨강도를 키운다
+    assert top.c < plain.c and top.M_r > plain.M_r
+    assert analyze(LSD, with_top, "block").M_r == analyze(LSD, ROW, "block").M_r  # 응력블록은 축력/압축철근 무시
+
+
+def test_batch_matches_analyzer():
+    print("--- Testing fiber RCSectionBatch against RCSectionAnalyzer ---")
+    rnd = random.Random(7)
+    rows = []
+    for i in range(40):
+        row = dict(ROW, H=rnd.choice([500, 800, 1200]), num1=rnd.randint(0, 8), Nu=rnd.choice([0, 800, -300, 3000]))
+        if i % 3 == 0:
+            row["layers"] = [{"d": 60, "dia": rnd.choice([16, 22]), "num": rnd.randint(2, 4)}]
+        rows.append(row)
+    rows += rows[:10]  # 단면 묶음 경로
+    for std in (USD, LSD):
+        phi_f, phi_v = factors(std)
+        batch = RCSectionBatch.from_rows(35, 400, std, rows, phi_f=phi_f, phi_v=phi_v, flexure_method="fiber")
+        results = batch.analyze().get_summary_results()
+        for i, row in enumerate(rows):
+            analyzer = analyze(std, row, "fiber")
+            assert results[i] == analyzer.get_summary_result(), (std, i)
+            assert math.isclose(analyzer.M_r, batch.M_r[i], rel_tol=1e-9, abs_tol=1e-6)
+
+
+def test_request_option():
+    print("--- Testing the flexure_method request option ---")
+    request = {"mode": "calc", "design_standard": LSD, "material": {"fck": 35, "fy": 400, "phi_f": 0.65, "phi_v": 0.9},
+               "rows": [dict(ROW, Nu=1500)], "cache": False}
+    block = handle_request(request)[0]
+    fiber = handle_request(dict(request, flexure_method="fiber"))[0]
+    assert fiber["Mr"] > block["Mr"]
+    batched = handle_request(dict(request, flexure_method="fiber", rows=[dict(ROW, Nu=1500)] * 40))
+    assert all(r == fiber for r in batched)
+    try:
+        RCSectionAnalyzer(35, 400, LSD, 800, 400, ROW, ROW, flexure_method="strut")
+        assert False, "unknown flexure_method must raise"
+    except ValueError:
+        pass
+
+    mat = {"design_standard": LSD, "f_ck": 35, "f_y": 400, "phi_f": 0.65, "phi_v": 0.9, "flexure_method": "block"}
+    key = cache_key(mat, ROW)
+    assert cache_key(dict(mat, flexure_method="fiber"), ROW) != key
+    assert cache_key(mat, dict(ROW, layers=[{"d": 60, "dia": 22, "num": 4}])) != key
+
+
+def test_design_modes():
+    print("--- Testing flexure_method in the design / compare / sweep / reliability modes ---")
+    material = {"fck": 35, "fy": 400, "phi_f": 0.65, "phi_v": 0.9}
+    base = {"mode": "calc", "design_standard": LSD, "material": material, "flexure_method": "fiber"}
+    section = {"H": 800, "B": 400, "Mu": 450, "Vu": 200, "Ms": 150, "Nu": 1500, "av_leg": 2}
+
+    designs = {m: handle_request(dict(base, mode="design_rebar", rows=[section], flexure_method=m))[0]
+               for m in ("block", "fiber")}
+    fiber = designs["fiber"]
+    assert fiber["found"] and fiber["as_used"] < designs["block"]["as_used"]  # 축압축으로 필요한 철근이 준다
+    assert handle_request(dict(base, rows=[dict(section, **fiber["layout"])], cache=False))[0] == fiber["result"]
+
+    row = dict(ROW, Nu=1500)
+    [stirrups] = handle_request(dict(base, mode="design_stirrups", rows=[row]))
+    layout = {key: stirrups[key] for key in ("av_dia", "av_leg", "av_space")}
+    assert handle_request(dict(base, rows=[dict(row, **layout)], cache=False))[0] == stirrups["result"]
+
+    compared = {m: handle_request(dict(base, mode="compare", standards=[LSD], rows=[row], flexure_method=m))
+                for m in ("block", "fiber")}
+    assert compared["fiber"]["rows"][0]["results"][LSD]["Mr_rate"] > compared["block"]["rows"][0]["results"][LSD]["Mr_rate"]
+
+    with tempfile.TemporaryDirectory() as tmp, scoped_env(OUTPUT_ROOT_ENV, tmp):
+        result = handle_request(dict(base, mode="sweep", axes={"Nu": [0, 1500]}, base=ROW, outputs=["Mr"],
+                                     out_path="fiber.npz"))
+        with np.load(result["file"]) as data:
+            swept = data["Mr"].tolist()
+    calc = handle_request(dict(base, rows=[ROW, row], cache=False))
+    assert [round(v, 1) for v in swept] == [r["Mr"] for r in calc]
+
+    request = dict(base, mode="reliability", rows=[dict(ROW, Mu=520, Nu=1500)], samples=4000, seed=3)
+    pf = {m: handle_request(dict(request, flexure_method=m))[0]["checks"]["flexure"]["pf"] for m in ("block", "fiber")}
+    assert pf["fiber"] < pf["block"]
+
+
+if __name__ == "__main__":
+    test_closed_form()
+    test_block_agreement()
+    test_axial_and_compression_steel()
+    test_batch_matches_analyzer()
+    test_request_option()
+    test_design_modes()
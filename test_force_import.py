@@ -0,0 +1,155 @@
+import sys
+import os
+import csv
+import random
+import tempfile
+from contextlib import contextmanager
+
+sys.path.append(os.path.abspath('scripts'))
+
+from openpyxl import Workbook
+
+from rc_beam_calc import handle_request
+from core.data_paths import UPLOAD_ROOT_ENV
+from core.force_import import import_forces, resolve_columns
+
+HEADER = ["Elem", "Station (m)", "Load Case", "My (kN·m)", "Vz (kN)", "Fx (kN)"]
+SECTIONS = [
+    {"name": "G1", "H": 800, "B": 400, "dc1": 80, "dia1": 25, "num1": 6, "av_leg": 2, "members": [1, 2, 3]},
+    {"name": "G2", "H": 600, "B": 300, "dc1": 60, "dia1": 22, "num1": 4, "av_leg": 2, "members": ["4"]},
+]
+
+
+@contextmanager
+def scoped_env(name, value):
+    """환경변수 name을 잠시 value로 바꾼다."""
+    previous = os.environ.get(name)
+    os.environ[name] = value
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[name]
+        else:
+            os.environ[name] = previous
+
+
+def upload_root(path):
+    """업로드 루트(core.data_paths)를 잠시 path로 바꾼다."""
+    return scoped_env(UPLOAD_ROOT_ENV, path)
+
+
+def force_rows(n, seed=3):
+    rnd = random.Random(seed)
+    return [[rnd.choice([1, 2, 3, 4, 5]), rnd.choice([0.0, 2.5, 5.0]), rnd.choice(["LC1", "LC2", "SLS"]),
+             rnd.uniform(-600, 600), rnd.uniform(-400, 400), rnd.uniform(-50, 50)] for _ in range(n)]
+
+
+def expected_cases(rows, members, service=("SLS",)):
+    """행 단위로 직접 계산한 (하중조합 → (Mu, Vu, Nu)) 및 사용 모멘트."""
+    cases, ms = {}, 0.0
+    for member, station, case, M, V, N in rows:
+        if str(member) not in members:
+            continue
+        if case in service:
+            ms = max(ms, abs(M))
+            continue
+        mu, vu, nu = cases.get(case, (-1.0, 0.0, 0.0))
+        if abs(M) > mu:
+            mu, nu = abs(M), N
+        cases[case] = (mu, max(vu, abs(V)), nu)
+    return cases, ms
+
+
+def check(envelope, rows):
+    by_name = {r["name"]: r for r in envelope.to_rows()}
+    for section in SECTIONS:
+        cases, ms = expected_cases(rows, {str(m) for m in section["members"]})
+        actual = {c["name"]: c for c in by_name[section["name"]]["load_cases"]}
+        assert set(actual) == set(cases)
+        for name, (mu, vu, nu) in cases.items():
+            assert abs(actual[name]["Mu"] - mu) < 1e-9 and abs(actual[name]["Vu"] - vu) < 1e-9
+            assert abs(actual[name]["Nu"] - nu) < 1e-9 and abs(actual[name]["Ms"] - ms) < 1e-9
+        assert "members" not in by_name[section["name"]]
+    assert envelope.unmapped == {"5": sum(1 for r in rows if r[0] == 5)}
+    assert envelope.rows_read == len(rows)
+
+
+def test_csv_chunks_match_rowwise():
+    print("--- Testing chunked CSV reduction against a row-wise envelope ---")
+    rows = force_rows(5000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "forces.csv")
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            writer.writerows(rows)
+            writer.writerow(["", "", "", "", "", ""])
+        for chunk_rows in [7, 1000, 100000]:
+            check(import_forces(path, SECTIONS, service_cases=["SLS"], chunk_rows=chunk_rows), rows)
+            print(f"[chunk {chunk_rows}] OK")
+
+
+def test_xlsx_import_mode():
+    print("--- Testing XLSX import through the import_forces mode ---")
+    rows = force_rows(800, seed=9)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "forces.xlsx")
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Forces")
+        ws.append(HEADER)
+        for r in rows:
+            ws.append(r)
+        wb.save(path)
+
+        check(import_forces(path, SECTIONS, sheet="Forces", service_cases=["SLS"], chunk_rows=100), rows)
+        request = {"mode": "import_forces", "path": "forces.xlsx", "sections": SECTIONS,
+                   "service_cases": ["SLS"], "design_standard": "콘크리트설계기준(KCI/KDS)"}
+        with upload_root(tmp):
+            result = handle_request(request)
+        assert [r["name"] for r in result["rows"]] == ["G1", "G2"]
+        assert [e["cases"] for e in result["envelopes"]] == [2, 2]
+        assert result["rows_read"] == len(rows)
+
+
+def test_upload_root():
+    print("--- Testing that import paths stay inside the upload root ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        uploads = os.path.join(tmp, "uploads")
+        os.makedirs(uploads)
+        secret = os.path.join(tmp, "secret.csv")
+        with open(secret, "w", encoding="utf-8") as f:
+            f.write("root:x:0:0\n")
+        os.symlink(secret, os.path.join(uploads, "link.csv"))
+        with open(os.path.join(uploads, "bad.csv"), "w", encoding="utf-8") as f:
+            f.write("root:x:0:0\n1\n")
+        with upload_root(uploads):
+            for path in (secret, "../secret.csv", "link.csv"):
+                try:
+                    handle_request({"mode": "import_forces", "path": path, "sections": SECTIONS})
+                    raise AssertionError(f"{path} should be rejected")
+                except ValueError as e:
+                    assert "upload" in str(e)
+            try:
+                handle_request({"mode": "import_forces", "path": "bad.csv", "sections": SECTIONS})
+                raise AssertionError("missing columns should fail")
+            except ValueError as e:
+                assert "member" in str(e) and "root" not in str(e)
+
+
+def test_column_resolution():
+    print("--- Testing header aliases ---")
+    assert resolve_columns(["부재", "하중조합", "휨모멘트", "전단력"]) == {"member": 0, "case": 1, "M": 2, "V": 3}
+    assert resolve_columns(["id", "Mmax"], columns={"member": "id", "M": "Mmax"}) == {"member": 0, "M": 1}
+    try:
+        resolve_columns(["Elem", "Vz"])
+    except ValueError:
+        return
+    raise AssertionError("missing M column should fail")
+
+
+if __name__ == "__main__":
+    test_csv_chunks_match_rowwise()
+    test_xlsx_import_mode()
+    test_column_resolution()
+    test_upload_root()
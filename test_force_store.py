@@ -0,0 +1,91 @@
+import sys
+import os
+import csv
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request
+from core.force_import import import_forces
+from core.force_store import ForceStore
+from core.data_paths import STORE_ROOT_ENV
+from test_force_import import HEADER, SECTIONS, force_rows, scoped_env, upload_root
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+
+def test_store_matches_import():
+    print("--- Testing the memmap store against a direct import ---")
+    rows = force_rows(3000, seed=21)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "forces.csv")
+        write_csv(source, rows)
+        store = ForceStore.build(os.path.join(tmp, "store"), source, sections=SECTIONS, chunk_rows=256)
+        assert store.rows == len(rows)
+        assert not [f for f in os.listdir(store.path) if f.endswith(".raw")]
+
+        # 부재 구간: 부재 안에서는 원본 순서 유지
+        for member in ["1", "4", 5]:
+            expected = [r[3] for r in rows if str(r[0]) == str(member)]
+            assert store.columns["M"][store.member_rows(member)].tolist() == expected
+        assert store.member_rows("missing") == slice(0, 0)
+
+        direct = import_forces(source, SECTIONS, service_cases=["SLS"])
+        reopened = ForceStore(store.path)
+        assert isinstance(reopened.columns["M"], np.memmap)
+        for chunk_rows in [100, None]:
+            cached = reopened.envelope(service_cases=["SLS"], chunk_rows=chunk_rows)
+            assert cached.to_rows() == direct.to_rows()
+            assert cached.unmapped == direct.unmapped and cached.rows_read == direct.rows_read
+
+        # 한 부재만 재검토: 그 부재의 행만 읽는다
+        partial = reopened.envelope(members=[4], service_cases=["SLS"])
+        assert partial.rows_read == sum(1 for r in rows if r[0] == 4)
+        assert [r["name"] for r in partial.to_rows()] == ["G2"]
+        print(f"{store.rows} rows, {len(store.members)} members OK")
+
+
+def test_store_mode():
+    print("--- Testing import_forces mode with a store ---")
+    rows = force_rows(500, seed=4)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "forces.csv")
+        write_csv(source, rows)
+        stores = os.path.join(tmp, "stores")
+        request = {"mode": "import_forces", "path": "forces.csv", "store": "bridge-1", "sections": SECTIONS,
+                   "service_cases": ["SLS"], "design_standard": "콘크리트설계기준(KCI/KDS)"}
+        with upload_root(tmp), scoped_env(STORE_ROOT_ENV, stores):
+            first = handle_request(request)
+            os.remove(source)  # 재검토는 원본을 읽지 않는다
+
+            recheck_request = {k: v for k, v in request.items() if k not in ("path", "sections")}
+            assert handle_request(recheck_request) == first
+
+            heavier = [dict(SECTIONS[0], num1=10), SECTIONS[1]]
+            changed = handle_request(dict(recheck_request, sections=heavier, recheck_members=["1", "2", "3"]))
+            assert [r["name"] for r in changed["rows"]] == ["G1"]
+            as_used = [result["envelopes"][0]["flexure"]["result"]["as_used"] for result in (first, changed)]
+            assert as_used[1] > as_used[0]
+            assert ForceStore(os.path.join(stores, "bridge-1")).sections[0]["num1"] == 10
+            assert handle_request(recheck_request)["rows"][0]["num1"] == 10
+
+            # 저장소는 프로젝트 id로만 지정한다 (경로는 거부)
+            for store in (os.path.join(tmp, "elsewhere"), "../elsewhere", "a/b", "x" * 65):
+                try:
+                    handle_request(dict(recheck_request, store=store))
+                    raise AssertionError(f"{store} should be rejected")
+                except ValueError as e:
+                    assert "project id" in str(e)
+            assert sorted(os.listdir(tmp)) == ["stores"]
+
+
+if __name__ == "__main__":
+    test_store_matches_import()
+    test_store_mode()
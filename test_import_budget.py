@@ -0,0 +1,51 @@
+import sys
+import os
+import json
+import subprocess
+
+SCRIPT = os.path.abspath(os.path.join('scripts', 'rc_beam_calc.py'))
+
+# Cumulative import time allowed for the analyzer stack in a plain 'calc' call (microseconds)
+IMPORT_BUDGET_US = 100_000
+
+# Modules that a USD2010 'calc' request must never load
+FORBIDDEN_PREFIXES = ("numpy", "pandas", "scipy", "openpyxl", "reports",
+                      "standards.lsd_2012", "standards.lsd_2015", "standards.kci_2017", "standards.kds_2021")
+
+
+def parse_importtime(stderr):
+    """`python -X importtime` 출력을 {module: cumulative_us} 로 변환한다."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = [p.strip() for p in line[len("import time:"):].split("|")]
+        timings[name] = int(cumulative_us)
+    return timings
+
+
+def test_import_budget():
+    print("--- Testing import-time budget for calc mode ---")
+    input_data = {
+        "mode": "calc",
+        "design_standard": "강도설계법(도로교 설계기준, 2010)",
+        "material": {"fck": 35, "fy": 400},
+        "rows": [{"H": 800, "B": 1000, "Mu": 500, "Vu": 200, "Ms": 300, "dc1": 80, "dia1": 25, "num1": 6}],
+    }
+    process = subprocess.run([sys.executable, "-X", "importtime", SCRIPT],
+                             input=json.dumps(input_data, ensure_ascii=False),
+                             capture_output=True, text=True, encoding='utf-8')
+    assert "error" not in json.loads(process.stdout)[0]
+
+    timings = parse_importtime(process.stderr)
+    loaded = [name for name in timings if name.startswith(FORBIDDEN_PREFIXES)]
+    print(f"Forbidden modules loaded: {loaded}")
+    assert not loaded
+
+    analyzer_us = timings["core.rc_section_analyzer"]
+    print(f"core.rc_section_analyzer: {analyzer_us / 1000:.1f} ms (budget {IMPORT_BUDGET_US / 1000:.0f} ms)")
+    assert analyzer_us < IMPORT_BUDGET_US
+
+
+if __name__ == "__main__":
+    test_import_budget()
@@ -0,0 +1,110 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request, run_calc
+from core.load_envelope import parse_load_cases, evaluate_envelopes
+from test_rc_section_batch import STANDARDS, random_row, same_value
+
+LOADS = ("Mu", "Vu", "Nu", "Ms")
+
+
+def scalar_cases(std, section, cases):
+    rows = [dict(section, **{k: case.get(k, 0) for k in LOADS}) for case in cases]
+    return run_calc({"design_standard": std, "material": {"fck": 35, "fy": 400}, "rows": rows, "cache": False})
+
+
+def test_parse_load_cases():
+    print("--- Testing load case input formats ---")
+    names, loads = parse_load_cases({"load_cases": [{"name": "A", "Mu": 10}, {"Vu": 5, "Ms": 2}]})
+    assert names == ["A", "LC2"] and loads.tolist() == [[10, 0, 0, 0], [0, 5, 0, 2]]
+
+    names, loads = parse_load_cases({"load_cases": {"Mu": [1, 2, 3], "Vu": 7}})
+    assert names == ["LC1", "LC2", "LC3"] and loads[:, 1].tolist() == [7, 7, 7]
+
+    row = {"basic_loads": {"D": {"Mu": 100, "Vu": 50}, "L": {"Mu": 40, "Vu": 30, "Ms": 10}},
+           "combinations": [{"name": "1.4D", "factors": {"D": 1.4}}, {"factors": {"D": 1.2, "L": 1.6}}]}
+    names, loads = parse_load_cases(row)
+    assert names == ["1.4D", "C2"]
+    assert loads.tolist() == [[140, 70, 0, 0], [184, 108, 0, 16]]
+
+    names, loads = parse_load_cases({"Mu": 5, "Vu": 1})
+    assert names == ["LC1"] and loads.tolist() == [[5, 1, 0, 0]]
+
+    for bad in [{"load_cases": []}, {"basic_loads": {"D": {}}, "combinations": [{"factors": {"W": 1}}]}]:
+        try:
+            parse_load_cases(bad)
+        except ValueError:
+            continue
+        raise AssertionError(bad)
+
+
+def test_envelope_matches_scalar():
+    print("--- Testing governing cases against scalar analyses ---")
+    rnd = random.Random(5)
+    for std in STANDARDS:
+        sections = [random_row(rnd) for _ in range(4)]
+        for section in sections:
+            section["load_cases"] = [{k: random_row(rnd)[k] for k in LOADS} for _ in range(rnd.randint(1, 12))]
+        envelopes = evaluate_envelopes(35, 400, std, sections, phi_f=0.85, phi_v=0.8, include_cases=True)
+        for section, envelope in zip(sections, envelopes):
+            expected = scalar_cases(std, section, section["load_cases"])
+            assert envelope["cases"] == len(expected)
+            for actual, exp in zip(envelope["results"], expected):
+                for key, value in exp.items():
+                    assert same_value(value, actual[key]), (std, key)
+
+            flexure = envelope["flexure"]
+            assert flexure["result"]["Mr_rate"] == min(r["Mr_rate"] for r in expected)
+            assert flexure["Mu"] == section["load_cases"][flexure["index"]]["Mu"]
+            assert envelope["shear"]["result"]["Vn_rate"] == min(r["Vn_rate"] for r in expected)
+            crack_ng = [r["crack_status"] == "NG" for r in expected]
+            assert envelope["crack"]["ok"] == (not any(crack_ng))
+            if any(crack_ng):
+                assert envelope["crack"]["result"]["crack_status"] == "NG"
+            else:
+                assert envelope["crack"]["result"]["fs"] == max(r["fs"] for r in expected)
+            assert envelope["ok"] == all(envelope[c]["ok"] for c in ("flexure", "shear", "crack"))
+        print(f"[{std}] OK")
+
+
+def test_envelope_mode():
+    print("--- Testing the envelope mode ---")
+    section = {"name": "G1", "H": 800, "B": 400, "dc1": 80, "dia1": 25, "num1": 6, "av_leg": 2,
+               "basic_loads": {"D": {"Mu": 200, "Vu": 150, "Ms": 200}, "L": {"Mu": 150, "Vu": 100, "Ms": 150}},
+               "combinations": [{"name": "1.4D", "factors": {"D": 1.4}},
+                                {"name": "1.2D+1.6L", "factors": {"D": 1.2, "L": 1.6}},
+                                {"name": "D+L", "factors": {"D": 1.0, "L": 1.0}}]}
+    [envelope] = handle_request({"mode": "envelope", "rows": [section]})
+    assert envelope["cases"] == 3 and "results" not in envelope
+    assert envelope["flexure"]["case"] == "1.2D+1.6L" and envelope["flexure"]["index"] == 1
+    assert handle_request({"mode": "envelope", "rows": []}) == []
+
+
+def test_envelope_fiber():
+    print("--- Testing envelopes with axial load under the fiber flexure method ---")
+    std = STANDARDS[-1]
+    section = {"name": "C1", "H": 800, "B": 400, "dc1": 70, "dia1": 25, "num1": 4, "av_leg": 2,
+               "load_cases": [{"name": "N0", "Mu": 420}, {"name": "N+", "Mu": 420, "Nu": 1500},
+                              {"name": "N-", "Mu": 420, "Nu": -300}, {"name": "V", "Mu": 100, "Vu": 250}]}
+    request = {"mode": "envelope", "design_standard": std, "material": {"fck": 35, "fy": 400},
+               "rows": [section], "include_cases": True}
+    [block] = handle_request(request)
+    [fiber] = handle_request(dict(request, flexure_method="fiber"))
+    rows = [dict(section, **{k: case.get(k, 0) for k in LOADS}) for case in section["load_cases"]]
+    expected = run_calc({"design_standard": std, "material": {"fck": 35, "fy": 400}, "rows": rows,
+                         "flexure_method": "fiber", "cache": False})
+    assert fiber["results"] == expected
+    # 응력블록은 축력을 무시하고, 섬유 해석은 축압축/인장에 따라 휨강도가 달라진다
+    assert block["results"][0]["Mr"] == block["results"][1]["Mr"] == block["results"][2]["Mr"]
+    assert fiber["results"][2]["Mr"] < fiber["results"][0]["Mr"] < fiber["results"][1]["Mr"]
+    assert fiber["flexure"]["case"] == "N-" and fiber["flexure"]["Nu"] == -300
+
+
+if __name__ == "__main__":
+    test_parse_load_cases()
+    test_envelope_matches_scalar()
+    test_envelope_mode()
+    test_envelope_fiber()
@@ -0,0 +1,43 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath('scripts'))
+
+from core.materials import ConcMaterial, get_conc_material, material_cache_info, clear_material_caches
+from core.rc_section_analyzer import RCSectionAnalyzer
+from core.rc_section_batch import RCSectionBatch
+
+
+def test_material_cache():
+    print("--- Testing shared material instances ---")
+    clear_material_caches()
+    std = "한계상태설계법(도로교 설계기준, 2012)"
+    row = {"H": 500, "B": 400, "dc1": 60, "dia1": 25, "num1": 4, "Mu": 200, "Vu": 150}
+
+    a1 = RCSectionAnalyzer(35, 400, std, 500, 400, row, row)
+    a2 = RCSectionAnalyzer(35, 400, std, 500, 400, row, row)
+    assert a1.con_material is a2.con_material
+    assert a1.rebar_material is a2.rebar_material
+    assert a1.rebar is a2.rebar
+
+    batch = RCSectionBatch.from_rows([35, 35, 40], 400, std, [row, row, row])
+    assert batch.rebar is a1.rebar
+
+    info = material_cache_info()
+    print(info)
+    assert info["ConcMaterial"]["misses"] == 2  # f_ck 35, 40
+    assert info["ConcMaterial"]["hits"] >= 2
+    assert info["KoreanRebar"]["misses"] == 1
+
+
+def test_lazy_latex():
+    print("--- Testing lazy E_c LaTeX ---")
+    con = ConcMaterial(40, method="LSD")
+    assert "E_c_latex" not in con.__dict__
+    assert con.E_c_latex.startswith("$0.077") and f"{con.E_c:,.1f}" in con.E_c_latex
+    assert get_conc_material(24).E_c_latex == ""
+
+
+if __name__ == "__main__":
+    test_material_cache()
+    test_lazy_latex()
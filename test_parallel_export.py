@@ -0,0 +1,60 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import build_export_workbook, _analyze_row, _read_material, _sheet_names
+from reports.excel import parallel_export
+from test_excel_write_only import dump, row
+
+
+def test_sheet_names():
+    print("--- Testing 31-char sheet names with deduplication ---")
+    long_name = "A very long beam name that exceeds the limit"
+    names = _sheet_names([{"name": long_name}, {"name": long_name}, {"id": 7}, {"name": ""}, {"name": "beam_7"}])
+    print(names)
+    assert names[0] == long_name[:31]
+    assert names[1] == long_name[:29] + "_2"
+    assert names[2:] == ["Beam_7", "Beam_4", "beam_7_2"]
+    assert all(len(n) <= 31 for n in names)
+
+
+def test_parallel_export():
+    print("--- Testing process-pool export against the serial export ---")
+    rows = [dict(row, name=f"P{i}", Vu=[50, 900, 2500][i % 3], num2=(i % 2) * 3, dia2=22, dc2=130) for i in range(7)]
+    for std in ["강도설계법(도로교 설계기준, 2010)", "한계상태설계법(도로교 설계기준, 2015)"]:
+        request = {"design_standard": std, "material": {"fck": 35, "fy": 400}, "rows": rows, "excel_backend": "write_only"}
+        serial = dump(build_export_workbook(dict(request, export_workers=1)))
+        parallel = dump(build_export_workbook(dict(request, export_workers=3)))
+        assert [s[0] for s in parallel] == [f"P{i}" for i in range(7)]
+        assert serial == parallel, std
+        print(f"[{std}] OK")
+
+
+def test_worker_cap():
+    print("--- Testing that export_workers is capped at the CPU count ---")
+    rows = [dict(row, name=f"W{i}") for i in range(4)]
+    request = {"design_standard": "강도설계법(도로교 설계기준, 2010)", "material": {"fck": 35, "fy": 400},
+               "rows": rows, "excel_backend": "write_only"}
+    sizes = []
+    original = parallel_export.ProcessPoolExecutor
+
+    def pool(max_workers):
+        sizes.append(max_workers)
+        return original(max_workers=max_workers)
+
+    parallel_export.ProcessPoolExecutor = pool
+    try:
+        huge = dump(build_export_workbook(dict(request, export_workers=100_000)))
+        items = list(zip(_sheet_names(rows), rows))
+        direct = dump(parallel_export.export_parallel(_analyze_row, _read_material(request), items, 100_000))
+    finally:
+        parallel_export.ProcessPoolExecutor = original
+    assert huge == direct == dump(build_export_workbook(dict(request, export_workers=1)))
+    assert sizes and all(size <= (os.cpu_count() or 1) for size in sizes), sizes
+
+
+if __name__ == "__main__":
+    test_sheet_names()
+    test_parallel_export()
+    test_worker_cap()
@@ -0,0 +1,116 @@
+import sys
+import os
+import csv
+import tempfile
+import itertools
+
+import numpy as np
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request
+from core.rc_section_analyzer import RCSectionAnalyzer
+from core.data_paths import OUTPUT_ROOT_ENV
+from core.param_sweep import ParamSweep, sweep_values
+from test_force_import import scoped_env
+from test_rc_section_batch import STANDARDS
+
+BASE = {"B": 350, "dia1": 22, "dc1": 60, "Vu": 150, "Ms": 80, "av_dia": 13, "av_leg": 2, "av_space": 200}
+AXES = {"fck": [24, 35], "H": {"min": 500, "max": 700, "step": 100}, "num1": [3, 5], "Mu": [0, 200, 450]}
+
+
+def test_sweep_matches_analyzer():
+    print("--- Testing sweep points against the scalar analyzer ---")
+    axes = dict(AXES, standard=STANDARDS[:2], B=[300, 400])
+    sweep = ParamSweep(axes, base=BASE, phi_v=0.8)
+    assert sweep.points == 2 * 2 * 3 * 2 * 3 * 2
+    chunks = list(sweep.iter_chunks(chunk_rows=7))
+    merged = {name: np.concatenate([c[name] for c in chunks]) for name in sweep.columns}
+    assert sweep.columns[0] == "standard"
+
+    # 조합 순서: 설계기준이 가장 바깥, 나머지는 축 순서대로 (마지막 축이 가장 빠름)
+    names = [n for n in axes if n != "standard"]
+    grid = itertools.product(axes["standard"], *(sweep_values(axes[n], n) for n in names))
+    for i, point in enumerate(grid):
+        std, values = point[0], dict(zip(names, point[1:]))
+        assert merged["standard"][i] == std and all(merged[n][i] == values[n] for n in names)
+        row = dict(BASE, **values)
+        analyzer = RCSectionAnalyzer(row["fck"], 400, std, row["H"], row["B"], row, row, phi_v=0.8).analyze()
+        expected = analyzer.get_summary_result()
+        assert round(merged["as_req"][i], 1) == expected["as_req"]
+        assert round(merged["Mr"][i], 1) == expected["Mr"]
+        assert round(merged["Vn_rate"][i], 3) == expected["Vn_rate"]
+        assert bool(merged["min_rebar_ok"][i]) == expected["min_rebar_ok"]
+
+
+def test_cover_axis():
+    print("--- Testing the cover axis ---")
+    chunk = next(ParamSweep({"cover": [40, 50], "num1": [4]}, base=BASE, standard_name=STANDARDS[0]).iter_chunks())
+    other = ParamSweep({"dc1": [40 + 13 + 11, 50 + 13 + 11], "num1": [4]}, base=BASE, standard_name=STANDARDS[0])
+    assert np.array_equal(chunk["Mr"], next(other.iter_chunks())["Mr"])
+    for bad in [{"nope": [1]}, {"H": []}, {"H": {"min": 5, "max": 1, "step": 1}}]:
+        try:
+            ParamSweep(bad, standard_name=STANDARDS[0])
+        except ValueError:
+            continue
+        raise AssertionError(f"axes {bad} should be rejected")
+
+
+def test_sweep_files():
+    print("--- Testing csv / npz sweep output ---")
+    sweep = ParamSweep(AXES, base=BASE, standard_name=STANDARDS[0], outputs=["as_req", "Mr", "crack_ok"])
+    expected = {name: np.concatenate([c[name] for c in sweep.iter_chunks()]) for name in sweep.columns}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "chart.npz")
+        assert sweep.write(path, chunk_rows=5) == sweep.points
+        with np.load(path) as data:
+            assert data.files == sweep.columns
+            for name in sweep.columns:
+                assert np.array_equal(data[name], expected[name])
+        assert not [f for f in os.listdir(tmp) if f != "chart.npz"]
+
+        path = os.path.join(tmp, "chart.csv")
+        sweep.write(path, chunk_rows=5)
+        with open(path, encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == sweep.columns and len(rows) == sweep.points + 1
+        assert [float(v) for v in rows[-1][:len(AXES)]] == [35, 700, 5, 450]
+        assert [float(r[sweep.columns.index("Mr")]) for r in rows[1:]] == expected["Mr"].tolist()
+
+        try:
+            sweep.write(os.path.join(tmp, "chart.txt"))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unknown format should be rejected")
+
+
+def test_sweep_mode():
+    print("--- Testing sweep mode ---")
+    with tempfile.TemporaryDirectory() as tmp, scoped_env(OUTPUT_ROOT_ENV, tmp):
+        path = os.path.join(os.path.realpath(tmp), "runs", "sweep.npz")
+        request = {"mode": "sweep", "design_standard": STANDARDS[1], "material": {"fck": 30, "fy": 400},
+                   "axes": {"H": [500, 600], "Mu": [100, 300]}, "base": BASE, "out_path": "runs/sweep.npz"}
+        # 출력 루트 밖으로는 쓰지 않는다
+        for outside in ("../sweep.npz", os.path.join(os.path.dirname(tmp), "sweep.npz")):
+            try:
+                handle_request(dict(request, out_path=outside))
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"out_path {outside} should be rejected")
+        result = handle_request(request)
+        assert result["points"] == 4 and result["format"] == "npz" and result["file"] == path
+        with np.load(path) as data:
+            assert data["H"].tolist() == [500, 500, 600, 600]
+            batch = handle_request({"mode": "calc", "design_standard": STANDARDS[1], "material": {"fck": 30},
+                                    "cache": False, "rows": [dict(BASE, H=h, Mu=mu) for h in (500, 600)
+                                                             for mu in (100, 300)]})
+            assert [round(v, 3) for v in data["Mr_rate"].tolist()] == [r["Mr_rate"] for r in batch]
+
+
+if __name__ == "__main__":
+    test_sweep_matches_analyzer()
+    test_cover_axis()
+    test_sweep_files()
+    test_sweep_mode()
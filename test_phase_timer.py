@@ -0,0 +1,92 @@
+import sys
+import os
+import io
+import json
+import pstats
+import subprocess
+import tempfile
+
+sys.path.append(os.path.abspath('scripts'))
+
+from core import phase_timer
+from core.phase_timer import phase, session
+from rc_beam_calc import handle_request, run_worker
+
+SCRIPT = os.path.abspath(os.path.join('scripts', 'rc_beam_calc.py'))
+ROW = {"H": 800, "B": 400, "dc1": 70, "dia1": 25, "num1": 4, "Mu": 300, "Vu": 200, "Ms": 150,
+       "av_dia": 13, "av_leg": 2, "av_space": 200, "crack_case": "일반환경"}
+REQUEST = {"mode": "calc", "design_standard": "강도설계법(도로교 설계기준, 2010)", "material": {"fck": 35, "fy": 400},
+           "rows": [ROW, dict(ROW, H=900)], "cache": False}
+ANALYZE_PHASES = ("construct", "analyze", "calc_moment.capacity", "calc_shear.capacity", "calc_service.capacity",
+                  "calc_moment.demand", "calc_shear.demand", "calc_service.demand",
+                  "check_min_rebar", "check_max_rebar")
+
+
+def test_disabled():
+    print("--- Testing disabled phase timer ---")
+    assert phase_timer.active() is None
+    assert phase("calc_moment.capacity") is phase_timer._NULL
+    assert phase_timer.enabled({"timings": True}) and not phase_timer.enabled({"timings": False})
+    with session() as timer:
+        assert timer is None and phase_timer.active() is None
+
+
+def test_phases_recorded():
+    print("--- Testing per-phase timings for calc and report ---")
+    with session(True) as timer:
+        handle_request(REQUEST)
+        handle_request(dict(REQUEST, mode="report", rows=[ROW]))
+    assert phase_timer.active() is None
+    phases = timer.summary()["phases"]
+    for name in ANALYZE_PHASES + ("mode.calc", "mode.report", "report.text"):
+        assert name in phases, name
+    assert phases["analyze"]["count"] == 3 and phases["mode.calc"]["count"] == 1
+    assert all(p["wall_ms"] >= 0 and p["cpu_ms"] >= 0 for p in phases.values())
+
+
+def test_worker_timings():
+    print("--- Testing _timings in worker responses ---")
+    stdin = io.StringIO(json.dumps(dict(REQUEST, id=1, timings=True)) + "\n" + json.dumps(dict(REQUEST, id=2)) + "\n")
+    stdout = io.StringIO()
+    run_worker(stdin, stdout)
+    timed, plain = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert timed["ok"] and len(timed["result"]) == 2
+    assert {"json.decode", "json.encode", "mode.calc"} <= set(timed["_timings"]["phases"])
+    assert "_timings" not in plain
+
+
+def test_cli_timings_and_profile():
+    print("--- Testing _timings and profile output from the CLI ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        path, ignored = os.path.join(tmp, "calc.prof"), os.path.join(tmp, "request.prof")
+        env = dict(os.environ, **{phase_timer.PROFILE_ENV: path})
+        payload = json.dumps(dict(REQUEST, timings=True, profile=ignored), ensure_ascii=False)
+        process = subprocess.run([sys.executable, SCRIPT], input=payload, env=env, capture_output=True, text=True,
+                                 encoding='utf-8', check=True)
+        output = json.loads(process.stdout)
+        assert len(output["result"]) == 2 and "as_used" in output["result"][0]
+        assert "json.decode" in output["_timings"]["phases"]
+        stats = pstats.Stats(path)
+        assert any(func[2] == "handle_request" for func in stats.stats)
+        # 요청 본문의 "profile"은 파일을 쓰지 않는다
+        assert not os.path.exists(ignored)
+        subprocess.run([sys.executable, SCRIPT, "--worker"], input=payload + "\n", capture_output=True, text=True,
+                       encoding='utf-8', check=True)
+        assert not os.path.exists(ignored)
+
+        # 환경변수로 켜기 / 계측이 꺼져 있으면 출력 형식 그대로
+        env = dict(os.environ, **{phase_timer.TIMINGS_ENV: "1"})
+        process = subprocess.run([sys.executable, SCRIPT, "--ndjson"], input=json.dumps(REQUEST), env=env,
+                                 capture_output=True, text=True, encoding='utf-8', check=True)
+        trailer = json.loads(process.stdout.splitlines()[-1])
+        assert trailer["done"] and trailer["count"] == 2 and "json.decode" in trailer["_timings"]["phases"]
+        process = subprocess.run([sys.executable, SCRIPT], input=json.dumps(REQUEST), capture_output=True,
+                                 text=True, encoding='utf-8', check=True)
+        assert isinstance(json.loads(process.stdout), list)
+
+
+if __name__ == "__main__":
+    test_disabled()
+    test_phases_recorded()
+    test_worker_timings()
+    test_cli_timings_and_profile()
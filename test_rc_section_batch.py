@@ -0,0 +1,59 @@
+import sys
+import os
+import math
+import random
+
+sys.path.append(os.path.abspath('scripts'))
+
+from core.rc_section_analyzer import RCSectionAnalyzer
+from core.rc_section_batch import RCSectionBatch
+
+STANDARDS = [
+    "강도설계법(도로교 설계기준, 2010)",
+    "콘크리트설계기준(KCI/KDS)",
+    "강도설계법(콘크리트구조 설계기준, 2021)",
+    "한계상태설계법(도로교 설계기준, 2012)",
+    "한계상태설계법(도로교 설계기준, 2015)",
+]
+
+
+def random_row(rnd):
+    row = {
+        "H": rnd.choice([300, 500, 800, 1200]), "B": rnd.choice([300, 400, 1000]),
+        "dc1": rnd.choice([50, 80]), "dia1": rnd.choice([13, 16, 19, 22, 25, 29, 32]), "num1": rnd.randint(0, 10),
+        "Mu": rnd.uniform(0, 2000), "Vu": rnd.uniform(0, 1500), "Ms": rnd.uniform(0, 800),
+        "Nu": rnd.choice([0, 0, rnd.uniform(-500, 500)]),
+        "av_dia": rnd.choice([10, 13, 16]), "av_leg": rnd.choice([0, 2, 4]), "av_space": rnd.choice([100, 150, 200, 300]),
+        "crack_case": rnd.choice(["건조한 환경", "일반환경", "부식성 환경"]),
+    }
+    if rnd.random() < 0.5:
+        row.update(dc2=row["dc1"] + 50, dia2=rnd.choice([13, 22, 25]), num2=rnd.randint(0, 6))
+    return row
+
+
+def same_value(expected, actual):
+    if isinstance(expected, (bool, str)) or isinstance(actual, (bool, str)):
+        return expected == actual
+    return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_rc_section_batch():
+    print("--- Testing RCSectionBatch against RCSectionAnalyzer ---")
+    rnd = random.Random(2024)
+    for std in STANDARDS:
+        for f_ck in [24, 35, 60]:
+            rows = [random_row(rnd) for _ in range(60)]
+            batch = RCSectionBatch.from_rows(f_ck, 400, std, rows, phi_f=0.85, phi_v=0.8).analyze()
+            results = batch.get_summary_results()
+            for i, row in enumerate(rows):
+                analyzer = RCSectionAnalyzer(f_ck, 400, std, row["H"], row["B"], row, row, phi_f=0.85, phi_v=0.8)
+                expected = analyzer.analyze().get_summary_result()
+                for key, value in expected.items():
+                    assert same_value(value, results[i][key]), (std, f_ck, i, key, value, results[i][key])
+                for attr in ("as_req", "M_r", "pi_V_n", "f_s", "s_min"):
+                    assert math.isclose(getattr(analyzer, attr), batch.__dict__[attr][i], rel_tol=1e-12, abs_tol=1e-9)
+        print(f"[{std}] OK")
+
+
+if __name__ == "__main__":
+    test_rc_section_batch()
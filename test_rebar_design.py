@@ -0,0 +1,90 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request
+from core.rc_section_analyzer import RCSectionAnalyzer
+from core.rebar_design import design_rebar, rebar_candidates, LAYOUT_KEYS
+from test_rc_section_batch import STANDARDS
+
+DIAMETERS = (16, 22, 29)
+
+
+def design_row(rnd):
+    return {"H": rnd.choice([500, 800, 1200]), "B": rnd.choice([300, 400, 1000]),
+            "Mu": rnd.uniform(50, 1500), "Vu": rnd.uniform(0, 500), "Ms": rnd.uniform(20, 700),
+            "Nu": rnd.choice([0, 0, rnd.uniform(-200, 200)]), "av_leg": 2,
+            "crack_case": rnd.choice(["건조한 환경", "일반환경", "부식성 환경"])}
+
+
+def brute_force(std, row, phi_f=0.85):
+    """모든 후보를 스칼라 해석기로 검토한 최소 철근량 (없으면 None)."""
+    table = rebar_candidates(float(row["B"]), 16, 50.0, DIAMETERS)
+    for i in range(len(table["as_use"])):
+        layout = {key: table[key][i].item() for key in LAYOUT_KEYS}
+        data = dict(row, **layout)
+        summary = RCSectionAnalyzer(35, 400, std, row["H"], row["B"], data, data, phi_f=phi_f, phi_v=0.8).analyze().get_summary_result()
+        if summary["Mr_rate"] >= 1.0 and summary["min_rebar_ok"] and summary["max_rebar_ok"] \
+                and summary["crack_status"] == "OK":
+            return table["as_use"][i], summary
+    return None, None
+
+
+def test_candidates_fit_width():
+    print("--- Testing candidate layouts against clear spacing ---")
+    table = rebar_candidates(400.0, 16, 50.0)
+    assert list(table["as_use"]) == sorted(table["as_use"])
+    inner = 400 - 2 * (50 + 16)
+    for dia, num in zip(table["dia1"], table["num1"]):
+        clear = max(25, dia, 4 / 3 * 25)
+        assert num * dia + (num - 1) * clear <= inner + 1e-9
+    assert all(n == 0 or n >= 2 for key in ("num2", "num3") for n in table[key])
+    assert len(rebar_candidates(100.0, 16, 50.0)["as_use"]) == 0
+
+
+def test_design_matches_brute_force():
+    print("--- Testing the batched search against an exhaustive scalar search ---")
+    rnd = random.Random(17)
+    # phi_f = 0: USD 기준은 φ를 εt로 정한다 (LSD의 phi_f는 재료계수라 0은 쓰지 않음)
+    cases = [(std, 0.85) for std in STANDARDS] + [(std, 0.0) for std in STANDARDS if not std.startswith("한계")]
+    for std, phi_f in cases:
+        rows = [design_row(rnd) for _ in range(6)]
+        designs = design_rebar(35, 400, std, rows, phi_f=phi_f, phi_v=0.8, diameters=DIAMETERS, window=8)
+        for row, design in zip(rows, designs):
+            as_best, summary = brute_force(std, row, phi_f)
+            if as_best is None:
+                assert not design["found"], (std, phi_f, row)
+                continue
+            assert design["found"] and design["as_used"] == as_best, (std, phi_f, row, design["as_used"], as_best)
+            assert design["result"] == summary
+        found = sum(d["found"] for d in designs)
+        print(f"[{std}, phi_f={phi_f}] {found}/{len(rows)} designed, "
+              f"{sum(d['checked'] for d in designs)} candidates checked")
+
+
+def test_auto_phi_bound():
+    print("--- Testing the As lower bound when phi_f follows the net tensile strain ---")
+    std = "콘크리트설계기준(KCI/KDS)"
+    row = {"H": 800, "B": 1000, "Mu": 1023, "Vu": 0, "Ms": 0, "av_leg": 2}
+    [design] = design_rebar(35, 400, std, [row], phi_f=0.0, phi_v=0.8, diameters=DIAMETERS)
+    as_best, _ = brute_force(std, row, 0.0)
+    assert design["found"] and design["as_used"] == as_best, (design["as_used"], as_best)
+
+
+def test_design_mode():
+    print("--- Testing the design_rebar mode ---")
+    row = {"H": 800, "B": 400, "Mu": 600, "Vu": 300, "Ms": 400, "av_leg": 2}
+    [design] = handle_request({"mode": "design_rebar", "rows": [row], "cover": 40, "max_layers": 2})
+    assert design["found"] and design["layout"]["num3"] == 0
+    assert design["layout"]["dc1"] == 40 + 16 + design["layout"]["dia1"] / 2
+    calc = handle_request({"mode": "calc", "rows": [dict(row, **design["layout"])], "cache": False})
+    assert calc[0] == design["result"]
+
+
+if __name__ == "__main__":
+    test_candidates_fit_width()
+    test_design_matches_brute_force()
+    test_auto_phi_bound()
+    test_design_mode()
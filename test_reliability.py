@@ -0,0 +1,90 @@
+import sys
+import os
+from statistics import NormalDist
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request
+from core.rc_section_batch import RCSectionBatch
+from core.reliability import MAX_TOTAL_SAMPLES, analyze_reliability
+from test_rc_section_batch import STANDARDS
+
+ROW = {"H": 700, "B": 400, "dc1": 70, "dia1": 25, "num1": 4, "Mu": 330, "Vu": 250,
+       "av_dia": 13, "av_leg": 2, "av_space": 250}
+FIXED = {name: {"dist": "deterministic"} for name in ("fck", "fy", "as", "cover", "Mu", "Vu")}
+
+
+def test_normal_load_matches_closed_form():
+    print("--- Testing Pf against the closed form for a normal load effect ---")
+    for std in STANDARDS:
+        batch = RCSectionBatch.from_rows(35, 400, std, [ROW], phi_f=1.0, phi_v=1.0).analyze()
+        capacity = float(batch.M_r[0]) / 1e6
+        mean, sd = 0.8 * capacity, 0.1 * capacity
+        variables = dict(FIXED, Mu={"dist": "normal", "mean": mean, "std": sd})
+        result = analyze_reliability(35, 400, std, [ROW], variables=variables, samples=200_000, seed=3,
+                                     chunk_size=50_000)[0]
+        flexure = result["checks"]["flexure"]
+        beta = (capacity - mean) / sd
+        pf = 1 - NormalDist().cdf(beta)
+        assert result["variables"] == ["Mu"] and result["samples"] == 200_000
+        assert abs(flexure["pf"] - pf) < 4 * flexure["pf_cov"] * pf
+        assert abs(flexure["beta"] - beta) < 0.05
+        assert flexure["alpha"] == {"Mu": -1.0}
+        print(f"[{std}] Pf {flexure['pf']:.5f} (exact {pf:.5f}), beta {flexure['beta']}")
+
+
+def test_sensitivity_and_checks():
+    print("--- Testing sensitivity factors and per-check results ---")
+    variables = {"Mu": {"dist": "gumbel", "bias": 1.0, "cov": 0.25}}
+    result = analyze_reliability(35, 400, STANDARDS[1], [ROW, dict(ROW, num1=8, Vu=0)], variables=variables,
+                                 samples=60_000, seed=7)
+    weak, strong = result
+    alpha = weak["checks"]["flexure"]["alpha"]
+    assert alpha["fy"] > 0 and alpha["Mu"] < 0 and max(alpha, key=lambda k: abs(alpha[k])) == "Mu"
+    assert abs(sum(a * a for a in alpha.values()) - 1) < 1e-2
+    checks = weak["checks"]
+    assert checks["system"]["failures"] >= max(checks["flexure"]["failures"], checks["shear"]["failures"])
+    assert strong["checks"]["flexure"]["pf"] < checks["flexure"]["pf"]
+    assert strong["checks"]["shear"] == {"pf": 0.0, "failures": 0, "beta": None, "pf_cov": None, "alpha": None}
+
+
+def test_seed_and_workers():
+    print("--- Testing seeded, chunked and process-pool sampling ---")
+    args = (35, 400, STANDARDS[0], [ROW, dict(ROW, Mu=400)])
+    serial = analyze_reliability(*args, samples=30_000, seed=11, chunk_size=8_000)
+    assert analyze_reliability(*args, samples=30_000, seed=11, chunk_size=8_000, workers=2) == serial
+    assert analyze_reliability(*args, samples=30_000, seed=12, chunk_size=8_000) != serial
+    for bad in [{"fck": {"dist": "weibull"}}, {"Ms": {"dist": "normal"}}]:
+        try:
+            analyze_reliability(*args, variables=bad, samples=10)
+        except ValueError:
+            continue
+        raise AssertionError(f"variables {bad} should be rejected")
+
+
+def test_reliability_mode():
+    print("--- Testing reliability mode ---")
+    request = {"mode": "reliability", "design_standard": STANDARDS[0], "material": {"fck": 35, "fy": 400},
+               "rows": [ROW], "samples": 20_000, "seed": 5}
+    nominal = handle_request(request)
+    assert nominal == analyze_reliability(35, 400, STANDARDS[0], [ROW], samples=20_000, seed=5)
+    factored = handle_request(dict(request, nominal=False))
+    assert factored[0]["checks"]["system"]["pf"] > nominal[0]["checks"]["system"]["pf"]
+
+    # 표본 수 상한 / 워커 수는 코어 수까지
+    for bad in ({"samples": MAX_TOTAL_SAMPLES + 1}, {"samples": MAX_TOTAL_SAMPLES // 2, "rows": [ROW] * 3},
+                {"samples": 0}, {"samples": "1000"}, {"reliability_workers": 0}):
+        try:
+            handle_request(dict(request, **bad))
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad} should be rejected")
+    assert handle_request(dict(request, samples=2_000, reliability_workers=100_000)) == \
+        analyze_reliability(35, 400, STANDARDS[0], [ROW], samples=2_000, seed=5)
+
+
+if __name__ == "__main__":
+    test_normal_load_matches_closed_form()
+    test_sensitivity_and_checks()
+    test_seed_and_workers()
+    test_reliability_mode()
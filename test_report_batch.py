@@ -0,0 +1,88 @@
+import sys
+import os
+import io
+import json
+import zipfile
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import _pool_workers, run_report, stream_export
+from test_excel_write_only import row
+
+STANDARDS = ["강도설계법(도로교 설계기준, 2010)", "콘크리트설계기준(KCI/KDS)", "한계상태설계법(도로교 설계기준, 2015)"]
+rows = [dict(row, name=f"R{i}", Vu=[50, 900][i % 2]) for i in range(5)]
+
+
+def test_report_sections():
+    print("--- Testing section selection against the full report ---")
+    for std in STANDARDS:
+        request = {"mode": "report", "design_standard": std, "rows": rows}
+        full = run_report(request)
+        assert set(full) == {"total", "flexure", "shear", "service"}
+        shear = run_report(dict(request, sections=["shear"]))
+        assert set(shear) == {"total", "shear"}
+        assert shear["shear"] == shear["total"] == full["shear"]
+        both = run_report(dict(request, sections=["service", "flexure"]))
+        assert list(both) == ["total", "flexure", "service"]
+        assert both["flexure"] == full["flexure"] and both["service"] == full["service"]
+        print(f"[{std}] OK")
+
+    try:
+        run_report(dict(request, sections=["torsion"]))
+        assert False, "unknown section must be rejected"
+    except ValueError as e:
+        print(f"Rejected: {e}")
+
+
+def test_report_batch_json():
+    print("--- Testing JSON batch reports (serial and process pool) ---")
+    request = {"mode": "report", "design_standard": STANDARDS[0], "rows": rows, "format": "json"}
+    serial = run_report(dict(request, report_workers=1))
+    parallel = run_report(dict(request, report_workers=2))
+    assert [r["name"] for r in serial] == [f"R{i}" for i in range(5)]
+    assert serial == parallel
+    for i, report in enumerate(serial):
+        single = run_report({"mode": "report", "design_standard": STANDARDS[0], "rows": [rows[i]]})
+        assert {k: v for k, v in report.items() if k != "name"} == single
+
+
+def test_report_batch_zip():
+    print("--- Testing streamed zip of .txt reports ---")
+    request = {"mode": "report", "design_standard": STANDARDS[2], "rows": rows, "format": "zip",
+               "sections": ["flexure"]}
+    out = io.BytesIO()
+    stream_export(request, out)
+    data = out.getvalue()
+    newline = data.index(b"\n")
+    header = json.loads(data[:newline])
+    body = data[newline + 1:]
+    assert header["success"] and header["size"] == len(body)
+
+    json_reports = run_report(dict(request, format="json"))
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        assert archive.namelist() == [f"R{i}.txt" for i in range(5)]
+        for name, report in zip(archive.namelist(), json_reports):
+            assert archive.read(name).decode("utf-8") == report["total"] == report["flexure"]
+    print(f"zip {len(body)} bytes OK")
+
+
+def test_pool_workers():
+    print("--- Testing worker counts taken from the request ---")
+    cpus = os.cpu_count() or 1
+    assert _pool_workers({"report_workers": 10**6}, "report_workers", 10**7, 64) == cpus
+    assert _pool_workers({"report_workers": 3}, "report_workers", 2, 64) == min(2, cpus)
+    assert _pool_workers({}, "report_workers", 10, 64) == 1
+    for bad in (0, -4, 2.5, "8", True):
+        try:
+            _pool_workers({"report_workers": bad}, "report_workers", 100, 64)
+        except ValueError as e:
+            assert "report_workers" in str(e)
+        else:
+            raise AssertionError(f"report_workers={bad!r} should be rejected")
+
+
+if __name__ == "__main__":
+    test_report_sections()
+    test_report_batch_json()
+    test_report_batch_zip()
+    test_pool_workers()
@@ -0,0 +1,88 @@
+import sys
+import os
+import json
+import sqlite3
+import subprocess
+import tempfile
+
+sys.path.append(os.path.abspath('scripts'))
+
+import rc_beam_calc
+from rc_beam_calc import run_calc, _read_material
+from core.result_cache import ResultCache, cache_key, cached_results, get_result_cache
+from test_excel_write_only import row
+
+SCRIPT = os.path.join('scripts', 'rc_beam_calc.py')
+
+
+def test_cache_key():
+    print("--- Testing canonical cache keys ---")
+    mat = _read_material({"material": {"fck": 35, "fy": 400}})
+    key = cache_key(mat, row)
+    assert cache_key(mat, dict(row, id=99, name="other")) == key
+    assert cache_key(mat, dict(row, H="800", num1=6.0)) == key
+    aliased = {k: v for k, v in row.items() if k not in ("dc1", "dia1", "num1")}
+    assert cache_key(mat, dict(aliased, Dc=80, as_dia=25, as_num=6)) == key
+    assert cache_key(mat, dict(row, Mu=501)) != key
+    assert cache_key(dict(mat, f_ck=40), row) != key
+    assert cache_key(mat, dict(row, H="bad")) is None
+
+
+def test_cache_hits_skip_analysis():
+    print("--- Testing that cache hits skip the analyzer ---")
+    rows = [dict(row, id=i, Mu=300 + 10 * i) for i in range(200)]
+    request = {"mode": "calc", "design_standard": "콘크리트설계기준(KCI/KDS)", "rows": rows}
+    expected = run_calc(dict(request, cache=False))
+    get_result_cache().clear()
+    assert run_calc(request) == expected
+
+    calls = []
+    original = rc_beam_calc._analyze_row
+    rc_beam_calc._analyze_row = lambda mat, r: calls.append(r) or original(mat, r)
+    try:
+        rows[17] = dict(rows[17], Mu=777)
+        results = run_calc(request)
+    finally:
+        rc_beam_calc._analyze_row = original
+    print(f"Analyses after editing one row: {len(calls)}")
+    assert len(calls) == 1 and calls[0]["Mu"] == 777
+    assert results[:17] == expected[:17] and results[18:] == expected[18:]
+    assert results[17] == run_calc(dict(request, rows=[rows[17]], cache=False))[0]
+
+
+def test_lru_and_disk_tier():
+    print("--- Testing LRU eviction and the SQLite tier ---")
+    mat = _read_material({})
+    rows = [dict(row, Mu=100 + i) for i in range(5)]
+    compute = lambda m, rs: [{"Mu": r["Mu"]} for r in rs]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        first = ResultCache(maxsize=3, path=path)
+        assert cached_results(mat, rows, compute, first) == [{"Mu": 100 + i} for i in range(5)]
+        assert first.info()["size"] == 3
+
+        second = ResultCache(maxsize=3, path=path)
+        never = lambda m, rs: [None for _ in rs]
+        assert cached_results(mat, rows, never, second) == [{"Mu": 100 + i} for i in range(5)]
+        assert second.info()["disk_hits"] == 5 and second.info()["misses"] == 0
+        second._db.close()
+        first._db.close()
+
+
+def test_disk_cache_across_processes():
+    print("--- Testing the on-disk cache across CLI invocations ---")
+    request = {"mode": "calc", "rows": [row, dict(row, Mu=650)]}
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, RC_BEAM_CACHE_DB=os.path.join(tmp, "cache.db"))
+        outputs = [subprocess.run([sys.executable, SCRIPT], input=json.dumps(request).encode(), env=env,
+                                  capture_output=True, check=True).stdout for _ in range(2)]
+        assert outputs[0] == outputs[1]
+        with sqlite3.connect(env["RC_BEAM_CACHE_DB"]) as db:
+            assert db.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 2
+
+
+if __name__ == "__main__":
+    test_cache_key()
+    test_cache_hits_skip_analysis()
+    test_lru_and_disk_tier()
+    test_disk_cache_across_processes()
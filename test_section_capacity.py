@@ -0,0 +1,68 @@
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.append(os.path.abspath('scripts'))
+
+from core.rc_section_analyzer import RCSectionAnalyzer, capacity_cache_info, clear_capacity_cache
+from core.rc_section_batch import RCSectionBatch
+from test_rc_section_batch import STANDARDS, random_row
+
+
+def load_cases(rnd, sections, n):
+    """sections 중 하나에 임의의 하중(Mu, Vu, Nu, Ms)을 붙인 행 n개."""
+    rows = []
+    for _ in range(n):
+        probe = random_row(rnd)
+        rows.append(dict(rnd.choice(sections), **{k: probe[k] for k in ("Mu", "Vu", "Nu", "Ms")}))
+    return rows
+
+
+def analyzer_state(f_ck, std, row):
+    analyzer = RCSectionAnalyzer(f_ck, 400, std, row["H"], row["B"], row, row, phi_f=0.85, phi_v=0.8).analyze()
+    return {k: v for k, v in analyzer.__dict__.items() if k not in ("rebar_data",)}
+
+
+def test_capacity_cache_matches_fresh_analysis():
+    print("--- Testing cached section capacity against a fresh analysis ---")
+    rnd = random.Random(7)
+    for std in STANDARDS:
+        sections = [random_row(rnd) for _ in range(5)]
+        rows = load_cases(rnd, sections, 40)
+        cached = []
+        for row in rows:
+            cached.append(analyzer_state(35, std, row))
+        for row, state in zip(rows, cached):
+            clear_capacity_cache()
+            assert analyzer_state(35, std, row) == state, std
+        print(f"[{std}] OK")
+
+    clear_capacity_cache()
+    for row in load_cases(rnd, sections, 30):
+        analyzer_state(35, STANDARDS[0], row)
+    assert capacity_cache_info()["size"] <= len(sections)
+
+
+def test_batch_groups_sections():
+    print("--- Testing grouped batch capacity against per-row capacity ---")
+    rnd = random.Random(11)
+    for std in STANDARDS:
+        sections = [random_row(rnd) for _ in range(6)]
+        rows = load_cases(rnd, sections, 200)
+        for phi_f in [0.85, 0.0]:
+            grouped = RCSectionBatch.from_rows([35, 40] * 100, 400, std, rows, phi_f=phi_f).analyze(group_sections=True)
+            per_row = RCSectionBatch.from_rows([35, 40] * 100, 400, std, rows, phi_f=phi_f).analyze(group_sections=False)
+            assert grouped.get_summary_results() == per_row.get_summary_results(), std
+            for attr in ("as_req", "M_r", "pi_V_n", "f_s", "s_min", "chi_o", "v_theta"):
+                assert np.array_equal(getattr(grouped, attr), getattr(per_row, attr)), (std, attr)
+            assert grouped.section_count <= 2 * len(sections)
+        auto = RCSectionBatch.from_rows(35, 400, std, rows).analyze()
+        assert auto.section_count <= len(sections)
+        print(f"[{std}] {auto.section_count} sections for {len(rows)} rows OK")
+
+
+if __name__ == "__main__":
+    test_capacity_cache_matches_fresh_analysis()
+    test_batch_groups_sections()
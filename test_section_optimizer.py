@@ -0,0 +1,127 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request
+from core import section_optimizer
+from core.section_optimizer import optimize_sections, pareto_front, section_grid
+
+KDS = "콘크리트설계기준(KCI/KDS)"
+GRID = {"H": {"min": 400, "max": 1000, "step": 50}, "B": [300, 350, 400, 500]}
+MEMBERS = [
+    {"name": "G1", "Mu": 600, "Vu": 400, "Ms": 400, "av_dia": 13},
+    {"name": "G2", "Mu": 250, "Vu": 180, "Ms": 170, "av_dia": 13},
+    {"name": "G3", "Mu": 9000, "Vu": 4000, "Ms": 6000, "av_dia": 13},  # 격자 안에 해가 없다
+]
+
+
+def test_grid():
+    print("--- Testing section grid definitions ---")
+    H, B = section_grid(GRID)
+    assert len(H) == 13 * 4 and H.min() == 400 and H.max() == 1000
+    assert sorted(set(B.tolist())) == [300, 350, 400, 500]
+    H, _ = section_grid({"H": {"min": 500, "max": 620, "step": 50}, "B": [300]})
+    assert H.tolist() == [500, 550, 600]
+    for bad in [None, {"H": {"min": 500, "max": 400}, "B": [300]}, {"H": [], "B": [300]}]:
+        try:
+            section_grid(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"grid {bad} should be rejected")
+
+
+def test_pareto_front():
+    print("--- Testing the Pareto front against a brute-force dominance check ---")
+    rnd = np.random.default_rng(5)
+    cost = rnd.integers(0, 20, 300).astype(float)
+    utilization = rnd.integers(0, 20, 300).astype(float) / 20
+    front = pareto_front(cost, utilization)
+    dominated = [any(cost[j] <= cost[i] and utilization[j] <= utilization[i]
+                     and (cost[j] < cost[i] or utilization[j] < utilization[i]) for j in range(300))
+                 for i in range(300)]
+    expected = {(cost[i], utilization[i]) for i in range(300) if not dominated[i]}
+    assert {(cost[i], utilization[i]) for i in front} == expected
+    assert len(front) == len(expected)  # 같은 점은 하나만
+    assert np.all(np.diff(cost[front]) > 0)
+
+
+def test_optimize_sections():
+    print("--- Testing cheapest section and Pareto front per member ---")
+    results = optimize_sections(35, 400, KDS, MEMBERS, grid=GRID, phi_v=0.8)
+    for member, entry in zip(MEMBERS, results):
+        assert entry["candidates"] == 52
+        if member["name"] == "G3":
+            assert entry["feasible"] == 0 and entry["best"] is None and entry["pareto"] == []
+            continue
+        best, front = entry["best"], entry["pareto"]
+        assert best == front[0]
+        assert best["result"]["Mr_rate"] >= 1.0 and best["result"]["Vn_rate"] >= 1.0
+        assert best["utilization"] <= 1.0
+        costs = [c["cost"] for c in front]
+        assert costs == sorted(costs)
+        assert all(a["utilization"] >= b["utilization"] for a, b in zip(front, front[1:]))
+        detail = best["cost_detail"]
+        assert abs(sum(detail.values()) - best["cost"]) < 0.02
+        print(f"{member['name']}: {entry['feasible']}/{entry['candidates']} feasible, "
+              f"best {best['H']:.0f}x{best['B']:.0f} cost {best['cost']}, {len(front)} on front")
+
+    # 비용 모델을 바꾸면 최적 단면이 바뀐다 (거푸집이 비싸면 낮은 단면)
+    cheap = optimize_sections(35, 400, KDS, MEMBERS[:1], grid=GRID, phi_v=0.8, cost={"formwork": 1000})[0]["best"]
+    assert cheap["H"] <= results[0]["best"]["H"]
+
+    # 행별 격자
+    own = optimize_sections(35, 400, KDS, [dict(MEMBERS[1], grid={"H": [600], "B": [400]})], grid=GRID, phi_v=0.8)
+    assert own[0]["candidates"] == 1 and own[0]["best"]["H"] == 600
+
+
+def test_parallel_matches_serial():
+    print("--- Testing process-pool optimization against serial ---")
+    original = section_optimizer.OPTIMIZE_CHUNK
+    section_optimizer.OPTIMIZE_CHUNK = 16
+    try:
+        serial = optimize_sections(35, 400, KDS, MEMBERS, grid=GRID, phi_v=0.8)
+        parallel = optimize_sections(35, 400, KDS, MEMBERS, grid=GRID, phi_v=0.8, workers=2)
+    finally:
+        section_optimizer.OPTIMIZE_CHUNK = original
+    assert parallel == serial == optimize_sections(35, 400, KDS, MEMBERS, grid=GRID, phi_v=0.8)
+
+
+def test_optimize_mode():
+    print("--- Testing optimize_sections mode ---")
+    request = {"mode": "optimize_sections", "design_standard": KDS, "material": {"fck": 35, "fy": 400},
+               "rows": MEMBERS[:2], "grid": GRID, "optimize_workers": 1}
+    result = handle_request(request)
+    assert result == optimize_sections(35, 400, KDS, MEMBERS[:2], grid=GRID, phi_v=0.8)
+
+
+def test_worker_cap():
+    print("--- Testing that optimize_workers is capped at the CPU count ---")
+    sizes = []
+    original_pool, original_chunk = section_optimizer.ProcessPoolExecutor, section_optimizer.OPTIMIZE_CHUNK
+
+    def pool(max_workers):
+        sizes.append(max_workers)
+        return original_pool(max_workers=max_workers)
+
+    section_optimizer.ProcessPoolExecutor, section_optimizer.OPTIMIZE_CHUNK = pool, 8
+    try:
+        request = {"mode": "optimize_sections", "design_standard": KDS, "material": {"fck": 35, "fy": 400},
+                   "rows": MEMBERS[:1], "grid": GRID, "optimize_workers": 100_000}
+        result = handle_request(request)
+        direct = optimize_sections(35, 400, KDS, MEMBERS[:1], grid=GRID, phi_v=0.8, workers=100_000)
+    finally:
+        section_optimizer.ProcessPoolExecutor, section_optimizer.OPTIMIZE_CHUNK = original_pool, original_chunk
+    assert result == direct == optimize_sections(35, 400, KDS, MEMBERS[:1], grid=GRID, phi_v=0.8)
+    assert all(size <= (os.cpu_count() or 1) for size in sizes)
+
+
+if __name__ == "__main__":
+    test_grid()
+    test_pareto_front()
+    test_optimize_sections()
+    test_parallel_matches_serial()
+    test_optimize_mode()
+    test_worker_cap()
@@ -0,0 +1,76 @@
+import sys
+import os
+import random
+import time
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request
+from core.rc_section_batch import RCSectionBatch
+from core.standard_compare import COMPARE_FACTORS, compare_standards
+from standards import get_standard
+from test_rc_section_batch import STANDARDS, random_row
+
+
+def test_with_standard_matches_fresh_batch():
+    print("--- Testing with_standard() against a freshly built batch ---")
+    rnd = random.Random(8)
+    rows = [random_row(rnd) for _ in range(300)] * 2  # 같은 단면이 반복되어 단면 묶음을 쓴다
+    base = RCSectionBatch.from_rows(30, 400, STANDARDS[0], rows).analyze()
+    for std in STANDARDS:
+        shared = base.with_standard(std, phi_f=0.7, phi_v=0.75).analyze().get_summary_results()
+        fresh = RCSectionBatch.from_rows(30, 400, std, rows, phi_f=0.7, phi_v=0.75).analyze().get_summary_results()
+        assert shared == fresh, std
+    assert base.get_summary_results() == RCSectionBatch.from_rows(30, 400, STANDARDS[0], rows).analyze() \
+        .get_summary_results()
+
+
+def test_compare_table():
+    print("--- Testing the side-by-side comparison table ---")
+    rnd = random.Random(17)
+    rows = [dict(random_row(rnd), id=i, name=f"S{i}") for i in range(2000)]
+    start = time.perf_counter()
+    table = compare_standards(35, 400, None, rows)
+    elapsed = time.perf_counter() - start
+    assert table["standards"] == STANDARDS and len(table["rows"]) == len(rows)
+
+    for std in STANDARDS:
+        phi_f, phi_v = COMPARE_FACTORS[get_standard(std).get_concrete_method()]
+        expected = RCSectionBatch.from_rows(35, 400, std, rows, phi_f=phi_f, phi_v=phi_v).analyze()
+        summaries = expected.get_summary_results()
+        ng = 0
+        for i, (entry, summary) in enumerate(zip(table["rows"], summaries)):
+            result = entry["results"][std]
+            assert result["Mr_rate"] == summary["Mr_rate"] and result["Vn_rate"] == summary["Vn_rate"]
+            assert result["flexure"] == (expected.Mr_rate[i] >= 1.0)
+            assert result["crack"] == (summary["crack_status"] == "OK")
+            assert result["rebar"] == (summary["min_rebar_ok"] and summary["max_rebar_ok"])
+            assert result["ok"] == all(result[c] for c in ("flexure", "shear", "crack", "rebar"))
+            ng += not result["ok"]
+        assert table["summary"][std]["ng"] == ng
+
+    first = STANDARDS[0]
+    for entry in table["rows"]:
+        assert entry["changed"] == any(r["ok"] != entry["results"][first]["ok"] for r in entry["results"].values())
+    assert table["summary"][first]["changed"] == 0
+    print(f"{len(rows)} rows x {len(STANDARDS)} standards in {elapsed:.2f}s, "
+          f"{sum(e['changed'] for e in table['rows'])} rows change verdict")
+
+
+def test_compare_mode():
+    print("--- Testing compare mode ---")
+    row = {"id": 1, "name": "StandardTest", "Mu": 1000, "Vu": 50, "Ms": 80, "H": 800, "B": 1000, "Dc": 80,
+           "as_dia": 25, "as_num": 8, "av_dia": 16, "av_leg": 2, "av_space": 400}
+    request = {"mode": "compare", "material": {"fck": 35, "fy": 400}, "rows": [row],
+               "standards": [STANDARDS[0], STANDARDS[4]], "factors": {STANDARDS[4]: {"phi_f": 0.6}}}
+    result = handle_request(request)
+    assert result["standards"] == [STANDARDS[0], STANDARDS[4]]
+    lsd = RCSectionBatch.from_rows(35, 400, STANDARDS[4], [row], phi_f=0.6, phi_v=0.9).analyze()
+    assert result["rows"][0]["results"][STANDARDS[4]]["Mr_rate"] == round(float(lsd.Mr_rate[0]), 3)
+    assert result["rows"][0]["name"] == "StandardTest"
+
+
+if __name__ == "__main__":
+    test_with_standard_matches_fresh_batch()
+    test_compare_table()
+    test_compare_mode()
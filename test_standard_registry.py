@@ -0,0 +1,40 @@
+import sys
+import os
+
+sys.path.append(os.path.abspath('scripts'))
+
+from standards import get_standard, LSD2012
+
+
+def test_standard_registry():
+    print("--- Testing memoized standard registry ---")
+    lsd = get_standard("한계상태설계법(도로교 설계기준, 2012)")
+    assert lsd is get_standard("LSD 2012")
+    assert get_standard("강도설계법(도로교 설계기준, 2010)") is get_standard("")
+    assert type(get_standard("콘크리트설계기준(KCI/KDS)")).__name__ == "KCI2017"
+
+    try:
+        lsd.fck_list = [0]
+        raise AssertionError("shared standard instance must be read-only")
+    except AttributeError as e:
+        print(f"read-only: {e}")
+
+
+def test_lsd2012_factor_tables():
+    print("--- Testing LSD2012 precomputed factor tables ---")
+    from scipy import interpolate
+    f_alpha = interpolate.interp1d(LSD2012.fck_list, LSD2012.alpha_list)
+    f_beta = interpolate.interp1d(LSD2012.fck_list, LSD2012.beta_list)
+
+    std = get_standard("한계상태설계법(도로교 설계기준, 2012)")
+    for f_ck in [40.5, 45, 50, 55.5, 60, 64.2, 70, 77.7, 80, 89.9]:
+        alpha, beta = std.get_flexure_factors(f_ck)
+        assert alpha == float(f_alpha(f_ck)) and beta == float(f_beta(f_ck)), f_ck
+    assert std.get_flexure_factors(30) == (0.8, 0.4)
+    assert std.get_flexure_factors(95) == (0.59, 0.35)
+    assert abs(std.get_eta(55) - 0.96) < 1e-12
+
+
+if __name__ == "__main__":
+    test_standard_registry()
+    test_lsd2012_factor_tables()
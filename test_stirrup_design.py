@@ -0,0 +1,56 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.abspath('scripts'))
+
+from rc_beam_calc import handle_request
+from core.rc_section_analyzer import RCSectionAnalyzer
+from core.stirrup_design import design_stirrups, SPACING_INCREMENT, STIRRUP_MIN_SPACING
+from test_rc_section_batch import STANDARDS, random_row
+
+
+def vn_rate(std, row, **stirrups):
+    data = dict(row, **stirrups)
+    analyzer = RCSectionAnalyzer(35, 400, std, row["H"], row["B"], data, data, phi_v=0.8).analyze()
+    return analyzer.Vn_rate
+
+
+def test_stirrups_meet_checks():
+    print("--- Testing designed stirrups with the scalar analyzer ---")
+    rnd = random.Random(23)
+    for std in STANDARDS:
+        rows = [dict(random_row(rnd), num1=rnd.randint(2, 10)) for _ in range(40)]
+        designs = design_stirrups(35, 400, std, rows, phi_v=0.8)
+        for row, design in zip(rows, designs):
+            if not design["ok"]:
+                continue
+            dia, leg, space = design["av_dia"], design["av_leg"], design["av_space"]
+            assert vn_rate(std, row, av_dia=dia, av_leg=leg, av_space=space) >= 1.0
+            assert design["result"]["Vn_rate"] >= 1.0
+            assert space <= design["s_max"] and space % SPACING_INCREMENT == 0
+            # 한 단계 넓은 간격은 강도 또는 최대 간격을 만족하지 못한다
+            wider = space + SPACING_INCREMENT
+            assert wider > design["s_max"] or vn_rate(std, row, av_dia=dia, av_leg=leg, av_space=wider) < 1.0
+            # 다리 수를 하나 줄이면 최소 간격으로도 강도가 부족하다
+            if leg > 2:
+                assert vn_rate(std, row, av_dia=dia, av_leg=leg - 1, av_space=STIRRUP_MIN_SPACING) < 1.0
+        reasons = [d.get("reason") for d in designs]
+        print(f"[{std}] {reasons.count(None)} designed, {reasons.count('section')} section NG, "
+              f"{reasons.count('legs')} need more legs")
+
+
+def test_section_limit_and_mode():
+    print("--- Testing section limits and the design_stirrups mode ---")
+    row = {"H": 800, "B": 400, "dc1": 80, "dia1": 25, "num1": 6, "Mu": 300, "av_dia": 13}
+    request = {"mode": "design_stirrups", "design_standard": "콘크리트설계기준(KCI/KDS)",
+               "rows": [dict(row, Vu=50), dict(row, Vu=900), dict(row, Vu=5000)], "av_dias": [10, 13, 16]}
+    low, mid, high = handle_request(request)
+    assert low["ok"] and low["av_leg"] == 2 and low["Vs_req"] == 0
+    assert mid["ok"] and mid["av_dia"] in (10, 13, 16) and mid["result"]["Vn_rate"] >= 1.0
+    assert not high["ok"] and high["reason"] == "section"
+
+
+if __name__ == "__main__":
+    test_stirrups_meet_checks()
+    test_section_limit_and_mode()
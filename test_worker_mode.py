@@ -0,0 +1,62 @@
+import sys
+import os
+import json
+import subprocess
+
+SCRIPT = os.path.abspath(os.path.join('scripts', 'rc_beam_calc.py'))
+
+material = {"fck": 35, "fy": 400}
+row = {"id": 1, "name": "WorkerTest", "Mu": 500, "Vu": 200, "Ms": 300, "H": 800, "B": 1000,
+       "dc1": 80, "dia1": 25, "num1": 6, "av_dia": 13, "av_leg": 2, "av_space": 200, "crack_case": "일반환경"}
+
+
+def run_once(input_data):
+    process = subprocess.run([sys.executable, SCRIPT], input=json.dumps(input_data, ensure_ascii=False),
+                             capture_output=True, text=True, encoding='utf-8')
+    return json.loads(process.stdout)
+
+
+def test_worker_mode():
+    print("--- Testing persistent worker mode ---")
+    requests = [
+        {"id": 1, "mode": "calc", "material": material, "rows": [row, row]},
+        {"id": "r2", "mode": "report", "material": material, "rows": [row],
+         "design_standard": "한계상태설계법(도로교 설계기준, 2015)"},
+        {"id": 3, "mode": "calc", "material": material, "rows": [{"H": "abc"}]},
+    ]
+    payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in requests)
+    process = subprocess.run([sys.executable, SCRIPT, "--worker"], input=payload,
+                             capture_output=True, text=True, encoding='utf-8')
+    responses = [json.loads(line) for line in process.stdout.splitlines() if line.strip()]
+
+    assert [r["id"] for r in responses] == [1, "r2", 3]
+    assert responses[0]["ok"] and responses[1]["ok"]
+    assert not responses[2]["ok"] and responses[2]["error"]
+
+    # Worker answers must match the one-shot CLI output
+    one_shot = run_once({"mode": "calc", "material": material, "rows": [row, row]})
+    assert responses[0]["result"] == one_shot
+    print(f"calc result: {responses[0]['result'][0]}")
+    assert "한계상태설계법(도로교 설계기준, 2015)" in responses[1]["result"]["total"]
+
+
+def test_worker_rejects_out_fd():
+    print("--- Testing that worker requests cannot name a file descriptor ---")
+    requests = [
+        {"id": 1, "mode": "export", "material": material, "rows": [row], "out_fd": 1},
+        {"id": 2, "mode": "report", "material": material, "rows": [row], "format": "zip", "out_fd": 0},
+        {"id": 3, "mode": "calc", "material": material, "rows": [row]},
+    ]
+    payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in requests)
+    process = subprocess.run([sys.executable, SCRIPT, "--worker"], input=payload.encode("utf-8"), capture_output=True)
+    assert b"PK\x03\x04" not in process.stdout
+    responses = [json.loads(line) for line in process.stdout.decode("utf-8").splitlines()]
+    assert [r["id"] for r in responses] == [1, 2, 3]
+    assert not responses[0]["ok"] and "out_fd" in responses[0]["error"]
+    assert not responses[1]["ok"] and "out_fd" in responses[1]["error"]
+    assert responses[2]["ok"]
+
+
+if __name__ == "__main__":
+    test_worker_mode()
+    test_worker_rejects_out_fd()